@@ -1,7 +1,7 @@
 # ClawBack - OpenClaw Skill Makefile
 # Usage: make help
 
-.PHONY: help install setup test clean bump-patch bump-minor bump-major release publish lint lint-fix
+.PHONY: help install setup test bench clean bump-patch bump-minor bump-major release publish lint lint-fix
 
 # Default registry (use www to avoid redirect issues)
 CLAWHUB_REGISTRY ?= https://www.clawhub.ai
@@ -63,6 +63,10 @@ test: ## Run tests (if any)
 	@echo "$(CYAN)Running tests...$(NC)"
 	python3 -m pytest tests/ -v 2>/dev/null || echo "$(YELLOW)No tests found$(NC)"
 
+bench: ## Run backtest benchmarks (appends to data/benchmarks/results.jsonl)
+	@echo "$(CYAN)Running backtest benchmarks...$(NC)"
+	python3 -m clawback.benchmarks
+
 lint: ## Run linter (ruff)
 	@echo "$(CYAN)Running linter...$(NC)"
 	@ruff check src/clawback/ || (echo "$(RED)Linting failed! Fix errors before release.$(NC)" && exit 1)
@@ -0,0 +1,564 @@
+"""
+Vectorized backtest engine
+Columnar trade table and flat price index so strategy filters, price lookups,
+capital and drawdown are computed with NumPy array operations instead of a
+per-trade Python loop
+"""
+import hashlib
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .trading_calendar import TradingCalendar, nyse_calendar
+
+logger = logging.getLogger(__name__)
+
+# Session ordinals are offset by ticker_code * TICKER_STRIDE so every ticker's price
+# history lives in one sorted array and a single searchsorted resolves all lookups
+TICKER_STRIDE = 1_000_000
+
+
+# Day value for a missing or unparseable date in parsed columns
+NO_DAY = np.iinfo(np.int64).min
+
+
+def to_day(value: datetime) -> int:
+    """Days since 1970-01-01 for a datetime"""
+    return int(np.datetime64(value.date(), 'D').astype(np.int64))
+
+
+def from_day(day: int) -> datetime:
+    """Midnight datetime for a day number"""
+    return datetime(1970, 1, 1) + timedelta(days=int(day))
+
+
+def parse_days(values: List[str], formats: Tuple[str, ...]) -> np.ndarray:
+    """
+    Day numbers for date strings, trying each format in turn; NO_DAY where
+    empty or unparseable. Each distinct string is parsed once.
+    """
+    parsed: Dict[str, int] = {}
+    for value in set(values):
+        parsed[value] = NO_DAY
+        for fmt in formats:
+            try:
+                parsed[value] = to_day(datetime.strptime(value, fmt))
+                break
+            except (TypeError, ValueError):
+                continue
+    return np.array([parsed[value] for value in values], dtype=np.int64)
+
+
+def _categorical(values: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """(codes, categories) with categories in first-appearance order"""
+    codes: Dict[str, int] = {}
+    column = np.array([codes.setdefault(value, len(codes)) for value in values], dtype=np.int64)
+    return column, list(codes)
+
+
+class TradeTable:
+    """
+    Congressional trades as parallel NumPy columns, sorted by disclosure date
+
+    Dates are day numbers, tickers, representatives and chambers are codes into
+    their category lists, and the leader / committee-chair flags are evaluated
+    once per distinct representative.
+    """
+
+    def __init__(self, disclosure_day: np.ndarray, ticker_code: np.ndarray, rep_code: np.ndarray,
+                 is_purchase: np.ndarray, amount: np.ndarray, is_leader: np.ndarray,
+                 tickers: List[str], representatives: List[str],
+                 transaction_day: Optional[np.ndarray] = None, is_chair: Optional[np.ndarray] = None,
+                 chamber_code: Optional[np.ndarray] = None, chambers: Optional[List[str]] = None):
+        self.disclosure_day = disclosure_day
+        self.ticker_code = ticker_code
+        self.rep_code = rep_code
+        self.is_purchase = is_purchase
+        self.amount = amount
+        self.is_leader = is_leader
+        self.tickers = tickers
+        self.representatives = representatives
+        self.transaction_day = disclosure_day if transaction_day is None else transaction_day
+        self.is_chair = np.zeros(len(disclosure_day), dtype=bool) if is_chair is None else is_chair
+        self.chamber_code = np.zeros(len(disclosure_day), dtype=np.int64) if chamber_code is None else chamber_code
+        self.chambers = chambers or ['house']
+
+    # Array columns, in save() / load() order
+    COLUMNS = ('disclosure_day', 'ticker_code', 'rep_code', 'is_purchase', 'amount', 'is_leader',
+               'transaction_day', 'is_chair', 'chamber_code')
+
+    def __len__(self):
+        return len(self.disclosure_day)
+
+    def save(self, path: str):
+        """Write the table to an uncompressed .npz (atomically)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez(tmp_path, **{column: getattr(self, column) for column in self.COLUMNS},
+                 tickers=np.array(self.tickers, dtype=str),
+                 representatives=np.array(self.representatives, dtype=str),
+                 chambers=np.array(self.chambers, dtype=str))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'TradeTable':
+        """Read a table written by save()"""
+        with np.load(path) as data:
+            return cls(**{column: data[column] for column in cls.COLUMNS},
+                       tickers=data['tickers'].tolist(),
+                       representatives=data['representatives'].tolist(),
+                       chambers=data['chambers'].tolist())
+
+    @classmethod
+    def from_columns(cls, ticker: List[str], transaction_type: List[str], transaction_day: np.ndarray,
+                     disclosure_day: np.ndarray, amount: np.ndarray, representative: List[str],
+                     chamber: List[str], leader_check: Callable[[str], bool],
+                     chair_check: Optional[Callable[[str], bool]] = None) -> 'TradeTable':
+        """Build from per-column values (day numbers for dates), sorting rows by disclosure date"""
+        order = np.argsort(disclosure_day, kind='stable')
+        ticker_code, tickers = _categorical(ticker)
+        rep_code, representatives = _categorical(representative)
+        chamber_code, chambers = _categorical(chamber)
+        leader_by_rep = np.array([leader_check(rep) for rep in representatives], dtype=bool)
+        chair_by_rep = np.array([chair_check(rep) if chair_check else False for rep in representatives],
+                                dtype=bool)
+        rep_code = rep_code[order]
+
+        return cls(
+            disclosure_day=np.asarray(disclosure_day, dtype=np.int64)[order],
+            ticker_code=ticker_code[order],
+            rep_code=rep_code,
+            is_purchase=np.array([t == 'purchase' for t in transaction_type], dtype=bool)[order],
+            amount=np.asarray(amount, dtype=np.float64)[order],
+            is_leader=leader_by_rep[rep_code] if len(rep_code) else np.zeros(0, dtype=bool),
+            tickers=tickers,
+            representatives=representatives,
+            transaction_day=np.asarray(transaction_day, dtype=np.int64)[order],
+            is_chair=chair_by_rep[rep_code] if len(rep_code) else np.zeros(0, dtype=bool),
+            chamber_code=chamber_code[order],
+            chambers=chambers,
+        )
+
+    @classmethod
+    def from_trades(cls, trades, leader_check: Callable[[str], bool],
+                    chair_check: Optional[Callable[[str], bool]] = None) -> 'TradeTable':
+        """Build from Trade objects; the flag checks run once per distinct representative"""
+        return cls.from_columns(
+            ticker=[t.ticker for t in trades],
+            transaction_type=[t.transaction_type for t in trades],
+            transaction_day=np.array([t.transaction_date.date() for t in trades],
+                                     dtype='datetime64[D]').astype(np.int64),
+            disclosure_day=np.array([t.disclosure_date.date() for t in trades],
+                                    dtype='datetime64[D]').astype(np.int64),
+            amount=np.array([t.amount for t in trades], dtype=np.float64),
+            representative=[t.representative for t in trades],
+            chamber=[t.chamber for t in trades],
+            leader_check=leader_check,
+            chair_check=chair_check,
+        )
+
+    def subset(self, rows: np.ndarray) -> 'TradeTable':
+        """Table of the selected rows (boolean mask or indexes), sharing category lists"""
+        return TradeTable(
+            disclosure_day=self.disclosure_day[rows],
+            ticker_code=self.ticker_code[rows],
+            rep_code=self.rep_code[rows],
+            is_purchase=self.is_purchase[rows],
+            amount=self.amount[rows],
+            is_leader=self.is_leader[rows],
+            tickers=self.tickers,
+            representatives=self.representatives,
+            transaction_day=self.transaction_day[rows],
+            is_chair=self.is_chair[rows],
+            chamber_code=self.chamber_code[rows],
+            chambers=self.chambers,
+        )
+
+    def representative_mask(self, substring: str) -> np.ndarray:
+        """Rows whose representative name contains substring (case-insensitive)"""
+        matches = np.array([substring.lower() in rep.lower() for rep in self.representatives], dtype=bool)
+        return matches[self.rep_code] if len(self.rep_code) else np.zeros(0, dtype=bool)
+
+    def present_tickers(self) -> List[str]:
+        """Tickers that occur in the table's rows"""
+        return [self.tickers[code] for code in np.unique(self.ticker_code).tolist()]
+
+    def records(self):
+        """Yield each row as (ticker, transaction_type, transaction_date, disclosure_date, amount,
+        representative, chamber) with datetimes"""
+        for ticker, purchase, tx_day, disc_day, amount, rep, chamber in zip(
+                self.ticker_code.tolist(), self.is_purchase.tolist(), self.transaction_day.tolist(),
+                self.disclosure_day.tolist(), self.amount.tolist(), self.rep_code.tolist(),
+                self.chamber_code.tolist()):
+            yield (self.tickers[ticker], 'purchase' if purchase else 'sale', from_day(tx_day),
+                   from_day(disc_day), amount, self.representatives[rep], self.chambers[chamber])
+
+    def mask(self, purchases_only: bool = True, min_trade_size: float = 0,
+             leaders_only: bool = False) -> np.ndarray:
+        """Boolean row mask for the standard strategy filters"""
+        mask = np.ones(len(self), dtype=bool)
+        if purchases_only:
+            mask &= self.is_purchase
+        if min_trade_size > 0:
+            mask &= self.amount >= min_trade_size
+        if leaders_only:
+            mask &= self.is_leader
+        return mask
+
+
+class PriceIndex:
+    """
+    Daily closes for many tickers in one sorted (ticker, session ordinal) key array
+
+    Days are mapped to trading-session ordinals from the NYSE calendar, so the
+    next session on or after any date is one index and rows dated on weekends
+    or holidays (bad vendor data) are dropped rather than matched.
+    """
+
+    def __init__(self, keys: np.ndarray, closes: np.ndarray, calendar: Optional[TradingCalendar] = None):
+        self.keys = keys
+        self.closes = closes
+        self.calendar = calendar or nyse_calendar()
+
+    @classmethod
+    def from_history(cls, price_history: Dict[str, Tuple[List[str], List[float]]],
+                     tickers: List[str], calendar: Optional[TradingCalendar] = None) -> 'PriceIndex':
+        """Build for the given ticker order (codes are list positions) from (dates, closes) series"""
+        calendar = calendar or nyse_calendar()
+        keys, closes = [], []
+        for code, ticker in enumerate(tickers):
+            series = price_history.get(ticker)
+            if not series or not series[0]:
+                continue
+            ordinals = calendar.session_ordinals(np.array(series[0], dtype='datetime64[D]').astype(np.int64))
+            on_session = ordinals >= 0
+            keys.append(ordinals[on_session] + code * TICKER_STRIDE)
+            closes.append(np.asarray(series[1], dtype=np.float64)[on_session])
+
+        if not keys:
+            return cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64), calendar)
+        return cls(np.concatenate(keys), np.concatenate(closes), calendar)
+
+    def session_days(self) -> np.ndarray:
+        """Every session day from the first to the last close in the index"""
+        if not len(self.keys):
+            return np.zeros(0, dtype=np.int64)
+        ordinals = self.keys % TICKER_STRIDE
+        return self.calendar.sessions[ordinals.min():ordinals.max() + 1]
+
+    def lookup(self, ticker_code: np.ndarray, day: np.ndarray, max_gap_days: int) -> np.ndarray:
+        """First close on or after each day (within max_gap_days) for each ticker; NaN if none"""
+        return self.match(ticker_code, day, max_gap_days)[0]
+
+    def match(self, ticker_code: np.ndarray, day: np.ndarray,
+              max_gap_days: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(close, session day) of lookup()'s match for each ticker and day; (NaN, NO_DAY) if none"""
+        ticker_code = np.asarray(ticker_code)
+        day = np.asarray(day)
+        if not len(self.keys):
+            return np.full(len(ticker_code), np.nan), np.full(len(ticker_code), NO_DAY)
+
+        targets = ticker_code * TICKER_STRIDE + self.calendar.ordinal_on_or_after(day)
+        idx = np.minimum(np.searchsorted(self.keys, targets, side='left'), len(self.keys) - 1)
+        found_key = self.keys[idx]
+        found = (found_key >= targets) & (found_key // TICKER_STRIDE == ticker_code)
+        # A session missing from the ticker's data (halt, gap) falls through to a later one
+        found_day = self.calendar.sessions[np.minimum(found_key % TICKER_STRIDE, len(self.calendar) - 1)]
+        found &= (found_day - day) <= max_gap_days
+        return np.where(found, self.closes[idx], np.nan), np.where(found, found_day, NO_DAY)
+
+    def last_day(self, ticker_code: np.ndarray) -> np.ndarray:
+        """Session day of each ticker's last close; NO_DAY for tickers without prices"""
+        ticker_code = np.asarray(ticker_code)
+        if not len(self.keys):
+            return np.full(len(ticker_code), NO_DAY)
+        idx = np.searchsorted(self.keys, (ticker_code + 1) * TICKER_STRIDE) - 1
+        last_key = self.keys[np.maximum(idx, 0)]
+        found = (idx >= 0) & (last_key // TICKER_STRIDE == ticker_code)
+        return np.where(found, self.calendar.sessions[last_key % TICKER_STRIDE], NO_DAY)
+
+
+def simulate(table: TradeTable, prices: PriceIndex, initial_capital: float,
+             entry_delay_days: int, holding_period_days: int, mask: np.ndarray,
+             position_size_pct: float, max_gap_days: int,
+             today: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Evaluate one strategy over the masked trades
+
+    Returns:
+        Dict of arrays for the trades that produced a return, in disclosure
+        order: rows (indexes into table), entry_day, returns, pnl, capital_after;
+        plus capital (final) and max_drawdown scalars.
+    """
+    today = to_day(datetime.now()) if today is None else today
+    rows = np.flatnonzero(mask)
+    entry_day = table.disclosure_day[rows] + entry_delay_days
+    keep = entry_day <= today
+    rows, entry_day = rows[keep], entry_day[keep]
+
+    codes = table.ticker_code[rows]
+    entry_price = prices.lookup(codes, entry_day, max_gap_days)
+    exit_price = prices.lookup(codes, entry_day + holding_period_days, max_gap_days)
+    priced = ~(np.isnan(entry_price) | np.isnan(exit_price))
+    rows, entry_day = rows[priced], entry_day[priced]
+    entry_price, exit_price = entry_price[priced], exit_price[priced]
+
+    # Sales are followed as a bet that the stock goes down
+    returns = np.where(table.is_purchase[rows], exit_price - entry_price, entry_price - exit_price) / entry_price
+    return compound(rows, entry_day, returns, initial_capital, position_size_pct)
+
+
+def compound(rows: np.ndarray, entry_day: np.ndarray, returns: np.ndarray, initial_capital: float,
+             position_size_pct: float) -> Dict[str, np.ndarray]:
+    """Apply per-trade returns in order to a fixed-fraction position size (see simulate())"""
+    growth = 1 + position_size_pct * returns
+    capital_after = initial_capital * np.cumprod(growth)
+    capital_before = np.concatenate(([initial_capital], capital_after[:-1]))
+    pnl = capital_before * position_size_pct * returns
+
+    peaks = np.maximum.accumulate(np.concatenate(([initial_capital], capital_after)))[1:]
+    max_drawdown = float(np.max((peaks - capital_after) / peaks)) if len(peaks) else 0.0
+
+    return {
+        'rows': rows,
+        'entry_day': entry_day,
+        'returns': returns,
+        'pnl': pnl,
+        'capital_after': capital_after,
+        'capital': float(capital_after[-1]) if len(capital_after) else initial_capital,
+        'max_drawdown': max_drawdown,
+    }
+
+
+class ForwardReturns:
+    """
+    Followed-direction return of every trade for each (entry delay, holding period)
+
+    A (trades x delays x horizons) tensor computed once per dataset, so a
+    strategy on any covered delay/horizon is a masked reduction over one slice
+    instead of fresh entry/exit price lookups. Unpriced cells are NaN.
+    """
+
+    # Cached tensors kept per cache_dir; the least recently used are evicted past this
+    CACHE_ENTRIES = 8
+
+    def __init__(self, returns: np.ndarray, delays: List[int], horizons: List[int],
+                 disclosure_day: np.ndarray):
+        self.returns = returns
+        self.delays = list(delays)
+        self.horizons = list(horizons)
+        self.disclosure_day = disclosure_day
+
+    @classmethod
+    def compute(cls, table: TradeTable, prices: PriceIndex, delays: List[int], horizons: List[int],
+                max_gap_days: int) -> 'ForwardReturns':
+        delays, horizons = sorted(set(delays)), sorted(set(horizons))
+        returns = np.full((len(table), len(delays), len(horizons)), np.nan)
+        sign = np.where(table.is_purchase, 1.0, -1.0)
+        for i, delay in enumerate(delays):
+            entry_day = table.disclosure_day + delay
+            entry_price = prices.lookup(table.ticker_code, entry_day, max_gap_days)
+            for j, horizon in enumerate(horizons):
+                exit_price = prices.lookup(table.ticker_code, entry_day + horizon, max_gap_days)
+                returns[:, i, j] = sign * (exit_price - entry_price) / entry_price
+        return cls(returns, delays, horizons, np.array(table.disclosure_day))
+
+    @classmethod
+    def cached(cls, table: TradeTable, prices: PriceIndex, delays: List[int], horizons: List[int],
+               max_gap_days: int, cache_dir: Optional[str]) -> 'ForwardReturns':
+        """compute(), reusing a .npz in cache_dir built from identical trades, prices and grid"""
+        if not cache_dir:
+            return cls.compute(table, prices, delays, horizons, max_gap_days)
+
+        delays, horizons = sorted(set(delays)), sorted(set(horizons))
+        digest = hashlib.sha1(repr((delays, horizons, max_gap_days)).encode())
+        for array in (table.disclosure_day, table.ticker_code, table.is_purchase, prices.keys, prices.closes):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        path = Path(cache_dir) / f"forward_{digest.hexdigest()[:16]}.npz"
+
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    forward = cls(data['returns'], data['delays'].tolist(), data['horizons'].tolist(),
+                                  data['disclosure_day'])
+                # Mark as recently used so pruning keeps it
+                os.utime(path)
+                logger.debug(f"Loaded forward returns from {path}")
+                return forward
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable forward-return cache {path}: {e}")
+
+        forward = cls.compute(table, prices, delays, horizons, max_gap_days)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez(tmp_path, returns=forward.returns, delays=np.array(delays),
+                 horizons=np.array(horizons), disclosure_day=forward.disclosure_day)
+        os.replace(tmp_path, path)
+        # Keep the most recently used tensors (e.g. both the compare and sweep grids), drop the rest
+        entries = sorted(path.parent.glob("forward_*.npz"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for stale in entries[cls.CACHE_ENTRIES:]:
+            stale.unlink(missing_ok=True)
+        return forward
+
+    def covers(self, delay: int, horizon: int) -> bool:
+        return delay in self.delays and horizon in self.horizons
+
+    def evaluate(self, delay: int, horizon: int, mask: np.ndarray, initial_capital: float,
+                 position_size_pct: float, today: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Same result as simulate() for a covered delay/horizon"""
+        today = to_day(datetime.now()) if today is None else today
+        returns = self.returns[:, self.delays.index(delay), self.horizons.index(horizon)]
+        entry_day = self.disclosure_day + delay
+        rows = np.flatnonzero(mask & (entry_day <= today) & ~np.isnan(returns))
+        return compound(rows, entry_day[rows], returns[rows], initial_capital, position_size_pct)
+
+
+def fingerprints(table: TradeTable) -> np.ndarray:
+    """
+    Stable 64-bit hash of each row's contents (ticker, direction, dates, amount,
+    representative, chamber), so a trade keeps its identity across loads,
+    orderings and category codings of the same data
+    """
+    def string_hashes(values: List[str]) -> np.ndarray:
+        return np.array([int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), 'little')
+                         for value in values], dtype=np.uint64)
+
+    columns = (
+        string_hashes(table.tickers)[table.ticker_code],
+        string_hashes(table.representatives)[table.rep_code],
+        string_hashes(table.chambers)[table.chamber_code],
+        np.asarray(table.is_purchase, dtype=np.uint64),
+        np.asarray(table.transaction_day, dtype=np.int64).view(np.uint64),
+        np.asarray(table.disclosure_day, dtype=np.int64).view(np.uint64),
+        np.asarray(table.amount, dtype=np.float64).view(np.uint64),
+    )
+    digest = np.zeros(len(table), dtype=np.uint64)
+    for column in columns:
+        digest = _mix64(digest ^ column)
+    return digest
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer (wrapping uint64 arithmetic)"""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+class TradeResults:
+    """
+    Stored followed-direction returns of individual trades for one entry delay,
+    holding period and price gap, keyed by trade fingerprint
+
+    Only results that can no longer change are stored: trades whose matched exit
+    session is before today, and trades whose ticker has closes after their exit
+    window but none in it (stored as NaN). Everything else is re-evaluated next run.
+    """
+
+    def __init__(self, fingerprint: np.ndarray, returns: np.ndarray, path: Optional[Path] = None):
+        self.fingerprint = fingerprint
+        self.returns = returns
+        self.path = path
+
+    def __len__(self):
+        return len(self.fingerprint)
+
+    @classmethod
+    def load(cls, cache_dir: str, delay: int, horizon: int, max_gap_days: int) -> 'TradeResults':
+        """Results stored under cache_dir for this delay/horizon/gap (empty if none yet)"""
+        path = Path(cache_dir) / f"trades_{delay}d_{horizon}d_{max_gap_days}g.npz"
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    return cls(data['fingerprint'], data['returns'], path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable trade results {path}: {e}")
+        return cls(np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.float64), path)
+
+    def lookup(self, fingerprint: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(stored mask, returns with NaN where not stored) for each fingerprint"""
+        if not len(self.fingerprint):
+            return np.zeros(len(fingerprint), dtype=bool), np.full(len(fingerprint), np.nan)
+        idx = np.minimum(np.searchsorted(self.fingerprint, fingerprint), len(self.fingerprint) - 1)
+        known = self.fingerprint[idx] == fingerprint
+        return known, np.where(known, self.returns[idx], np.nan)
+
+    def add(self, fingerprint: np.ndarray, returns: np.ndarray):
+        """Merge new results (replacing any stored for the same fingerprints) and save"""
+        if not len(fingerprint):
+            return
+        merged, first = np.unique(np.concatenate((fingerprint, self.fingerprint)), return_index=True)
+        self.fingerprint = merged
+        self.returns = np.concatenate((returns, self.returns))[first]
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp.npz')
+            np.savez(tmp_path, fingerprint=self.fingerprint, returns=self.returns)
+            os.replace(tmp_path, self.path)
+
+
+def summarize(returns: np.ndarray, capital: float, initial_capital: float, max_drawdown: float,
+              holding_period_days: int) -> Dict[str, float]:
+    """Summary statistics for a strategy's per-trade returns, keyed by BacktestResult field"""
+    if not len(returns):
+        return {
+            'total_trades': 0, 'winning_trades': 0, 'losing_trades': 0,
+            'total_return': 0, 'avg_return_per_trade': 0, 'max_drawdown': 0,
+            'sharpe_ratio': 0, 'win_rate': 0, 'avg_holding_days': holding_period_days,
+            'best_trade': 0, 'worst_trade': 0,
+        }
+
+    winning = int(np.count_nonzero(returns > 0))
+    avg_return = float(returns.mean())
+
+    # Simplified Sharpe (assuming risk-free rate of 0)
+    sharpe = 0
+    if len(returns) > 1:
+        std_dev = float(returns.std(ddof=1))
+        if std_dev > 0:
+            sharpe = (avg_return / std_dev) * (252 / holding_period_days) ** 0.5
+
+    return {
+        'total_trades': len(returns),
+        'winning_trades': winning,
+        'losing_trades': len(returns) - winning,
+        'total_return': (capital - initial_capital) / initial_capital,
+        'avg_return_per_trade': avg_return,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe,
+        'win_rate': winning / len(returns),
+        'avg_holding_days': holding_period_days,
+        'best_trade': float(returns.max()),
+        'worst_trade': float(returns.min()),
+    }
+
+
+def relative_metrics(returns: np.ndarray, benchmark_returns: np.ndarray,
+                     periods_per_year: float) -> Dict[str, float]:
+    """
+    Beta, annualized alpha, information ratio and Sortino ratio from aligned
+    per-period strategy and benchmark returns, keyed by BacktestResult field
+    (risk-free rate of 0, as for the Sharpe ratio)
+    """
+    if len(returns) < 2:
+        return {}
+
+    excess = returns - benchmark_returns
+    benchmark_variance = float(benchmark_returns.var(ddof=1))
+    beta = float(np.cov(returns, benchmark_returns, ddof=1)[0, 1]) / benchmark_variance \
+        if benchmark_variance > 0 else 0.0
+    tracking_error = float(excess.std(ddof=1))
+    downside = float(np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2)))
+    scale = periods_per_year ** 0.5
+
+    return {
+        'beta': beta,
+        'alpha': float(returns.mean() - beta * benchmark_returns.mean()) * periods_per_year,
+        'information_ratio': float(excess.mean()) / tracking_error * scale if tracking_error > 0 else 0.0,
+        'sortino_ratio': float(returns.mean()) / downside * scale if downside > 0 else 0.0,
+    }
@@ -2,23 +2,45 @@
 Backtesting engine for congressional trading strategies
 Tests various entry timing, position sizing, and filtering strategies
 """
+import hashlib
 import logging
 import time
+from bisect import bisect_left
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import requests
 
+from .backtest_engine import (
+    NO_DAY,
+    ForwardReturns,
+    PriceIndex,
+    TradeResults,
+    TradeTable,
+    fingerprints,
+    from_day,
+    parse_days,
+    relative_metrics,
+    simulate,
+    summarize,
+    to_day,
+)
+from .portfolio_sim import simulate_portfolio
+from .price_providers import HAS_YFINANCE, PriceProvider, YFinanceProvider, config_digest, get_price_provider
+from .price_store import PriceStore
+from .trading_calendar import nyse_calendar
+
 logger = logging.getLogger(__name__)
 
-# Try to import yfinance for historical prices
-try:
-    import yfinance as yf
-    HAS_YFINANCE = True
-except ImportError:
-    HAS_YFINANCE = False
-    logger.warning("yfinance not installed - run: pip install yfinance")
+
+def _session_closes(dates: List[str], closes: List[float]) -> tuple:
+    """(dates, closes) without rows dated off an NYSE session, the rows PriceIndex drops"""
+    on_session = nyse_calendar().is_session(np.array(dates, dtype='datetime64[D]').astype(np.int64))
+    return ([day for day, keep in zip(dates, on_session) if keep],
+            [close for close, keep in zip(closes, on_session) if keep])
 
 
 @dataclass
@@ -35,6 +57,10 @@ class Trade:
     committee_relevant: bool = False
 
 
+# Trades as Trade objects or as a columnar TradeTable (see load_trade_table_from_db)
+Trades = Union[List[Trade], TradeTable]
+
+
 @dataclass
 class BacktestResult:
     """Results from a backtest run"""
@@ -51,6 +77,18 @@ class BacktestResult:
     best_trade: float
     worst_trade: float
     trades_detail: List[Dict]
+    # Daily ('YYYY-MM-DD', equity) pairs, from the event-driven simulator only
+    equity_curve: Optional[List[tuple]] = None
+    # Relative to the benchmark index (None without benchmark prices); excess_return is
+    # total_return minus benchmark_return, the benchmark held over the equity curve's span
+    # (event-driven) or bought in place of each trade with the same sizing (run_strategy)
+    benchmark: Optional[str] = None
+    benchmark_return: Optional[float] = None
+    excess_return: Optional[float] = None
+    beta: Optional[float] = None
+    alpha: Optional[float] = None
+    information_ratio: Optional[float] = None
+    sortino_ratio: Optional[float] = None
 
 
 class CongressionalBacktester:
@@ -68,46 +106,149 @@ class CongressionalBacktester:
         'collins', 'capito', 'cassidy', 'tuberville', 'cruz'
     ]
 
-    def __init__(self, initial_capital: float = 50000):
+    # How far past the target date a lookup may roll forward to find a trading day
+    MAX_PRICE_GAP_DAYS = 5
+
+    # Where precomputed forward-return tensors are cached (None keeps them in memory only)
+    FORWARD_CACHE_DIR = "data/backtest_cache"
+
+    # Where incremental runs keep per-trade results (one directory per price source)
+    TRADE_RESULTS_DIR = "data/backtest_cache/trade_results"
+
+    # Index that results are measured against for alpha, beta and the other relative metrics
+    BENCHMARK_TICKER = 'SPY'
+
+    def __init__(self, initial_capital: float = 50000, price_store: Optional[PriceStore] = None,
+                 price_provider: Optional[PriceProvider] = None, vectorized: bool = True,
+                 incremental: bool = False, benchmark: Optional[str] = BENCHMARK_TICKER):
         self.initial_capital = initial_capital
+        self.vectorized = vectorized
+        # Vectorized run_strategy() reuses per-trade results stored by earlier runs
+        self.incremental = incremental
+        # Benchmark ticker (None skips the benchmark-relative metrics)
+        self.benchmark = benchmark
+        self._benchmark_index: Optional[tuple] = None
+        self.price_store = price_store
+        if price_provider is None and HAS_YFINANCE:
+            price_provider = YFinanceProvider()
+        self.price_provider = price_provider
         self.price_cache = {}
+        # ticker -> (sorted 'YYYY-MM-DD' dates, closes), filled by load_price_history()
+        self.price_history: Dict[str, tuple] = {}
+        self._history_range: Optional[tuple] = None
+        self._history_version = 0
+        # Cached columnar inputs for the vectorized engine
+        self._trade_table = None
+        self._price_index = None
+        self._forward_returns = None
+
+    def load_price_history(self, trades: Trades, max_entry_delay_days: int = 0,
+                           max_holding_days: int = 90) -> int:
+        """
+        Fetch full daily close history for every ticker in `trades` up front
+
+        One batched provider request covers the whole span from the earliest
+        disclosure to the latest possible exit, so later price lookups are
+        in-memory instead of one request per entry/exit. With a price store,
+        only the date ranges it doesn't already hold are fetched, and
+        everything is then read back from the store.
+
+        Returns:
+            Number of tickers with price history loaded
+        """
+        if not trades or not (self.price_provider or self.price_store):
+            return 0
+
+        if isinstance(trades, TradeTable):
+            first, last = from_day(trades.disclosure_day.min()), from_day(trades.disclosure_day.max())
+            tickers = set(trades.present_tickers())
+        else:
+            first, last = min(t.disclosure_date for t in trades), max(t.disclosure_date for t in trades)
+            tickers = {t.ticker for t in trades}
+        start = first
+        end = last + timedelta(days=max_entry_delay_days + max_holding_days + self.MAX_PRICE_GAP_DAYS)
+        end = min(end, datetime.now())
+
+        if self._history_range and self._history_range[0] <= start and end <= self._history_range[1]:
+            tickers -= set(self.price_history)
+        elif self._history_range:
+            # Loaded series are too short for this span, so reload everything over the union
+            start, end = min(start, self._history_range[0]), max(end, self._history_range[1])
+            tickers |= set(self.price_history)
+        tickers = sorted(tickers)
+        if not tickers:
+            return len(self.price_history)
+        self._history_range = (start, end)
+        self._history_version += 1
+
+        if self.price_store is None:
+            for ticker, rows in self.price_provider.fetch_history(tickers, start, end).items():
+                if rows:
+                    self.price_history[ticker] = ([row[0] for row in rows], [row[4] for row in rows])
+        else:
+            self._refresh_price_store(tickers, start, end)
+            self.price_history.update(self.price_store.get_all_closes(tickers))
+        for ticker in tickers:
+            if ticker in self.price_history:
+                self.price_history[ticker] = _session_closes(*self.price_history[ticker])
+
+        logger.info(f"Loaded price history for {len(self.price_history)}/{len(tickers)} tickers "
+                    f"({start.date()} to {end.date()})")
+        return len(self.price_history)
+
+    def _refresh_price_store(self, tickers: List[str], start: datetime, end: datetime):
+        """Fetch only the date ranges the price store is missing, batching tickers with the same gap"""
+        gaps = defaultdict(list)
+        for ticker in tickers:
+            for gap in self.price_store.missing_ranges(ticker, start, end):
+                gaps[gap].append(ticker)
+        if not gaps:
+            return
+        if self.price_provider is None:
+            logger.warning(f"Price store is missing {sum(len(t) for t in gaps.values())} "
+                           f"ticker ranges and no price provider is available")
+            return
+
+        for (gap_start, gap_end), gap_tickers in gaps.items():
+            for ticker, rows in self.price_provider.fetch_history(gap_tickers, gap_start, gap_end).items():
+                self.price_store.save(ticker, rows, gap_start, gap_end)
+
+    def _lookup_price(self, ticker: str, target_date: datetime) -> Optional[float]:
+        """First close on or after target_date from loaded history (within MAX_PRICE_GAP_DAYS)"""
+        dates, closes = self.price_history[ticker]
+        # Loaded rows are all NYSE sessions, so this is the next session with a close
+        i = bisect_left(dates, target_date.strftime('%Y-%m-%d'))
+        if i == len(dates):
+            return None
+        limit = (target_date + timedelta(days=self.MAX_PRICE_GAP_DAYS)).strftime('%Y-%m-%d')
+        return closes[i] if dates[i] <= limit else None
 
     def get_historical_price(self, ticker: str, date: datetime, days_forward: int = 0) -> Optional[float]:
-        """Get historical stock price using yfinance"""
-        if not HAS_YFINANCE:
+        """Get historical stock price (from loaded history, else a small provider request)"""
+        target_date = date + timedelta(days=days_forward)
+        if ticker in self.price_history:
+            return self._lookup_price(ticker, target_date)
+
+        if self.price_provider is None:
             return None
 
-        cache_key = f"{ticker}_{date.strftime('%Y-%m-%d')}_{days_forward}"
+        cache_key = f"{ticker}_{target_date.strftime('%Y-%m-%d')}"
         if cache_key in self.price_cache:
             return self.price_cache[cache_key]
 
         try:
-            target_date = date + timedelta(days=days_forward)
-            start = target_date - timedelta(days=5)
-            end = target_date + timedelta(days=5)
-
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start.strftime('%Y-%m-%d'),
-                                end=end.strftime('%Y-%m-%d'))
-
-            if hist.empty:
-                return None
-
-            # Find closest trading day
-            target_str = target_date.strftime('%Y-%m-%d')
-            if target_str in hist.index.strftime('%Y-%m-%d').tolist():
-                price = hist.loc[target_str]['Close']
-            else:
-                # Get the first available price after target
-                price = hist['Close'].iloc[0]
-
-            self.price_cache[cache_key] = float(price)
-            return float(price)
-
+            rows = self.price_provider.fetch_history(
+                [ticker], target_date, target_date + timedelta(days=self.MAX_PRICE_GAP_DAYS)).get(ticker)
+            closes = _session_closes([row[0] for row in rows], [row[4] for row in rows])[1] if rows else []
+            price = closes[0] if closes else None
         except Exception as e:
             logger.debug(f"Error getting price for {ticker}: {e}")
             return None
 
+        if price is not None:
+            self.price_cache[cache_key] = price
+        return price
+
     def calculate_return(self, ticker: str, entry_date: datetime,
                         exit_days: int, is_purchase: bool) -> Optional[float]:
         """Calculate return for a trade"""
@@ -133,7 +274,7 @@ class CongressionalBacktester:
         rep_lower = representative.lower()
         return any(chair in rep_lower for chair in self.COMMITTEE_CHAIRS)
 
-    def run_strategy(self, trades: List[Trade], strategy_name: str,
+    def run_strategy(self, trades: Trades, strategy_name: str,
                     entry_delay_days: int = 0,
                     holding_period_days: int = 45,
                     min_trade_size: float = 0,
@@ -155,6 +296,256 @@ class CongressionalBacktester:
             max_positions: Maximum concurrent positions
             position_size_pct: Position size as % of portfolio
         """
+        if self.vectorized:
+            return self._run_strategy_vectorized(
+                trades, strategy_name, entry_delay_days, holding_period_days,
+                min_trade_size, leaders_only, purchases_only, position_size_pct)
+        return self._run_strategy_loop(
+            trades, strategy_name, entry_delay_days, holding_period_days,
+            min_trade_size, leaders_only, purchases_only, max_positions, position_size_pct)
+
+    def _run_strategy_vectorized(self, trades, strategy_name, entry_delay_days, holding_period_days,
+                                 min_trade_size, leaders_only, purchases_only,
+                                 position_size_pct) -> BacktestResult:
+        """run_strategy() over a columnar trade table with array price lookups"""
+        table = self.trade_table(trades)
+        mask = table.mask(purchases_only, min_trade_size, leaders_only)
+        forward = self._forward_returns
+        if forward and forward[0] is table and forward[1].covers(entry_delay_days, holding_period_days):
+            sim = forward[1].evaluate(entry_delay_days, holding_period_days, mask,
+                                      self.initial_capital, position_size_pct)
+        elif self.incremental:
+            sim = self.incremental_returns(trades, entry_delay_days, holding_period_days).evaluate(
+                entry_delay_days, holding_period_days, mask, self.initial_capital, position_size_pct)
+        else:
+            self.load_price_history(trades, entry_delay_days, holding_period_days)
+            sim = simulate(
+                table, self.price_index(table), self.initial_capital,
+                entry_delay_days, holding_period_days, mask,
+                position_size_pct, self.MAX_PRICE_GAP_DAYS
+            )
+
+        rows = sim['rows']
+        entry_dates = np.datetime_as_string(sim['entry_day'].astype('datetime64[D]')).tolist()
+        results = [
+            {
+                'ticker': table.tickers[ticker],
+                'representative': table.representatives[rep],
+                'entry_date': entry_date,
+                'return': trade_return,
+                'pnl': pnl,
+                'capital_after': capital_after
+            }
+            for ticker, rep, entry_date, trade_return, pnl, capital_after in zip(
+                table.ticker_code[rows].tolist(), table.rep_code[rows].tolist(), entry_dates,
+                sim['returns'].tolist(), sim['pnl'].tolist(), sim['capital_after'].tolist())
+        ]
+        return self._build_result(strategy_name, results, sim['returns'], sim['capital'],
+                                  sim['max_drawdown'], holding_period_days, position_size_pct,
+                                  entry_day=sim['entry_day'])
+
+    def run_portfolio(self, trades: Trades, strategy_name: str,
+                      entry_delay_days: int = 0,
+                      holding_period_days: int = 45,
+                      min_trade_size: float = 0,
+                      leaders_only: bool = False,
+                      purchases_only: bool = True,
+                      max_positions: int = 20,
+                      position_size_pct: float = 0.05,
+                      stop_loss_pct: Optional[float] = None) -> BacktestResult:
+        """
+        Run a strategy through the event-driven portfolio simulator
+
+        Unlike run_strategy(), positions overlap in time: capital is tied up
+        while a position is open, entries beyond max_positions are skipped,
+        and the result carries a daily equity curve.
+
+        Args:
+            (as run_strategy)
+            stop_loss_pct: Exit at the next close once a position has lost this fraction
+        """
+        self.load_price_history(trades, entry_delay_days, holding_period_days)
+        table = self.trade_table(trades)
+        portfolio = simulate_portfolio(
+            table, self.price_index(table), self.initial_capital,
+            entry_delay_days, holding_period_days,
+            table.mask(purchases_only, min_trade_size, leaders_only),
+            max_positions=max_positions, position_size_pct=position_size_pct,
+            max_gap_days=self.MAX_PRICE_GAP_DAYS, stop_loss_pct=stop_loss_pct
+        )
+        if portfolio.skipped_max_positions:
+            logger.info(f"{strategy_name}: skipped {portfolio.skipped_max_positions} entries "
+                        f"at the {max_positions}-position limit")
+
+        result = self._build_result(strategy_name, portfolio.trades, portfolio.returns, portfolio.capital,
+                                    portfolio.max_drawdown, holding_period_days, position_size_pct,
+                                    equity_days=portfolio.equity_days, equity=portfolio.equity)
+        result.equity_curve = portfolio.equity_curve()
+        return result
+
+    def trade_table(self, trades: Trades) -> TradeTable:
+        """Columnar form of `trades`, reused while the same list is passed in"""
+        if isinstance(trades, TradeTable):
+            return trades
+        if self._trade_table is None or self._trade_table[0] is not trades \
+                or len(self._trade_table[1]) != len(trades):
+            table = TradeTable.from_trades(trades, self.is_leader, self.is_committee_chair)
+            self._trade_table = (trades, table)
+        return self._trade_table[1]
+
+    def precompute_forward_returns(self, trades: Trades, delays: List[int],
+                                   horizons: List[int]) -> ForwardReturns:
+        """
+        Build (or load from FORWARD_CACHE_DIR) the forward-return tensor for these
+        trades, so vectorized run_strategy() calls with any of the given entry
+        delays and holding periods skip price lookups entirely
+        """
+        self.load_price_history(trades, max(delays), max(horizons))
+        table = self.trade_table(trades)
+        forward = ForwardReturns.cached(table, self.price_index(table), delays, horizons,
+                                        self.MAX_PRICE_GAP_DAYS, self.FORWARD_CACHE_DIR)
+        self._forward_returns = (table, forward)
+        return forward
+
+    def incremental_returns(self, trades: Trades, entry_delay_days: int,
+                            holding_period_days: int) -> ForwardReturns:
+        """
+        Per-trade returns for one delay/holding period, evaluating only the trades
+        without a stored final result (new disclosures and positions that have
+        matured since the last run) and storing theirs
+
+        Prices are loaded only for those trades, so a refresh costs time in
+        proportion to new data rather than to the whole history.
+        """
+        table = self.trade_table(trades)
+        if self.price_provider is None and self.price_store is None:
+            # No price source to key stored results by, and nothing to price with anyway
+            return ForwardReturns.compute(table, self.price_index(table), [entry_delay_days],
+                                          [holding_period_days], self.MAX_PRICE_GAP_DAYS)
+        if self.price_provider is not None:
+            source = self.price_provider.cache_key()
+        else:
+            from pathlib import Path
+            source = f"store-{config_digest(Path(self.price_store.db_path).resolve())}"
+        store = TradeResults.load(f"{self.TRADE_RESULTS_DIR}/{source}", entry_delay_days,
+                                  holding_period_days, self.MAX_PRICE_GAP_DAYS)
+        fingerprint = fingerprints(table)
+        known, returns = store.lookup(fingerprint)
+
+        today = to_day(datetime.now())
+        entry_day = table.disclosure_day + entry_delay_days
+        pending = np.flatnonzero(~known & (entry_day <= today))
+        if len(pending):
+            self.load_price_history(table.subset(pending), entry_delay_days, holding_period_days)
+            prices = self.price_index(table)
+            codes, entry_day = table.ticker_code[pending], entry_day[pending]
+            exit_day = entry_day + holding_period_days
+            entry_price = prices.lookup(codes, entry_day, self.MAX_PRICE_GAP_DAYS)
+            exit_price, exit_session = prices.match(codes, exit_day, self.MAX_PRICE_GAP_DAYS)
+            fresh = np.where(table.is_purchase[pending], 1.0, -1.0) * (exit_price - entry_price) / entry_price
+            returns[pending] = fresh
+
+            # The exit can roll forward up to MAX_PRICE_GAP_DAYS and today's close may still
+            # move, so a priced trade is final once its matched exit session is before today.
+            # An unpriced trade is final only once its ticker has closes past the exit window.
+            window_end = exit_day + self.MAX_PRICE_GAP_DAYS
+            final = np.where(np.isnan(fresh),
+                             (window_end < today) & (prices.last_day(codes) > window_end),
+                             exit_session < today)
+            store.add(fingerprint[pending[final]], fresh[final])
+            logger.info(f"Incremental {entry_delay_days}d/{holding_period_days}d: "
+                        f"{int(known.sum())} stored, {len(pending)} evaluated, {int(final.sum())} newly final")
+
+        return ForwardReturns(returns[:, None, None], [entry_delay_days], [holding_period_days],
+                              table.disclosure_day)
+
+    def benchmark_index(self, start: datetime, end: datetime) -> PriceIndex:
+        """
+        Benchmark closes covering start..end as a one-ticker PriceIndex (code 0),
+        fetched once and shared by every strategy until a wider span is needed
+        """
+        cached = self._benchmark_index
+        if cached and cached[0] <= start and end <= cached[1]:
+            return cached[2]
+        if cached:
+            start, end = min(start, cached[0]), max(end, cached[1])
+
+        ticker = self.benchmark
+        series = None
+        if self.price_store is not None:
+            self._refresh_price_store([ticker], start, end)
+            series = self.price_store.get_all_closes([ticker]).get(ticker)
+        elif self.price_provider is not None:
+            rows = self.price_provider.fetch_history([ticker], start, end).get(ticker) or []
+            series = ([row[0] for row in rows], [row[4] for row in rows])
+
+        index = PriceIndex.from_history({ticker: series} if series else {}, [ticker])
+        if not len(index.keys):
+            logger.warning(f"No {ticker} prices for {start.date()} to {end.date()}; "
+                           f"benchmark-relative metrics unavailable")
+        self._benchmark_index = (start, end, index)
+        return index
+
+    def _benchmark_metrics(self, returns: np.ndarray, total_return: float, holding_period_days: int,
+                           position_size_pct: float, entry_day: Optional[np.ndarray] = None,
+                           equity_days: Optional[np.ndarray] = None,
+                           equity: Optional[np.ndarray] = None) -> Dict:
+        """
+        Benchmark-relative BacktestResult fields, over the daily equity curve when
+        there is one, otherwise over each trade's own entry-to-exit window
+        (annualized by holding period, like the per-trade Sharpe ratio)
+        """
+        days = equity_days if equity_days is not None else entry_day
+        if not self.benchmark or days is None or len(days) < 2:
+            return {}
+        gap = self.MAX_PRICE_GAP_DAYS
+        last = int(days.max()) + (0 if equity_days is not None else holding_period_days + gap)
+        index = self.benchmark_index(from_day(int(days.min())), min(from_day(last), datetime.now()))
+        codes = np.zeros(len(days), dtype=np.int64)
+
+        if equity_days is not None:
+            # Sessions the benchmark has no close for are dropped from both series
+            closes = index.lookup(codes, equity_days, 0)
+            valid = ~np.isnan(closes)
+            closes, values = closes[valid], np.asarray(equity, dtype=np.float64)[valid]
+            if len(closes) < 2:
+                return {}
+            strategy_returns = values[1:] / values[:-1] - 1
+            benchmark_returns = closes[1:] / closes[:-1] - 1
+            benchmark_return = closes[-1] / closes[0] - 1
+            periods_per_year = 252
+        else:
+            entry_price = index.lookup(codes, entry_day, gap)
+            exit_price = index.lookup(codes, entry_day + holding_period_days, gap)
+            benchmark_returns = (exit_price - entry_price) / entry_price
+            valid = ~np.isnan(benchmark_returns)
+            if valid.sum() < 2:
+                return {}
+            # The same trades compounded in the benchmark (windows without benchmark prices return 0)
+            benchmark_return = np.prod(1 + position_size_pct * np.where(valid, benchmark_returns, 0.0)) - 1
+            strategy_returns, benchmark_returns = np.asarray(returns, dtype=np.float64)[valid], \
+                benchmark_returns[valid]
+            periods_per_year = 252 / holding_period_days
+
+        return {
+            'benchmark': self.benchmark,
+            'benchmark_return': float(benchmark_return),
+            'excess_return': float(total_return - benchmark_return),
+            **relative_metrics(strategy_returns, benchmark_returns, periods_per_year),
+        }
+
+    def price_index(self, table: TradeTable) -> PriceIndex:
+        """Flat price index for a trade table, rebuilt when more history has been loaded"""
+        cached = self._price_index
+        if cached is None or cached[0] is not table or cached[1] != self._history_version:
+            cached = self._price_index = (table, self._history_version,
+                                          PriceIndex.from_history(self.price_history, table.tickers))
+        return cached[2]
+
+    def _run_strategy_loop(self, trades, strategy_name, entry_delay_days, holding_period_days,
+                           min_trade_size, leaders_only, purchases_only, max_positions,
+                           position_size_pct) -> BacktestResult:
+        """run_strategy() one trade at a time (used when vectorized=False)"""
         results = []
         capital = self.initial_capital
         peak_capital = capital
@@ -162,6 +553,8 @@ class CongressionalBacktester:
         active_positions = []
 
         # Sort trades by disclosure date
+        if isinstance(trades, TradeTable):
+            trades = trades_from_table(trades)
         sorted_trades = sorted(trades, key=lambda t: t.disclosure_date)
 
         for trade in sorted_trades:
@@ -216,63 +609,39 @@ class CongressionalBacktester:
                 'capital_after': capital
             })
 
-            # Rate limit API calls
-            time.sleep(0.1)
-
-        if not results:
-            return BacktestResult(
-                strategy_name=strategy_name,
-                total_trades=0,
-                winning_trades=0,
-                losing_trades=0,
-                total_return=0,
-                avg_return_per_trade=0,
-                max_drawdown=0,
-                sharpe_ratio=0,
-                win_rate=0,
-                avg_holding_days=holding_period_days,
-                best_trade=0,
-                worst_trade=0,
-                trades_detail=[]
-            )
-
-        # Calculate statistics
-        returns = [r['return'] for r in results]
-        winning = [r for r in returns if r > 0]
-        losing = [r for r in returns if r <= 0]
-
-        total_return = (capital - self.initial_capital) / self.initial_capital
-        avg_return = sum(returns) / len(returns) if returns else 0
-        win_rate = len(winning) / len(returns) if returns else 0
-
-        # Simplified Sharpe (assuming risk-free rate of 0)
-        import statistics
-        if len(returns) > 1:
-            std_dev = statistics.stdev(returns)
-            sharpe = (avg_return / std_dev) * (252 / holding_period_days) ** 0.5 if std_dev > 0 else 0
-        else:
-            sharpe = 0
-
+            # Rate limit remote lookups (only made for tickers without loaded history)
+            if trade.ticker not in self.price_history and getattr(self.price_provider, 'REMOTE', False):
+                time.sleep(0.1)
+
+        returns = np.array([r['return'] for r in results], dtype=np.float64)
+        return self._build_result(strategy_name, results, returns, capital, max_drawdown,
+                                  holding_period_days, position_size_pct)
+
+    def _build_result(self, strategy_name: str, results: List[Dict], returns, capital: float,
+                      max_drawdown: float, holding_period_days: int, position_size_pct: float,
+                      entry_day: Optional[np.ndarray] = None,
+                      equity_days: Optional[np.ndarray] = None,
+                      equity: Optional[np.ndarray] = None) -> BacktestResult:
+        """Summary and benchmark-relative statistics shared by the engines and the portfolio simulator"""
+        stats = summarize(returns, capital, self.initial_capital, max_drawdown, holding_period_days)
+        if entry_day is None and equity_days is None and results:
+            entry_day = np.array([r['entry_date'] for r in results], dtype='datetime64[D]').astype(np.int64)
         return BacktestResult(
             strategy_name=strategy_name,
-            total_trades=len(results),
-            winning_trades=len(winning),
-            losing_trades=len(losing),
-            total_return=total_return,
-            avg_return_per_trade=avg_return,
-            max_drawdown=max_drawdown,
-            sharpe_ratio=sharpe,
-            win_rate=win_rate,
-            avg_holding_days=holding_period_days,
-            best_trade=max(returns) if returns else 0,
-            worst_trade=min(returns) if returns else 0,
-            trades_detail=results
+            trades_detail=results,
+            **stats,
+            **self._benchmark_metrics(returns, stats['total_return'], holding_period_days,
+                                      position_size_pct, entry_day, equity_days, equity)
         )
 
-    def compare_strategies(self, trades: List[Trade]) -> List[BacktestResult]:
+    def compare_strategies(self, trades: Trades, event_driven: bool = False,
+                           verbose: bool = True) -> List[BacktestResult]:
         """
         Compare multiple trading strategies
 
+        With event_driven, each strategy runs through run_portfolio() instead of run_strategy().
+        verbose prints a line as each strategy completes.
+
         Returns results sorted by total return
         """
         strategies = [
@@ -351,12 +720,42 @@ class CongressionalBacktester:
             }
         ]
 
+        # One bulk download covers every strategy's entry/exit window, and the
+        # vectorized engine shares one forward-return tensor across them. Incremental
+        # runs skip both and load prices only for trades without stored results.
+        if self.incremental and self.vectorized and not event_driven:
+            logger.debug("Incremental comparison: prices are loaded per strategy as needed")
+        elif self.vectorized:
+            self.precompute_forward_returns(
+                trades,
+                delays=[s['entry_delay_days'] for s in strategies],
+                horizons=[s['holding_period_days'] for s in strategies]
+            )
+        else:
+            self.load_price_history(
+                trades,
+                max_entry_delay_days=max(s['entry_delay_days'] for s in strategies),
+                max_holding_days=max(s['holding_period_days'] for s in strategies)
+            )
+
+        # One benchmark series over the whole span is shared by every strategy's relative metrics
+        if self.benchmark and len(trades):
+            table = self.trade_table(trades)
+            last_exit = int(table.disclosure_day.max()) + self.MAX_PRICE_GAP_DAYS + \
+                max(s['entry_delay_days'] + s['holding_period_days'] for s in strategies)
+            self.benchmark_index(from_day(int(table.disclosure_day.min())),
+                                 min(from_day(last_exit), datetime.now()))
+
+        run = self.run_portfolio if event_driven else self.run_strategy
         results = []
         for strat in strategies:
             # Handle Pelosi-only special case
             if strat.get('pelosi_only'):
-                pelosi_trades = [t for t in trades if 'pelosi' in t.representative.lower()]
-                result = self.run_strategy(
+                if isinstance(trades, TradeTable):
+                    pelosi_trades = trades.subset(trades.representative_mask('pelosi'))
+                else:
+                    pelosi_trades = [t for t in trades if 'pelosi' in t.representative.lower()]
+                result = run(
                     pelosi_trades,
                     strat['name'],
                     entry_delay_days=strat['entry_delay_days'],
@@ -366,7 +765,7 @@ class CongressionalBacktester:
                     purchases_only=strat['purchases_only']
                 )
             else:
-                result = self.run_strategy(
+                result = run(
                     trades,
                     strat['name'],
                     entry_delay_days=strat['entry_delay_days'],
@@ -376,7 +775,8 @@ class CongressionalBacktester:
                     purchases_only=strat['purchases_only']
                 )
             results.append(result)
-            print(f"Completed: {strat['name']}")
+            if verbose:
+                print(f"Completed: {strat['name']}")
 
         # Sort by total return
         results.sort(key=lambda r: r.total_return, reverse=True)
@@ -397,6 +797,16 @@ class CongressionalBacktester:
 
         print("=" * 100)
 
+        relative = [r for r in results if r.beta is not None]
+        if relative:
+            print(f"\nRELATIVE TO {relative[0].benchmark}")
+            print(f"{'Strategy':<45} {'Bench':>8} {'Excess':>8} {'Alpha':>8} {'Beta':>6} {'IR':>6} {'Sortino':>8}")
+            print("-" * 100)
+            for r in relative:
+                print(f"{r.strategy_name:<45} {r.benchmark_return*100:>7.1f}% {r.excess_return*100:>7.1f}% "
+                      f"{r.alpha*100:>7.1f}% {r.beta:>6.2f} {r.information_ratio:>6.2f} {r.sortino_ratio:>8.2f}")
+            print("=" * 100)
+
         # Print best strategy details
         if results:
             best = results[0]
@@ -406,6 +816,10 @@ class CongressionalBacktester:
             print(f"  Best Trade: {best.best_trade*100:.1f}%")
             print(f"  Worst Trade: {best.worst_trade*100:.1f}%")
             print(f"  Max Drawdown: {best.max_drawdown*100:.1f}%")
+            if best.beta is not None:
+                print(f"  vs {best.benchmark}: {best.excess_return*100:+.1f}% excess "
+                      f"(benchmark {best.benchmark_return*100:.1f}%), alpha {best.alpha*100:.1f}%/yr, "
+                      f"beta {best.beta:.2f}")
 
             if best.trades_detail:
                 print("\n  Top 5 Trades:")
@@ -414,118 +828,237 @@ class CongressionalBacktester:
                     print(f"    {t['ticker']:6} {t['return']*100:>7.1f}%  ({t['representative'][:25]})")
 
 
-def load_historical_trades_from_db(db_path: str = 'data/trading.db') -> List[Trade]:
-    """Load trades from SQLite database"""
-    import sqlite3
-
-    trades = []
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute("""
-            SELECT * FROM congressional_trades
-            ORDER BY disclosure_date DESC
-        """)
-
-        for row in cursor.fetchall():
-            try:
-                # Parse dates
-                tx_date = datetime.strptime(row['transaction_date'], '%m/%d/%Y') if row['transaction_date'] else datetime.now()
-                disc_date = datetime.strptime(row['disclosure_date'], '%m/%d/%Y') if row['disclosure_date'] else tx_date
-
-                trade = Trade(
-                    ticker=row['ticker'],
-                    transaction_type=row['transaction_type'],
-                    transaction_date=tx_date,
-                    disclosure_date=disc_date,
-                    amount=row['amount'] or 0,
-                    representative=row['representative'] or '',
-                    chamber=row['chamber'] or 'house'
-                )
-                trades.append(trade)
-            except Exception as e:
-                logger.debug(f"Error parsing trade: {e}")
-                continue
+def load_historical_trades_from_db(db_path: str = 'data/trading.db',
+                                   include_archive: bool = True,
+                                   from_snapshot: bool = False) -> List[Trade]:
+    """
+    Load trades from SQLite database (plus the archive database, if present)
 
-    return trades
+    With from_snapshot the read goes to a point-in-time copy of the database
+    (refreshed if stale) so a long backtest never contends with the trading loop.
+    """
+    return trades_from_table(load_trade_table_from_db(db_path, include_archive, from_snapshot))
 
 
-def fetch_historical_trades() -> List[Trade]:
+def load_trade_table_from_db(db_path: str = 'data/trading.db',
+                             include_archive: bool = True,
+                             from_snapshot: bool = False) -> TradeTable:
+    """load_historical_trades_from_db() as a columnar TradeTable, without per-row Trade objects"""
+    from pathlib import Path
+
+    from .database import archive_path_for, connect, connect_readonly, refresh_snapshot
+
+    columns = "ticker, transaction_type, amount, transaction_date, disclosure_date, representative, chamber"
+    query = f"SELECT {columns} FROM congressional_trades"
+
+    connection = connect_readonly(refresh_snapshot(db_path)) if from_snapshot else connect(db_path)
+    with connection as conn:
+        archive_path = archive_path_for(db_path)
+        if include_archive and Path(archive_path).exists():
+            conn.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+            query += f" UNION ALL SELECT {columns} FROM archive.congressional_trades"
+        rows = conn.execute(query).fetchall()
+
+    tickers, types, amounts, tx_dates, disc_dates, reps, chambers = \
+        (list(column) for column in zip(*rows)) if rows else ([] for _ in range(7))
+    tx_day = parse_days(tx_dates, ('%m/%d/%Y',))
+    disc_day = parse_days(disc_dates, ('%m/%d/%Y',))
+
+    # Missing dates default to today / the transaction date; dates that don't parse skip the row
+    unparseable = ((tx_day == NO_DAY) & np.array([bool(d) for d in tx_dates], dtype=bool)) | \
+                  ((disc_day == NO_DAY) & np.array([bool(d) for d in disc_dates], dtype=bool))
+    if unparseable.any():
+        logger.debug(f"Skipping {int(unparseable.sum())} trades with unparseable dates")
+    tx_day = np.where(tx_day == NO_DAY, to_day(datetime.now()), tx_day)
+    disc_day = np.where(disc_day == NO_DAY, tx_day, disc_day)
+
+    keep = np.flatnonzero(~unparseable).tolist()
+    return TradeTable.from_columns(
+        ticker=[tickers[i] for i in keep],
+        transaction_type=[types[i] for i in keep],
+        transaction_day=tx_day[keep],
+        disclosure_day=disc_day[keep],
+        amount=np.array([amounts[i] or 0 for i in keep], dtype=np.float64),
+        representative=[reps[i] or '' for i in keep],
+        chamber=[chambers[i] or 'house' for i in keep],
+        leader_check=_name_check(CongressionalBacktester.LEADERS),
+        chair_check=_name_check(CongressionalBacktester.COMMITTEE_CHAIRS),
+    )
+
+
+HOUSE_TRADES_URL = "https://house-stock-watcher-data.s3-us-west-2.amazonaws.com/data/all_transactions.json"
+
+# Raw download, its validators and parsed TradeTable snapshots live here
+TRADES_CACHE_DIR = "data/cache"
+
+# Bump when trade_table_from_records() output changes, to invalidate parsed snapshots
+TRADES_SNAPSHOT_VERSION = 1
+
+
+def fetch_historical_trades(cache_dir: Optional[str] = TRADES_CACHE_DIR) -> List[Trade]:
     """Fetch historical trades from House Stock Watcher (free API)"""
-    url = "https://house-stock-watcher-data.s3-us-west-2.amazonaws.com/data/all_transactions.json"
+    table = fetch_trade_table(cache_dir)
+    return trades_from_table(table) if table is not None else []
+
+
+def fetch_trade_table(cache_dir: Optional[str] = TRADES_CACHE_DIR) -> Optional[TradeTable]:
+    """
+    fetch_historical_trades() as a columnar TradeTable (None if unavailable)
+
+    With a cache_dir, the download is revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged dataset costs one 304 response. The
+    parsed table is kept as an .npz snapshot keyed by the source ETag, so a
+    warm start loads arrays instead of parsing the JSON. If the request fails,
+    the cached copy is used.
+    """
+    if not cache_dir:
+        try:
+            response = requests.get(HOUSE_TRADES_URL, timeout=30)
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch: {response.status_code}")
+                return None
+            table = trade_table_from_records(response.json())
+            logger.info(f"Loaded {len(table)} historical trades from House Stock Watcher")
+            return table
+        except Exception as e:
+            logger.error(f"Error fetching historical trades: {e}")
+            return None
+
+    import json
+    import os
+    from pathlib import Path
+
+    cache = Path(cache_dir)
+    raw_path = cache / "house_trades.json"
+    meta_path = cache / "house_trades.meta.json"
+    meta = {}
+    if raw_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            meta = {}
+
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
 
     try:
-        response = requests.get(url, timeout=30)
-        if response.status_code != 200:
+        response = requests.get(HOUSE_TRADES_URL, headers=headers, timeout=30)
+        if response.status_code == 200:
+            cache.mkdir(parents=True, exist_ok=True)
+            tmp_path = raw_path.with_suffix('.tmp')
+            tmp_path.write_bytes(response.content)
+            os.replace(tmp_path, raw_path)
+            meta = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': datetime.now().isoformat(),
+            }
+            meta_path.write_text(json.dumps(meta))
+            logger.info(f"Downloaded House Stock Watcher dataset ({len(response.content) / 1e6:.1f} MB)")
+        elif response.status_code == 304:
+            logger.debug("House Stock Watcher dataset unchanged since last download")
+        else:
             logger.error(f"Failed to fetch: {response.status_code}")
-            return []
-
-        data = response.json()
-        trades = []
-
-        for item in data:
-            try:
-                # Parse transaction type
-                tx_type = item.get('type', '').lower()
-                if 'purchase' in tx_type:
-                    tx_type = 'purchase'
-                elif 'sale' in tx_type:
-                    tx_type = 'sale'
-                else:
-                    continue
-
-                # Parse dates
-                tx_date_str = item.get('transaction_date', '')
-                disc_date_str = item.get('disclosure_date', '')
-
-                # Try multiple date formats
-                tx_date = None
-                for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%Y/%m/%d']:
-                    try:
-                        tx_date = datetime.strptime(tx_date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                if tx_date is None:
-                    tx_date = datetime.now() - timedelta(days=30)
-
-                disc_date = None
-                for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%Y/%m/%d']:
-                    try:
-                        disc_date = datetime.strptime(disc_date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                if disc_date is None:
-                    disc_date = tx_date + timedelta(days=30)
-
-                # Parse amount
-                amount_str = item.get('amount', '$0')
-                amount = parse_amount(amount_str)
-
-                ticker = item.get('ticker', '').replace('--', '').strip()
-                if not ticker or len(ticker) > 5:
-                    continue
-
-                trade = Trade(
-                    ticker=ticker,
-                    transaction_type=tx_type,
-                    transaction_date=tx_date,
-                    disclosure_date=disc_date,
-                    amount=amount,
-                    representative=item.get('representative', ''),
-                    chamber='house'
-                )
-                trades.append(trade)
+    except requests.RequestException as e:
+        logger.warning(f"Error fetching historical trades: {e}")
 
-            except Exception:
-                continue
+    if not raw_path.exists():
+        return None
 
-        logger.info(f"Loaded {len(trades)} historical trades from House Stock Watcher")
-        return trades
+    # Snapshot key covers the source version and everything baked into the parsed table
+    validator = meta.get('etag') or meta.get('last_modified') or str(raw_path.stat().st_mtime_ns)
+    key = hashlib.sha1(repr((validator, TRADES_SNAPSHOT_VERSION, CongressionalBacktester.LEADERS,
+                             CongressionalBacktester.COMMITTEE_CHAIRS)).encode()).hexdigest()[:16]
+    snapshot_path = cache / f"house_trades_{key}.npz"
+
+    if snapshot_path.exists():
+        try:
+            table = TradeTable.load(snapshot_path)
+            logger.info(f"Loaded {len(table)} historical trades from {snapshot_path}")
+            return table
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable trades snapshot {snapshot_path}: {e}")
 
-    except Exception as e:
-        logger.error(f"Error fetching historical trades: {e}")
-        return []
+    try:
+        table = trade_table_from_records(json.loads(raw_path.read_bytes()))
+    except ValueError as e:
+        logger.error(f"Cached House Stock Watcher dataset is not valid JSON: {e}")
+        return None
+    table.save(snapshot_path)
+    for stale in cache.glob("house_trades_*.npz"):
+        if stale != snapshot_path:
+            stale.unlink(missing_ok=True)
+
+    logger.info(f"Loaded {len(table)} historical trades from House Stock Watcher")
+    return table
+
+
+def trade_table_from_records(data: List[Dict]) -> TradeTable:
+    """Parse House Stock Watcher transaction records into a TradeTable"""
+    tickers, types, tx_dates, disc_dates, amounts, reps = [], [], [], [], [], []
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+
+        # Parse transaction type
+        tx_type = str(item.get('type') or '').lower()
+        if 'purchase' in tx_type:
+            tx_type = 'purchase'
+        elif 'sale' in tx_type:
+            tx_type = 'sale'
+        else:
+            continue
+
+        ticker = str(item.get('ticker') or '').replace('--', '').strip()
+        if not ticker or len(ticker) > 5:
+            continue
+
+        tickers.append(ticker)
+        types.append(tx_type)
+        tx_dates.append(item.get('transaction_date') or '')
+        disc_dates.append(item.get('disclosure_date') or '')
+        amounts.append(item.get('amount', '$0'))
+        reps.append(item.get('representative') or '')
+
+    # Try multiple date formats; a missing transaction date defaults to 30 days
+    # ago and a missing disclosure date to 30 days after the transaction
+    formats = ('%Y-%m-%d', '%m/%d/%Y', '%Y/%m/%d')
+    tx_day = parse_days(tx_dates, formats)
+    tx_day = np.where(tx_day == NO_DAY, to_day(datetime.now() - timedelta(days=30)), tx_day)
+    disc_day = parse_days(disc_dates, formats)
+    disc_day = np.where(disc_day == NO_DAY, tx_day + 30, disc_day)
+
+    # Amounts are a handful of disclosure ranges, so parse each distinct string once
+    amount_by_text = {text: parse_amount(text) for text in set(map(str, amounts))}
+
+    return TradeTable.from_columns(
+        ticker=tickers,
+        transaction_type=types,
+        transaction_day=tx_day,
+        disclosure_day=disc_day,
+        amount=np.array([amount_by_text[str(text)] for text in amounts], dtype=np.float64),
+        representative=reps,
+        chamber=['house'] * len(tickers),
+        leader_check=_name_check(CongressionalBacktester.LEADERS),
+        chair_check=_name_check(CongressionalBacktester.COMMITTEE_CHAIRS),
+    )
+
+
+def trades_from_table(table: TradeTable) -> List[Trade]:
+    """Trade objects for each row of a TradeTable, in disclosure order"""
+    return [
+        Trade(ticker=ticker, transaction_type=tx_type, transaction_date=tx_date, disclosure_date=disc_date,
+              amount=amount, representative=rep, chamber=chamber)
+        for ticker, tx_type, tx_date, disc_date, amount, rep, chamber in table.records()
+    ]
+
+
+def _name_check(names: List[str]):
+    """Case-insensitive substring check against a name list (as is_leader / is_committee_chair)"""
+    return lambda representative: any(name in representative.lower() for name in names)
 
 
 def parse_amount(amount_str: str) -> float:
@@ -543,20 +1076,76 @@ def parse_amount(amount_str: str) -> float:
 
 
 if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Congressional Trading Strategy Backtester")
+    parser.add_argument('--config', help='Config file with a "backtest" section (priceProvider, '
+                                         'priceDirectory, syntheticSeed)')
+    parser.add_argument('--prices', choices=['yfinance', 'local', 'synthetic'],
+                        help='Price provider (default: backtest.priceProvider or yfinance)')
+    parser.add_argument('--price-dir', help='Directory of <TICKER>.csv/.parquet files for --prices local')
+    parser.add_argument('--seed', type=int, help='Random-walk seed for --prices synthetic')
+    parser.add_argument('--benchmark', help='Benchmark ticker for alpha/beta/information ratio '
+                                            '(default: backtest.benchmark or SPY; "none" to skip)')
+    parser.add_argument('--trades-db', help='Load trades from this database instead of downloading them')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse per-trade results from earlier runs; only new or newly matured trades are priced')
+    parser.add_argument('--event-driven', action='store_true',
+                        help='Simulate overlapping positions with a daily equity curve (max 20 open)')
+    parser.add_argument('--sweep', choices=['grid', 'random'],
+                        help='Run a parallel parameter sweep instead of the fixed strategy comparison')
+    parser.add_argument('--samples', type=int, default=200, help='Configurations to draw for --sweep random')
+    parser.add_argument('--workers', type=int, help='Sweep / Monte Carlo worker processes (default: CPU count)')
+    parser.add_argument('--sort-by', default='total_return', help='SweepRow column to rank sweep results by')
+    parser.add_argument('--sweep-out', help='Write all sweep results to this CSV file')
+    parser.add_argument('--walk-forward', action='store_true',
+                        help='Walk-forward optimize over the sweep grid (uses all loaded trades)')
+    parser.add_argument('--train-days', type=int, default=730, help='Walk-forward in-sample window')
+    parser.add_argument('--test-days', type=int, default=180, help='Walk-forward out-of-sample window and step')
+    parser.add_argument('--objective', default='sharpe_ratio',
+                        choices=['sharpe_ratio', 'total_return', 'avg_return_per_trade'],
+                        help='Walk-forward in-sample score')
+    parser.add_argument('--monte-carlo', action='store_true',
+                        help='Bootstrap and random-entry significance test of one strategy')
+    parser.add_argument('--delay', type=int, default=9, help='Entry delay for --monte-carlo')
+    parser.add_argument('--hold', type=int, default=45, help='Holding period for --monte-carlo')
+    parser.add_argument('--resamples', type=int, default=10000, help='Monte Carlo runs per distribution')
+    args = parser.parse_args()
+
     logging.basicConfig(level=logging.INFO)
 
     print("Congressional Trading Strategy Backtester")
     print("=" * 50)
 
-    # Check for yfinance
-    if not HAS_YFINANCE:
-        print("ERROR: yfinance not installed")
-        print("Run: pip install yfinance")
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    backtest_config = config.setdefault('backtest', {})
+    if args.prices:
+        backtest_config['priceProvider'] = args.prices
+    if args.price_dir:
+        backtest_config['priceDirectory'] = args.price_dir
+    if args.seed is not None:
+        backtest_config['syntheticSeed'] = args.seed
+    if args.benchmark:
+        backtest_config['benchmark'] = args.benchmark
+    benchmark = backtest_config.get('benchmark', CongressionalBacktester.BENCHMARK_TICKER)
+
+    try:
+        provider = get_price_provider(config)
+    except (ValueError, RuntimeError) as e:
+        print(f"ERROR: {e}")
         exit(1)
 
     # Fetch historical trades
-    print("\nFetching historical congressional trades...")
-    trades = fetch_historical_trades()
+    if args.trades_db:
+        print(f"\nLoading congressional trades from {args.trades_db}...")
+        trades = load_trade_table_from_db(args.trades_db)
+    else:
+        print("\nFetching historical congressional trades...")
+        trades = fetch_trade_table()
 
     if not trades:
         print("No trades found. Exiting.")
@@ -566,12 +1155,38 @@ if __name__ == "__main__":
 
     # Filter to last 2 years for more relevant backtest
     two_years_ago = datetime.now() - timedelta(days=730)
-    recent_trades = [t for t in trades if t.disclosure_date > two_years_ago]
+    recent_trades = trades.subset(trades.disclosure_day > to_day(two_years_ago))
     print(f"Using {len(recent_trades)} trades from last 2 years")
 
-    # Run backtester
-    backtester = CongressionalBacktester(initial_capital=50000)
-    print("\nRunning strategy comparisons (this may take a few minutes)...")
-
-    results = backtester.compare_strategies(recent_trades)
-    backtester.print_results(results)
+    # Run backtester (remote prices persist in data/prices.db, so re-runs only fetch new days)
+    backtester = CongressionalBacktester(initial_capital=50000,
+                                         price_store=PriceStore() if provider.REMOTE else None,
+                                         price_provider=provider, incremental=args.incremental,
+                                         benchmark=None if benchmark.lower() == 'none' else benchmark)
+    print(f"\nRunning strategy comparisons with {provider.PROVIDER_NAME} prices...")
+
+    if args.monte_carlo:
+        from .monte_carlo import monte_carlo
+
+        monte_carlo(backtester, recent_trades, f"{args.delay}d delay, {args.hold}d hold",
+                    entry_delay_days=args.delay, holding_period_days=args.hold,
+                    resamples=args.resamples, workers=args.workers).print()
+    elif args.walk_forward:
+        from .param_sweep import grid_configs
+        from .walk_forward import walk_forward
+
+        walk_forward(backtester, trades, grid_configs(), train_days=args.train_days,
+                     test_days=args.test_days, objective=args.objective).print()
+    elif args.sweep:
+        from .param_sweep import grid_configs, random_configs, run_sweep
+
+        configs = grid_configs() if args.sweep == 'grid' else random_configs(args.samples)
+        sweep = run_sweep(backtester, recent_trades, configs, workers=args.workers,
+                          on_result=lambda row: print(f"Completed: {row.name} ({row.total_return*100:.1f}%)"))
+        sweep.print(by=args.sort_by)
+        if args.sweep_out:
+            sweep.to_csv(args.sweep_out, by=args.sort_by)
+            print(f"Sweep results written to {args.sweep_out}")
+    else:
+        results = backtester.compare_strategies(recent_trades, event_driven=args.event_driven)
+        backtester.print_results(results)
@@ -0,0 +1,335 @@
+"""
+Backtest performance benchmarks
+Generates synthetic congressional trade datasets (House Stock Watcher style
+records plus a daily close series per ticker) at several sizes, times the
+trade loaders, price loading, run_strategy and compare_strategies against
+them, and appends throughput and peak memory to a JSON-lines results file so
+runs can be compared between releases. Everything is in-process and offline.
+
+    python -m clawback.benchmarks --sizes 1000 10000 100000
+"""
+import gc
+import hashlib
+import json
+import logging
+import os
+import platform
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import __version__
+from .backtest_engine import TradeTable, from_day, to_day
+from .backtester import (
+    CongressionalBacktester,
+    load_trade_table_from_db,
+    parse_amount,
+    trade_table_from_records,
+    trades_from_table,
+)
+from .price_providers import PriceProvider
+from .trading_calendar import nyse_calendar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+RESULTS_PATH = "data/benchmarks/results.jsonl"
+
+# The per-trade Python loop engine is only timed up to this many trades
+LOOP_MAX_TRADES = 10_000
+
+# Disclosure ranges as they appear in the House Stock Watcher data
+AMOUNT_RANGES = [
+    '$1,001 - $15,000', '$15,001 - $50,000', '$50,001 - $100,000',
+    '$100,001 - $250,000', '$250,001 - $500,000', '$500,001 - $1,000,000',
+]
+AMOUNT_WEIGHTS = [0.55, 0.2, 0.1, 0.08, 0.04, 0.03]
+
+
+@dataclass
+class BenchmarkCase:
+    """Timing and peak traced memory of one operation at one dataset size"""
+    name: str
+    trades: int
+    seconds: float
+    trades_per_second: float
+    peak_memory_mb: float
+    repeats: int
+
+
+# --- Synthetic data ---
+
+@dataclass
+class SyntheticDataset:
+    """Transaction records and per-ticker closes (session days, prices) for a benchmark size"""
+    records: List[Dict]
+    closes: Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def _ticker(i: int) -> str:
+    """Distinct 2-3 letter symbols (BA, BB, ...) so every record passes the loader's ticker check"""
+    letters = ''
+    i += 26
+    while i:
+        i, r = divmod(i, 26)
+        letters = chr(ord('A') + r) + letters
+    return letters
+
+
+def synthetic_dataset(n_trades: int, seed: int = 42, years: int = 3) -> SyntheticDataset:
+    """
+    Deterministic dataset of n_trades disclosures spread over `years` ending
+    120 days ago (so every holding period has matured), with about one ticker
+    per 50 trades and a representative pool that includes the leaders and
+    committee chairs the strategies filter on
+    """
+    rng = np.random.default_rng(seed)
+    n_tickers = int(np.clip(n_trades // 50, 50, 2000))
+    tickers = [_ticker(i) for i in range(n_tickers)]
+    names = [name.title() for name in CongressionalBacktester.LEADERS + CongressionalBacktester.COMMITTEE_CHAIRS]
+    representatives = [f"Hon. {name}" for name in names] + [f"Hon. Member {i}" for i in range(400)]
+
+    last = to_day(datetime.now() - timedelta(days=120))
+    first = last - 365 * years
+    disclosure_day = np.sort(rng.integers(first, last, n_trades))
+    transaction_day = disclosure_day - rng.integers(5, 46, n_trades)
+    # Popular tickers trade more often, as in the real data
+    ticker_index = np.minimum(rng.zipf(1.3, n_trades) - 1, n_tickers - 1)
+    rep_index = rng.integers(0, len(representatives), n_trades)
+    purchase = rng.random(n_trades) < 0.55
+    amount_index = rng.choice(len(AMOUNT_RANGES), n_trades, p=AMOUNT_WEIGHTS)
+
+    def text(days, fmt):
+        return [from_day(day).strftime(fmt) for day in days.tolist()]
+
+    records = [
+        {'transaction_date': tx, 'disclosure_date': disc, 'ticker': tickers[t],
+         'type': 'purchase' if buy else 'sale_full', 'amount': AMOUNT_RANGES[a],
+         'representative': representatives[r]}
+        for tx, disc, t, buy, a, r in zip(
+            text(transaction_day, '%Y-%m-%d'), text(disclosure_day, '%m/%d/%Y'), ticker_index.tolist(),
+            purchase.tolist(), amount_index.tolist(), rep_index.tolist())
+    ]
+
+    # Geometric random walk per ticker (and the benchmark index) over every session the strategies can touch
+    sessions = nyse_calendar().sessions
+    sessions = sessions[(sessions >= first - 60) & (sessions <= to_day(datetime.now()))]
+    steps = rng.normal(0.07 / 252, 0.3 / np.sqrt(252), (n_tickers + 1, len(sessions)))
+    walks = rng.uniform(10, 500, (n_tickers + 1, 1)) * np.exp(np.cumsum(steps, axis=1))
+    closes = {ticker: (sessions, np.round(walk, 4))
+              for ticker, walk in zip([*tickers, CongressionalBacktester.BENCHMARK_TICKER], walks)}
+    return SyntheticDataset(records, closes)
+
+
+class BenchmarkPriceProvider(PriceProvider):
+    """Serves a SyntheticDataset's closes from memory"""
+
+    PROVIDER_NAME = "benchmark"
+
+    def __init__(self, closes: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        self.closes = closes
+
+    def cache_key(self) -> str:
+        digest = hashlib.sha1()
+        for ticker in sorted(self.closes):
+            days, closes = self.closes[ticker]
+            digest.update(ticker.encode())
+            digest.update(np.ascontiguousarray(days).tobytes())
+            digest.update(np.ascontiguousarray(closes).tobytes())
+        return f"{self.PROVIDER_NAME}-{digest.hexdigest()[:12]}"
+
+    def fetch_history(self, tickers: List[str], start: datetime, end: datetime) -> Dict[str, List[tuple]]:
+        history = {}
+        for ticker in tickers:
+            days, closes = self.closes.get(ticker, (np.zeros(0, dtype=np.int64), np.zeros(0)))
+            inside = (days >= to_day(start)) & (days <= to_day(end))
+            dates = np.datetime_as_string(days[inside].astype('datetime64[D]')).tolist()
+            history[ticker] = [(date, close, close, close, close, close, 0)
+                               for date, close in zip(dates, closes[inside].tolist())]
+        return history
+
+
+def write_trades_db(records: List[Dict], db_path: str):
+    """Bulk-insert records into a fresh trading database, in the format the bot stores them"""
+    from .database import TradingDatabase
+
+    db = TradingDatabase(db_path, write_behind=False)
+    db.close()
+
+    def us_date(value):
+        return datetime.strptime(value, '%Y-%m-%d').strftime('%m/%d/%Y') if '-' in value else value
+
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany("""
+            INSERT OR IGNORE INTO congressional_trades
+            (trade_hash, ticker, transaction_type, amount, amount_range,
+             transaction_date, disclosure_date, representative, chamber)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'house')
+        """, [
+            (f"bench-{i}", r['ticker'], 'purchase' if r['type'] == 'purchase' else 'sale',
+             parse_amount(r['amount']), r['amount'], us_date(r['transaction_date']),
+             us_date(r['disclosure_date']), r['representative'])
+            for i, r in enumerate(records)
+        ])
+
+
+# --- Measurement ---
+
+def measure(fn: Callable[[], object], repeats: int = 3) -> Tuple[float, float]:
+    """
+    (best wall-clock seconds over `repeats` runs, peak traced bytes of one more run)
+
+    Memory is traced in a separate run so tracemalloc's overhead doesn't skew
+    the timings.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(sizes: Sequence[int] = DEFAULT_SIZES, repeats: int = 3, seed: int = 42,
+                   loop_max_trades: int = LOOP_MAX_TRADES,
+                   on_case: Optional[Callable[[BenchmarkCase], None]] = None) -> List[BenchmarkCase]:
+    """
+    Time the loaders and backtests at each dataset size
+
+    Cases:
+        load_records: trade_table_from_records() on the raw JSON records
+        load_db: load_trade_table_from_db() from a SQLite trading database
+        load_snapshot: TradeTable.load() of the parsed .npz snapshot
+        load_prices: load_price_history() (bulk per-ticker provider fetch)
+        run_strategy: vectorized engine on a TradeTable, prices loaded
+        table_from_trades: columnar TradeTable from a list of Trade objects
+        run_strategy_loop: per-trade loop engine (sizes up to loop_max_trades)
+        compare_strategies: the eight-strategy comparison, prices loaded
+    """
+    cases = []
+
+    def record(name, n, fn, times=repeats):
+        seconds, peak = measure(fn, times)
+        case = BenchmarkCase(name=name, trades=n, seconds=round(seconds, 6),
+                             trades_per_second=round(n / seconds, 1) if seconds > 0 else float('inf'),
+                             peak_memory_mb=round(peak / 2 ** 20, 3), repeats=times)
+        cases.append(case)
+        if on_case:
+            on_case(case)
+
+    strategy = {'strategy_name': '9d delay, 45d hold', 'entry_delay_days': 9, 'holding_period_days': 45}
+
+    for n in sizes:
+        logger.info(f"Generating {n} synthetic trades")
+        dataset = synthetic_dataset(n, seed)
+        table = trade_table_from_records(dataset.records)
+        trades = trades_from_table(table)
+
+        with tempfile.TemporaryDirectory(prefix='clawback-bench-') as work_dir:
+            db_path = os.path.join(work_dir, 'trading.db')
+            snapshot_path = os.path.join(work_dir, 'trades.npz')
+            write_trades_db(dataset.records, db_path)
+            table.save(snapshot_path)
+
+            # Timed callables are bound with partial() so none sees a later size's data
+            record('load_records', n, partial(trade_table_from_records, dataset.records))
+            record('load_db', n, partial(load_trade_table_from_db, db_path, include_archive=False))
+            record('load_snapshot', n, partial(TradeTable.load, snapshot_path))
+
+        backtester = partial(_backtester, BenchmarkPriceProvider(dataset.closes))
+
+        record('load_prices', n, lambda new=backtester, table=table: new().load_price_history(table, 21, 90))
+
+        bt = backtester()
+        bt.load_price_history(table, 21, 90)
+        record('run_strategy', n, partial(bt.run_strategy, table, **strategy))
+
+        record('table_from_trades', n, lambda new=backtester, trades=trades: new().trade_table(trades))
+
+        if n <= loop_max_trades:
+            bt = backtester(vectorized=False)
+            bt.load_price_history(trades, 21, 90)
+            record('run_strategy_loop', n, partial(bt.run_strategy, trades, **strategy), times=1)
+
+        bt = backtester()
+        bt.load_price_history(table, 21, 90)
+        record('compare_strategies', n, partial(bt.compare_strategies, table, verbose=False))
+
+    return cases
+
+
+def _backtester(provider: PriceProvider, vectorized: bool = True) -> CongressionalBacktester:
+    """Backtester on the in-memory prices, keeping forward-return tensors out of the disk cache"""
+    bt = CongressionalBacktester(initial_capital=50000, price_provider=provider, vectorized=vectorized)
+    bt.FORWARD_CACHE_DIR = None
+    return bt
+
+
+def write_results(cases: List[BenchmarkCase], path: str = RESULTS_PATH) -> Dict:
+    """Append one JSON line for this run (version, environment and every case) to `path`"""
+    entry = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'version': __version__,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'cases': [asdict(case) for case in cases],
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def print_results(cases: List[BenchmarkCase]):
+    print("\n" + "=" * 100)
+    print("BACKTEST BENCHMARKS")
+    print("=" * 100)
+    print(f"{'Case':<25} {'Trades':>9} {'Seconds':>10} {'Trades/s':>14} {'Peak MB':>10}")
+    print("-" * 100)
+    for c in cases:
+        print(f"{c.name:<25} {c.trades:>9} {c.seconds:>10.4f} {c.trades_per_second:>14,.0f} "
+              f"{c.peak_memory_mb:>10.1f}")
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backtest performance benchmarks on synthetic data")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Synthetic dataset sizes in trades')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed runs per case (best is kept)')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic data seed')
+    parser.add_argument('--loop-max-trades', type=int, default=LOOP_MAX_TRADES,
+                        help='Largest size to time the per-trade loop engine at')
+    parser.add_argument('--output', default=RESULTS_PATH, help='JSON-lines results file to append to')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    results = run_benchmarks(args.sizes, args.repeats, args.seed, args.loop_max_trades,
+                             on_case=lambda c: print(f"{c.name} @ {c.trades}: {c.seconds:.4f}s"))
+    print_results(results)
+    write_results(results, args.output)
+    print(f"Results appended to {args.output}")
@@ -296,6 +296,92 @@ def run_trading():
         traceback.print_exc()
 
 
+def get_database_path(config):
+    """Resolve the trading database path from config."""
+    return (config or {}).get('database', {}).get('path', 'data/trading.db')
+
+
+def run_export(args):
+    """Stream database tables to NDJSON/CSV/Parquet/Arrow files."""
+    config = load_config()
+    if config is None:
+        return
+
+    from clawback.database import TradingDatabase
+
+    db = TradingDatabase(get_database_path(config))
+    tables = args.tables.split(',') if args.tables else None
+
+    try:
+        written = db.export_tables(args.output, fmt=args.format, tables=tables,
+                                   since=args.since, until=args.until,
+                                   from_snapshot=args.from_snapshot)
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ Export failed: {e}")
+        return
+
+    print(f"\n✅ Exported {len(written)} table(s) as {args.format}:")
+    for table, path in written.items():
+        print(f"   {table}: {path}")
+
+
+def run_archive(args):
+    """Compress legacy raw_data and move old processed trades to the archive database."""
+    config = load_config()
+    if config is None:
+        return
+
+    from clawback.database import TradingDatabase
+
+    db_config = config.get('database', {})
+    db = TradingDatabase(get_database_path(config), archive_path=db_config.get('archivePath'))
+    days = args.days if args.days is not None else db_config.get('archiveAfterDays', 365)
+
+    compressed = db.compress_legacy_raw_data()
+    archived = db.archive_old_trades(older_than_days=days)
+    db.prune_changes()
+    if compressed or archived:
+        db.vacuum()
+
+    print(f"\n✅ Compressed {compressed} legacy rows, archived {archived} trades older than {days} days")
+    print(f"   Archive: {db.archive_path}")
+
+
+def run_search(args):
+    """Full-text search over congressional trades"""
+    config = load_config()
+    if config is None:
+        return
+
+    query = ' '.join(args.query)
+    if not query:
+        print("❌ Usage: clawback search <words...>")
+        return
+
+    from clawback.database import TradingDatabase
+
+    db = TradingDatabase(get_database_path(config))
+    trades = db.search_trades(query, limit=args.limit)
+
+    print(f"\n🔎 {len(trades)} trade(s) matching '{query}':")
+    for trade in trades:
+        print(f"   {trade.get('disclosure_date') or '':<10}  {trade.get('ticker') or '':<6}  "
+              f"{trade.get('transaction_type') or '':<8}  {trade.get('amount_range') or '':<22}  "
+              f"{trade.get('representative') or ''} - {trade.get('asset_name') or ''}")
+
+
+def run_snapshot():
+    """Write a consistent read-only copy of the database for reporting"""
+    config = load_config()
+    if config is None:
+        return
+
+    from clawback.database import create_snapshot
+
+    path = create_snapshot(get_database_path(config))
+    print(f"\n✅ Snapshot written to {path}")
+
+
 def run_daemon():
     """Run as daemon."""
     print("\n👻 STARTING DAEMON MODE")
@@ -315,6 +401,13 @@ Examples:
   clawback status         Check system status
   clawback run            Start trading bot
   clawback daemon         Run in background mode
+  clawback export --format csv --since 2026-01-01
+                          Export database tables
+  clawback archive --days 365
+                          Move old processed trades to the archive database
+  clawback snapshot       Write a read-only reporting copy of the database
+  clawback search alphabet class a
+                          Find trades by asset name, representative or ticker
         """
     )
 
@@ -322,11 +415,35 @@ Examples:
         'command',
         nargs='?',
         default='status',
-        choices=['setup', 'status', 'run', 'daemon', 'help'],
+        choices=['setup', 'status', 'run', 'daemon', 'export', 'archive', 'snapshot', 'search', 'help'],
         help='Command to execute'
     )
+    search_group = parser.add_argument_group('search options')
+    search_group.add_argument('query', nargs='*', help='Search words (search command only)')
+    search_group.add_argument('--limit', type=int, default=50, help='Maximum search results')
+
+    export_group = parser.add_argument_group('export options')
+    export_group.add_argument('--format', default='ndjson',
+                              choices=['ndjson', 'csv', 'parquet', 'arrow'],
+                              help='Export file format (parquet/arrow need pyarrow)')
+    export_group.add_argument('--output', default='data/export',
+                              help='Directory to write one file per table into')
+    export_group.add_argument('--tables', help='Comma-separated tables to export (default: all)')
+    export_group.add_argument('--since', help='Only rows on or after this date (YYYY-MM-DD)')
+    export_group.add_argument('--until', help='Only rows before this date (YYYY-MM-DD)')
+    export_group.add_argument('--from-snapshot', action='store_true',
+                              help='Read from a fresh snapshot instead of the live database')
+
+    archive_group = parser.add_argument_group('archive options')
+    archive_group.add_argument('--days', type=int,
+                               help='Archive processed trades older than N days (default: database.archiveAfterDays or 365)')
 
     args = parser.parse_args()
+    if args.query and args.command != 'search':
+        parser.error(f"unexpected arguments for '{args.command}': {' '.join(args.query)}")
+
+    from clawback.database import install_signal_handlers
+    install_signal_handlers()
 
     if args.command == 'setup':
         setup_wizard()
@@ -336,6 +453,14 @@ Examples:
         run_trading()
     elif args.command == 'daemon':
         run_daemon()
+    elif args.command == 'export':
+        run_export(args)
+    elif args.command == 'archive':
+        run_archive(args)
+    elif args.command == 'snapshot':
+        run_snapshot()
+    elif args.command == 'search':
+        run_search(args)
     elif args.command == 'help':
         parser.print_help()
     else:
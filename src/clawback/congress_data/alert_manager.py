@@ -11,66 +11,56 @@ from email.mime.text import MIMEText
 
 import requests
 
+try:
+    from ..database import get_database
+except ImportError:
+    # Loaded as top-level congress_data package (see congress_data/main.py); use the
+    # installed package so there is one database module, singleton and write lock
+    from clawback.database import get_database
+
 logger = logging.getLogger(__name__)
 
 class AlertManager:
     """Manages alerts for congressional trades"""
 
-    def __init__(self, config):
+    def __init__(self, config, db=None):
         self.config = config
         self.alert_config = config.get_alert_config()
         self.storage_config = config.get_storage_config()
 
         # Alert history tracking
+        self.db = db if db is not None else get_database(config.get_database_path())
         self.sent_alerts = set()
         self.load_alert_history()
 
         logger.info("Alert manager initialized")
 
     def load_alert_history(self):
-        """Load previously sent alerts"""
+        """Load previously sent alerts, importing a legacy alert_history.json first"""
         try:
             data_dir = self.storage_config.get("data_directory", "data/congress_trades")
             history_file = os.path.join(data_dir, "alert_history.json")
+            self.db.import_json_file(history_file, lambda history: self.db.mark_seen_many(
+                "alert_history", history.get("sent_alerts", [])))
+
+            # Only keep recent alerts (last 30 days) in memory
+            cutoff_date = datetime.now() - timedelta(days=30)
+            self.sent_alerts = {
+                alert_id for alert_id in self.db.get_seen("alert_history")
+                if self.parse_alert_date(alert_id) > cutoff_date
+            }
 
-            if os.path.exists(history_file):
-                with open(history_file) as f:
-                    history = json.load(f)
-
-                # Convert list to set for faster lookups
-                self.sent_alerts = set(history.get("sent_alerts", []))
-
-                # Clean old alerts (older than 30 days)
-                cutoff_date = datetime.now() - timedelta(days=30)
-                self.sent_alerts = {
-                    alert_id for alert_id in self.sent_alerts
-                    if self.parse_alert_date(alert_id) > cutoff_date
-                }
-
-                logger.info(f"Loaded {len(self.sent_alerts)} recent alerts from history")
+            logger.info(f"Loaded {len(self.sent_alerts)} recent alerts from history")
 
         except Exception as e:
             logger.error(f"Error loading alert history: {e}")
             self.sent_alerts = set()
 
-    def save_alert_history(self):
-        """Save alert history to file"""
+    def record_alert(self, alert_id):
+        """Mark an alert as sent (single-row write)"""
+        self.sent_alerts.add(alert_id)
         try:
-            data_dir = self.storage_config.get("data_directory", "data/congress_trades")
-            os.makedirs(data_dir, exist_ok=True)
-
-            history_file = os.path.join(data_dir, "alert_history.json")
-
-            history = {
-                "sent_alerts": list(self.sent_alerts),
-                "last_updated": datetime.now().isoformat()
-            }
-
-            with open(history_file, 'w') as f:
-                json.dump(history, f, indent=2)
-
-            logger.debug(f"Saved alert history with {len(self.sent_alerts)} alerts")
-
+            self.db.mark_seen("alert_history", alert_id)
         except Exception as e:
             logger.error(f"Error saving alert history: {e}")
 
@@ -326,7 +316,7 @@ This trade exceeds the alert threshold of ${self.alert_config.get('minimum_trade
 
                     if sent:
                         # Mark as sent
-                        self.sent_alerts.add(alert_id)
+                        self.record_alert(alert_id)
                         alerts_sent.append(trade)
 
                         logger.info(f"Alert sent for {trade.get('politician')} - {trade.get('ticker')}")
@@ -335,10 +325,6 @@ This trade exceeds the alert threshold of ${self.alert_config.get('minimum_trade
                 logger.error(f"Error processing alert for trade: {e}")
                 continue
 
-        # Save updated alert history
-        if alerts_sent:
-            self.save_alert_history()
-
         logger.info(f"Sent {len(alerts_sent)} alerts")
         return alerts_sent
 
@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ..broker_adapter import get_broker_adapter
+from ..database import get_database
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,7 @@ def get_local_timestamp():
 class BrokerIntegration:
     """Integrates congressional trade alerts with broker trading bot (adapter pattern)"""
 
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, db=None):
         self.config_path = config_path or "../config/config.json"
         self.congress_config_path = "../config/congress_config.json"
 
@@ -39,6 +40,8 @@ class BrokerIntegration:
         self.notifications_dir.mkdir(parents=True, exist_ok=True)
 
         # Integration state
+        self.db = db if db is not None else get_database(
+            self.config.get('database', {}).get('path', 'data/trading.db'))
         self.processed_alerts = set()
         self.load_processed_alerts()
 
@@ -72,43 +75,32 @@ class BrokerIntegration:
             return {}
 
     def load_processed_alerts(self):
-        """Load previously processed alerts"""
+        """Load previously processed alerts, importing a legacy processed_alerts.json first"""
         try:
             state_file = self.notifications_dir / "processed_alerts.json"
-            if state_file.exists():
-                with open(state_file) as f:
-                    data = json.load(f)
-                    self.processed_alerts = set(data.get("processed_alerts", []))
-
-                # Clean old entries (older than 30 days)
-                cutoff_date = datetime.now() - timedelta(days=30)
-                self.processed_alerts = {
-                    alert_id for alert_id in self.processed_alerts
-                    if self.parse_alert_date(alert_id) > cutoff_date
-                }
+            self.db.import_json_file(state_file, lambda data: self.db.mark_seen_many(
+                "processed_alerts", data.get("processed_alerts", [])))
+
+            # Only keep recent entries (last 30 days) in memory
+            cutoff_date = datetime.now() - timedelta(days=30)
+            self.processed_alerts = {
+                alert_id for alert_id in self.db.get_seen("processed_alerts")
+                if self.parse_alert_date(alert_id) > cutoff_date
+            }
 
-                logger.info(f"Loaded {len(self.processed_alerts)} processed alerts")
+            logger.info(f"Loaded {len(self.processed_alerts)} processed alerts")
 
         except Exception as e:
             logger.error(f"Error loading processed alerts: {e}")
             self.processed_alerts = set()
 
-    def save_processed_alerts(self):
-        """Save processed alerts to file"""
+    def mark_alert_processed(self, alert_id):
+        """Mark an alert as processed (single-row write)"""
+        self.processed_alerts.add(alert_id)
         try:
-            state_file = self.notifications_dir / "processed_alerts.json"
-            data = {
-                "processed_alerts": list(self.processed_alerts),
-                "last_updated": datetime.now().astimezone().isoformat()
-            }
-
-            with open(state_file, 'w') as f:
-                json.dump(data, f, indent=2)
-
-            logger.debug(f"Saved {len(self.processed_alerts)} processed alerts")
-
+            self.db.mark_seen("processed_alerts", alert_id)
         except Exception as e:
-            logger.error(f"Error saving processed alerts: {e}")
+            logger.error(f"Error saving processed alert: {e}")
 
     def parse_alert_date(self, alert_id):
         """Parse date from alert ID"""
@@ -218,8 +210,7 @@ class BrokerIntegration:
             self.save_trading_recommendation(recommendation)
 
             # Mark as processed
-            self.processed_alerts.add(alert_id)
-            self.save_processed_alerts()
+            self.mark_alert_processed(alert_id)
 
             logger.info(f"Created trading recommendation for {ticker}: {action}")
             return True
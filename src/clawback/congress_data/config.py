@@ -52,7 +52,9 @@ class CongressConfig:
             "data_directory": "data/congress_trades",
             "max_days_to_keep": 90,
             "backup_enabled": True,
-            "backup_directory": "data/backups"
+            "backup_directory": "data/backups",
+            # Same file as the trading bot's database.path
+            "database_path": "data/trading.db"
         },
         "cron": {
             "enabled": True,
@@ -126,6 +128,10 @@ class CongressConfig:
         """Get storage configuration"""
         return self.config.get("storage", {})
 
+    def get_database_path(self):
+        """Get the trading database path shared with the bot"""
+        return self.get_storage_config().get("database_path", "data/trading.db")
+
     def get_cron_config(self):
         """Get cron job configuration"""
         return self.config.get("cron", {})
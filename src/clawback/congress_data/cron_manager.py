@@ -1,7 +1,6 @@
 """
 Cron job manager for congressional trade data collection
 """
-import json
 import logging
 import os
 import threading
@@ -10,12 +9,19 @@ from datetime import datetime, timedelta
 
 import schedule
 
+try:
+    from ..database import get_database
+except ImportError:
+    # Loaded as top-level congress_data package (see congress_data/main.py); use the
+    # installed package so there is one database module, singleton and write lock
+    from clawback.database import get_database
+
 logger = logging.getLogger(__name__)
 
 class CronManager:
     """Manages scheduled congressional trade data collection"""
 
-    def __init__(self, data_collector, alert_manager, config):
+    def __init__(self, data_collector, alert_manager, config, db=None):
         self.data_collector = data_collector
         self.alert_manager = alert_manager
         self.config = config
@@ -26,7 +32,8 @@ class CronManager:
         self.is_running = False
         self.thread = None
 
-        # Execution tracking
+        # Execution tracking (persisted in the database's event log)
+        self.db = db if db is not None else get_database(config.get_database_path())
         self.execution_history = []
         self.history_file = "data/cron_history.json"
 
@@ -36,19 +43,20 @@ class CronManager:
         logger.info("Cron manager initialized")
 
     def load_history(self):
-        """Load execution history from file"""
+        """Load recent execution history, importing a legacy cron_history.json first"""
         try:
-            with open(self.history_file) as f:
-                self.execution_history = json.load(f)
+            self.db.import_json_file(self.history_file,
+                                     lambda history: self.db.append_events("cron_history", history))
+            self.execution_history = self.db.get_events("cron_history", limit=100)
             logger.info(f"Loaded {len(self.execution_history)} previous executions")
-        except (FileNotFoundError, json.JSONDecodeError):
+        except Exception as e:
+            logger.error(f"Error loading execution history: {e}")
             self.execution_history = []
 
-    def save_history(self):
-        """Save execution history to file"""
+    def save_execution(self, execution_record):
+        """Append one execution record (single-row write)"""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.execution_history, f, indent=2)
+            self.db.append_event("cron_history", execution_record)
         except Exception as e:
             logger.error(f"Error saving execution history: {e}")
 
@@ -97,13 +105,12 @@ class CronManager:
 
             # Save execution record
             self.execution_history.append(execution_record)
+            self.save_execution(execution_record)
 
-            # Keep only recent history (last 100 executions)
+            # Keep only recent history (last 100 executions) in memory
             if len(self.execution_history) > 100:
                 self.execution_history = self.execution_history[-100:]
 
-            self.save_history()
-
         except Exception as e:
             logger.error(f"Error in job function: {e}")
 
@@ -10,16 +10,25 @@ from datetime import datetime, timedelta
 
 import schedule
 
+try:
+    from ..database import get_database
+except ImportError:
+    # Loaded as top-level congress_data package (see congress_data/main.py); use the
+    # installed package so there is one database module, singleton and write lock
+    from clawback.database import get_database
+
 logger = logging.getLogger(__name__)
 
 class CongressCronScheduler:
     """Schedules and manages cron jobs for congressional data collection"""
 
-    def __init__(self, config, data_collector, alert_manager):
+    def __init__(self, config, data_collector, alert_manager, db=None):
         self.config = config
         self.data_collector = data_collector
         self.alert_manager = alert_manager
         self.cron_config = config.get_cron_config()
+        self.db = db if db is not None else get_database(config.get_database_path())
+        self.import_run_logs()
 
         # Scheduler state
         self.scheduler = schedule.Scheduler()
@@ -133,42 +142,31 @@ class CongressCronScheduler:
                 "error": str(e)
             }
 
-    def save_run_log(self, log_data):
-        """Save run log to file"""
-        try:
-            data_dir = self.config.get_storage_config().get("data_directory", "data/congress_trades")
-            logs_dir = os.path.join(data_dir, "logs")
-            os.makedirs(logs_dir, exist_ok=True)
-
-            # Daily log file
-            date_str = datetime.now().strftime("%Y%m%d")
-            log_file = os.path.join(logs_dir, f"runs_{date_str}.json")
-
-            # Load existing logs or create new list
-            logs = []
-            if os.path.exists(log_file):
-                try:
-                    with open(log_file) as f:
-                        logs = json.load(f)
-                except json.JSONDecodeError:
-                    logs = []
+    def import_run_logs(self):
+        """Import legacy daily runs_*.json log files into the database"""
+        data_dir = self.config.get_storage_config().get("data_directory", "data/congress_trades")
+        logs_dir = os.path.join(data_dir, "logs")
+        if not os.path.isdir(logs_dir):
+            return
 
-            # Add new log
-            logs.append(log_data)
+        for filename in sorted(os.listdir(logs_dir)):
+            if filename.startswith("runs_") and filename.endswith(".json"):
+                self.db.import_json_file(os.path.join(logs_dir, filename),
+                                         lambda logs: self.db.append_events("scheduler_runs", logs))
 
-            # Keep only last 100 logs per day
-            if len(logs) > 100:
-                logs = logs[-100:]
-
-            # Save
-            with open(log_file, 'w') as f:
-                json.dump(logs, f, indent=2)
-
-            logger.debug(f"Run log saved to {log_file}")
+    def save_run_log(self, log_data):
+        """Append a run log record (single-row write)"""
+        try:
+            self.db.append_event("scheduler_runs", log_data)
+            logger.debug("Run log saved")
 
         except Exception as e:
             logger.error(f"Error saving run log: {e}")
 
+    def get_run_logs(self, limit=100):
+        """Get the most recent run log records"""
+        return self.db.get_events("scheduler_runs", limit=limit)
+
     def run_scheduler(self):
         """Run the scheduler in a separate thread"""
         logger.info("Starting congressional cron scheduler")
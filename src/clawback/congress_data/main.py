@@ -78,7 +78,8 @@ class CongressDataApp:
             # Initialize components
             self.data_collector = CongressDataCollector(self.config)
             self.alert_manager = AlertManager(self.config)
-            self.scheduler = CongressCronScheduler(self.config, self.data_collector, self.alert_manager)
+            self.scheduler = CongressCronScheduler(self.config, self.data_collector, self.alert_manager,
+                                                   db=self.alert_manager.db)
 
             logger.info("Congressional data application initialized")
             return True
@@ -1,51 +1,469 @@
 """
 SQLite database for tracking trades, executions, and bot state
 """
+import atexit
+import copy
+import csv
 import json
 import logging
+import os
+import queue
+import signal
 import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Optional columnar export support (Parquet / Arrow IPC)
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Optional zstd compression for congressional_trades.raw_data (zlib otherwise)
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# How long a connection waits on a lock held by another connection before
+# raising "database is locked"
+BUSY_TIMEOUT = 30.0
+
 # Path to seed data (relative to project root)
 SEED_DATA_PATH = Path(__file__).parent.parent / "data" / "seed" / "congressional_trades.json"
 
+# Exportable tables and the timestamp column used for date-range selection.
+# broker_tokens is deliberately excluded so credentials never end up in exports.
+EXPORT_TABLES = {
+    'congressional_trades': 'discovered_at',
+    'executed_trades': 'executed_at',
+    'positions': 'last_updated',
+    'bot_state': 'updated_at',
+    'notifications': 'sent_at',
+    'position_state': 'updated_at',
+    'event_log': 'created_at',
+    'seen_items': 'seen_at',
+}
+
+EXPORT_FORMATS = ('ndjson', 'csv', 'parquet', 'arrow')
+
+# Header bytes identifying how a compressed raw_data blob was encoded.
+# Rows written before compression was introduced are plain TEXT.
+RAW_ZLIB_PREFIX = b'zl:'
+RAW_ZSTD_PREFIX = b'zs:'
+
+# Full-text index over the searchable congressional_trades columns. It is an
+# external-content table (no duplicated text), kept in sync by triggers.
+TRADES_FTS_DDL = """
+    CREATE VIRTUAL TABLE congressional_trades_fts USING fts5(
+        asset_name, representative, ticker, amount_range,
+        content='congressional_trades', content_rowid='id', prefix='2 3'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS congressional_trades_fts_insert
+    AFTER INSERT ON congressional_trades BEGIN
+        INSERT INTO congressional_trades_fts (rowid, asset_name, representative, ticker, amount_range)
+        VALUES (new.id, new.asset_name, new.representative, new.ticker, new.amount_range);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS congressional_trades_fts_delete
+    AFTER DELETE ON congressional_trades BEGIN
+        INSERT INTO congressional_trades_fts
+            (congressional_trades_fts, rowid, asset_name, representative, ticker, amount_range)
+        VALUES ('delete', old.id, old.asset_name, old.representative, old.ticker, old.amount_range);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS congressional_trades_fts_update
+    AFTER UPDATE OF asset_name, representative, ticker, amount_range ON congressional_trades BEGIN
+        INSERT INTO congressional_trades_fts
+            (congressional_trades_fts, rowid, asset_name, representative, ticker, amount_range)
+        VALUES ('delete', old.id, old.asset_name, old.representative, old.ticker, old.amount_range);
+        INSERT INTO congressional_trades_fts (rowid, asset_name, representative, ticker, amount_range)
+        VALUES (new.id, new.asset_name, new.representative, new.ticker, new.amount_range);
+    END;
+
+    INSERT INTO congressional_trades_fts (congressional_trades_fts) VALUES ('rebuild');
+"""
+
+# Shared by the hot table and the archive database
+CONGRESSIONAL_TRADES_DDL = """
+    CREATE TABLE IF NOT EXISTS {schema}congressional_trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trade_hash TEXT UNIQUE NOT NULL,
+        ticker TEXT NOT NULL,
+        transaction_type TEXT NOT NULL,
+        amount REAL,
+        amount_range TEXT,
+        transaction_date TEXT,
+        disclosure_date TEXT,
+        representative TEXT,
+        chamber TEXT,
+        source TEXT,
+        report_url TEXT,
+        asset_name TEXT,
+        raw_data TEXT,
+        discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        processed INTEGER DEFAULT 0
+    );
+"""
+
+
+def connect(db_path):
+    """Open a connection that waits up to BUSY_TIMEOUT for locks instead of failing"""
+    return sqlite3.connect(db_path, timeout=BUSY_TIMEOUT)
+
+
+def archive_path_for(db_path):
+    """Default archive database path: data/trading.db -> data/trading_archive.db"""
+    path = Path(db_path)
+    return str(path.with_name(f"{path.stem}_archive{path.suffix or '.db'}"))
+
+
+def snapshot_path_for(db_path):
+    """Default snapshot path: data/trading.db -> data/trading_snapshot.db"""
+    path = Path(db_path)
+    return str(path.with_name(f"{path.stem}_snapshot{path.suffix or '.db'}"))
+
+
+def create_snapshot(db_path, dest=None):
+    """
+    Copy a live database to a consistent point-in-time snapshot file
+
+    Uses the sqlite3 online backup API into a temporary file which then
+    replaces the previous snapshot, so readers never see a half-written copy.
+    The temporary file is unique, so concurrent snapshots of one path don't
+    write into each other's copy.
+    """
+    dest = dest or snapshot_path_for(db_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(dest)}.",
+                                    suffix='.tmp', dir=os.path.dirname(os.path.abspath(dest)))
+    os.close(fd)
+
+    try:
+        source = connect(db_path)
+        target = sqlite3.connect(tmp_path)
+        try:
+            source.backup(target)
+            # Readers open the copy read-only, which a WAL-mode file doesn't allow
+            target.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            target.close()
+            source.close()
+        os.replace(tmp_path, dest)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    logger.info(f"Snapshot of {db_path} written to {dest}")
+    return dest
+
+
+def refresh_snapshot(db_path, max_age=300, dest=None):
+    """Return a snapshot path, re-creating it if missing or older than max_age seconds"""
+    dest = dest or snapshot_path_for(db_path)
+    try:
+        age = time.time() - os.path.getmtime(dest)
+    except OSError:
+        age = None
+    if age is None or age > max_age:
+        create_snapshot(db_path, dest)
+    return dest
+
+
+def connect_readonly(db_path):
+    """Open a read-only connection (used for snapshot files)"""
+    return sqlite3.connect(f"file:{Path(db_path).resolve()}?mode=ro", uri=True, timeout=BUSY_TIMEOUT)
+
+
+def compress_raw_data(text):
+    """Compress a raw_data JSON string (zstd when available, zlib otherwise)"""
+    data = text.encode('utf-8')
+    if HAS_ZSTD:
+        return RAW_ZSTD_PREFIX + zstandard.ZstdCompressor(level=9).compress(data)
+    return RAW_ZLIB_PREFIX + zlib.compress(data, 9)
+
+
+def decompress_raw_data(value):
+    """Decode a stored raw_data value back to its JSON string (legacy TEXT passes through)"""
+    if not isinstance(value, bytes):
+        return value
+    if value.startswith(RAW_ZLIB_PREFIX):
+        return zlib.decompress(value[len(RAW_ZLIB_PREFIX):]).decode('utf-8')
+    if value.startswith(RAW_ZSTD_PREFIX):
+        if not HAS_ZSTD:
+            raise RuntimeError("raw_data is zstd-compressed - run: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(value[len(RAW_ZSTD_PREFIX):]).decode('utf-8')
+    return value.decode('utf-8')
+
+
+def _trade_row(row):
+    """Convert a congressional_trades row to a dict with raw_data decompressed"""
+    trade = dict(row)
+    if 'raw_data' in trade:
+        trade['raw_data'] = decompress_raw_data(trade['raw_data'])
+    return trade
+
+
+# Open write-behind queues, flushed by _flush_queues_on_signal before the process dies
+_open_queues = weakref.WeakSet()
+# Signal handlers that were installed before ours, chained after flushing
+_previous_handlers = {}
+
+# Seconds a signal handler waits for each queue to flush (the main thread may hold the write lock)
+SIGNAL_FLUSH_TIMEOUT = 5
+
+
+def _flush_queues_on_signal(signum, frame):
+    """Flush every open write-behind queue, then defer to the previous handler"""
+    for writer in list(_open_queues):
+        writer.flush(SIGNAL_FLUSH_TIMEOUT)
+    previous = _previous_handlers.get(signum)
+    if callable(previous):
+        # e.g. SIGINT's default_int_handler: the KeyboardInterrupt may be caught, so
+        # queues stay open for the rest of the run
+        previous(signum, frame)
+    elif previous != signal.SIG_IGN:
+        # Default action: terminate as if our handler had never been installed
+        signal.signal(signum, signal.SIG_DFL)
+        os.kill(os.getpid(), signum)
+
+
+def install_signal_handlers():
+    """
+    Flush write-behind queues on SIGTERM/SIGINT before the previous handler runs
+
+    For entry points (main thread only; repeated calls are no-ops). Libraries
+    creating a TradingDatabase don't install process-wide handlers themselves.
+    """
+    if _previous_handlers or threading.current_thread() is not threading.main_thread():
+        return
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            _previous_handlers[signum] = signal.signal(signum, _flush_queues_on_signal)
+        except (ValueError, OSError) as e:
+            logger.debug(f"Could not install handler for signal {signum}: {e}")
+
+
+class WriteBehindQueue:
+    """
+    Background writer for low-criticality statements
+
+    Statements are queued by the caller and committed by a dedicated thread in
+    batched transactions, so the trading loop never waits on connect/commit.
+    Anything still queued is flushed on close(), at interpreter exit, and on
+    SIGTERM/SIGINT once install_signal_handlers() has been called.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path, flush_interval=1.0, max_batch=500, max_retries=3,
+                 write_lock=None):
+        self.db_path = db_path
+        self.write_lock = write_lock or threading.RLock()
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        _open_queues.add(self)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def submit(self, sql, params=(), on_commit=None, on_drop=None):
+        """
+        Queue a statement; on_commit is called from the writer thread once it is
+        durable (still under write_lock), on_drop if its batch is given up on
+        after a failed write
+        """
+        if self._closed:
+            raise RuntimeError("Write-behind queue is closed")
+        self._queue.put((sql, params, on_commit, on_drop))
+
+    def flush(self, timeout=None):
+        """Block until every statement queued so far has been committed"""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=10):
+        """Flush pending writes and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+        _open_queues.discard(self)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch and not self._is_marker(batch[-1]):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            statements = [item for item in batch if isinstance(item, tuple)]
+            if statements:
+                self._commit(statements)
+
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if batch[-1] is self._STOP:
+                return
+
+    def _is_marker(self, item):
+        return item is self._STOP or isinstance(item, threading.Event)
+
+    def _commit(self, statements):
+        """Write a batch in one transaction, retrying on transient lock errors"""
+        for attempt in range(1, self.max_retries + 1):
+            with self.write_lock:
+                try:
+                    conn = connect(self.db_path)
+                    try:
+                        with conn:
+                            for sql, params, _, _ in statements:
+                                conn.execute(sql, params)
+                    finally:
+                        conn.close()
+                except Exception as e:
+                    error = e
+                else:
+                    for _, _, on_commit, _ in statements:
+                        if on_commit:
+                            on_commit()
+                    return
+            if not isinstance(error, sqlite3.OperationalError) or attempt == self.max_retries:
+                self._drop(statements, error)
+                return
+            time.sleep(0.1 * attempt)
+
+    def _drop(self, statements, error):
+        logger.error(f"Dropped {len(statements)} write-behind statements: {error}")
+        for _, _, _, on_drop in statements:
+            if on_drop:
+                on_drop()
+
 
 class TradingDatabase:
     """SQLite database for persistent state management"""
 
-    def __init__(self, db_path="data/trading.db"):
+    # Snapshots older than this (seconds) are refreshed before reporting reads
+    SNAPSHOT_MAX_AGE = 300
+
+    def __init__(self, db_path="data/trading.db", write_behind=True, archive_path=None,
+                 snapshot_path=None):
         self.db_path = db_path
+        self.archive_path = archive_path or archive_path_for(db_path)
+        self.snapshot_path = snapshot_path or snapshot_path_for(db_path)
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Writes from every thread (including the write-behind thread) are
+        # serialized on this lock; reads take no lock and run concurrently under WAL.
+        self._write_lock = threading.RLock()
         self._init_db()
         self._load_seed_data_if_empty()
+
+        # Non-critical writes (state, notifications, token timestamps) go through
+        # the write-behind queue; order-path writes stay synchronous.
+        self._writer = WriteBehindQueue(db_path, write_lock=self._write_lock) if write_behind else None
+
+        # Write-through cache of bot_state; _pending_state holds serialized values
+        # still in the write-behind queue so a reload never loses them.
+        self._state_lock = threading.Lock()
+        self._state_cache = {}
+        self._pending_state = {}
+        self._state_version = None
+        self._state_checked_at = 0.0
+        # Our own set_state commits since _state_version was read; each bumps it by one
+        self._own_state_commits = 0
+        self._reload_state_cache()
         logger.info(f"Initialized database at {db_path}")
 
+    def _write(self, sql, params=(), on_commit=None, on_drop=None):
+        """Execute a low-criticality write, deferred when write-behind is enabled"""
+        if self._writer is not None and not self._writer.closed:
+            self._writer.submit(sql, params, on_commit, on_drop)
+            return
+        # No queue, or it was closed (shutdown in progress): write synchronously
+        with self._writing() as conn:
+            conn.execute(sql, params)
+            conn.commit()
+            if on_commit:
+                on_commit()
+
+    @contextmanager
+    def _writing(self):
+        """Serialized write connection, committed (or rolled back) and closed on exit"""
+        with self._write_lock:
+            conn = connect(self.db_path)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    @contextmanager
+    def _reading(self, snapshot=None):
+        """Lock-free read connection on the live database, or on a snapshot file if given"""
+        conn = connect_readonly(snapshot) if snapshot else connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def flush(self, timeout=None):
+        """Wait for queued write-behind statements to be committed"""
+        if self._writer is not None:
+            return self._writer.flush(timeout)
+        return True
+
+    def close(self):
+        """Flush pending writes and stop the background writer"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
     def _init_db(self):
         """Initialize database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writing() as conn:
+            # WAL lets readers run alongside the single writer (persists in the file)
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            # Discovered congressional trades
+            conn.executescript(CONGRESSIONAL_TRADES_DDL.format(schema=''))
             conn.executescript("""
-                -- Discovered congressional trades
-                CREATE TABLE IF NOT EXISTS congressional_trades (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    trade_hash TEXT UNIQUE NOT NULL,
-                    ticker TEXT NOT NULL,
-                    transaction_type TEXT NOT NULL,
-                    amount REAL,
-                    amount_range TEXT,
-                    transaction_date TEXT,
-                    disclosure_date TEXT,
-                    representative TEXT,
-                    chamber TEXT,
-                    source TEXT,
-                    report_url TEXT,
-                    asset_name TEXT,
-                    raw_data TEXT,
-                    discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    processed INTEGER DEFAULT 0
-                );
+                -- Hashes of trades moved to the archive database, so re-fetched
+                -- old disclosures are not inserted (and traded) again
+                CREATE TABLE IF NOT EXISTS archived_trade_hashes (
+                    trade_hash TEXT PRIMARY KEY
+                ) WITHOUT ROWID;
 
                 -- Our executed trades
                 CREATE TABLE IF NOT EXISTS executed_trades (
@@ -80,6 +498,21 @@ class TradingDatabase:
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
+                -- Bumped on every bot_state change so in-memory caches in other
+                -- processes can tell when to reload
+                CREATE TABLE IF NOT EXISTS bot_state_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO bot_state_version (id, version) VALUES (1, 0);
+
+                CREATE TRIGGER IF NOT EXISTS bot_state_version_insert AFTER INSERT ON bot_state
+                BEGIN UPDATE bot_state_version SET version = version + 1 WHERE id = 1; END;
+                CREATE TRIGGER IF NOT EXISTS bot_state_version_update AFTER UPDATE ON bot_state
+                BEGIN UPDATE bot_state_version SET version = version + 1 WHERE id = 1; END;
+                CREATE TRIGGER IF NOT EXISTS bot_state_version_delete AFTER DELETE ON bot_state
+                BEGIN UPDATE bot_state_version SET version = version + 1 WHERE id = 1; END;
+
                 -- Notifications sent
                 CREATE TABLE IF NOT EXISTS notifications (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -105,18 +538,83 @@ class TradingDatabase:
                     UNIQUE(broker, account_id)
                 );
 
+                -- Open positions tracked by the trade engine (stop-loss state)
+                CREATE TABLE IF NOT EXISTS position_state (
+                    symbol TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                -- Append-only history streams (trade history, integration/cron runs)
+                CREATE TABLE IF NOT EXISTS event_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    stream TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                -- Alert/trade ids already handled, for de-duplication
+                CREATE TABLE IF NOT EXISTS seen_items (
+                    namespace TEXT NOT NULL,
+                    item_id TEXT NOT NULL,
+                    seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (namespace, item_id)
+                );
+
+                -- Change feed of congressional_trades, written by the triggers below
+                CREATE TABLE IF NOT EXISTS trade_changes (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    trade_id INTEGER NOT NULL,
+                    op TEXT NOT NULL,
+                    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                -- Last change seq each downstream consumer has processed
+                CREATE TABLE IF NOT EXISTS change_consumers (
+                    consumer TEXT PRIMARY KEY,
+                    last_seq INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TRIGGER IF NOT EXISTS trade_changes_insert AFTER INSERT ON congressional_trades
+                BEGIN INSERT INTO trade_changes (trade_id, op) VALUES (new.id, 'insert'); END;
+                CREATE TRIGGER IF NOT EXISTS trade_changes_update AFTER UPDATE ON congressional_trades
+                BEGIN INSERT INTO trade_changes (trade_id, op) VALUES (new.id, 'update'); END;
+                CREATE TRIGGER IF NOT EXISTS trade_changes_delete AFTER DELETE ON congressional_trades
+                BEGIN INSERT INTO trade_changes (trade_id, op) VALUES (old.id, 'delete'); END;
+
                 -- Create indexes for common queries
                 CREATE INDEX IF NOT EXISTS idx_trades_ticker ON congressional_trades(ticker);
                 CREATE INDEX IF NOT EXISTS idx_trades_date ON congressional_trades(disclosure_date);
                 CREATE INDEX IF NOT EXISTS idx_trades_processed ON congressional_trades(processed);
                 CREATE INDEX IF NOT EXISTS idx_executed_ticker ON executed_trades(ticker);
                 CREATE INDEX IF NOT EXISTS idx_tokens_broker ON broker_tokens(broker);
+                CREATE INDEX IF NOT EXISTS idx_event_log_stream ON event_log(stream, id);
+
+                -- Keyset pagination order for the iter_* readers
+                CREATE INDEX IF NOT EXISTS idx_trades_processed_page ON congressional_trades(processed, disclosure_date, id);
+                CREATE INDEX IF NOT EXISTS idx_executed_page ON executed_trades(executed_at, id);
+                CREATE INDEX IF NOT EXISTS idx_notifications_page ON notifications(sent_at, id);
             """)
             conn.commit()
+            self._init_fts(conn)
+
+    def _init_fts(self, conn):
+        """Create and backfill the full-text index on first run (needs SQLite built with FTS5)"""
+        self.has_fts = True
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'congressional_trades_fts'").fetchone():
+            return
+        try:
+            conn.executescript(f"BEGIN; {TRADES_FTS_DDL} COMMIT;")
+            logger.info("Built full-text index over congressional_trades")
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            self.has_fts = False
+            logger.warning(f"Full-text search unavailable, falling back to LIKE scans: {e}")
 
     def _load_seed_data_if_empty(self):
         """Load seed congressional trades if database is empty"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._reading() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM congressional_trades")
             count = cursor.fetchone()[0]
 
@@ -158,7 +656,12 @@ class TradingDatabase:
         """Add a discovered congressional trade (if not duplicate)"""
         trade_hash = self._generate_trade_hash(trade)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writing() as conn:
+            if conn.execute("SELECT 1 FROM archived_trade_hashes WHERE trade_hash = ?",
+                            (trade_hash,)).fetchone():
+                logger.debug(f"Trade already archived: {trade.get('ticker')}")
+                return False
+
             try:
                 # Serialize trade to JSON, handling datetime objects
                 trade_copy = trade.copy()
@@ -184,7 +687,7 @@ class TradingDatabase:
                     trade.get('source', ''),
                     trade.get('report_url', trade.get('pdf_url', '')),
                     trade.get('asset_name', ''),
-                    json.dumps(trade_copy, default=str)
+                    compress_raw_data(json.dumps(trade_copy, default=str))
                 ))
                 conn.commit()
                 logger.debug(f"Added trade: {trade.get('ticker')} {trade.get('transaction_type')}")
@@ -194,53 +697,232 @@ class TradingDatabase:
                 logger.debug(f"Trade already exists: {trade.get('ticker')}")
                 return False
 
+    def _iter_keyset(self, columns, from_where, params, sort_key, row_id, page_size=500,
+                     limit=None, transform=dict):
+        """
+        Yield rows newest-first, one bounded page per query
+
+        Pages are keyed on (sort_key, row_id) rather than OFFSET, so with an index
+        on (..., sort_key, row_id) each page is an index range scan and memory stays
+        flat however many rows match. `sort_key` must be a bare indexed column:
+        NULL keys sort last, so they are paged separately on row_id once the
+        non-NULL keys run out. `from_where` must end in a WHERE clause; `sort_key`
+        and `row_id` are selected alongside `columns` and stripped before `transform`.
+        """
+        last_key = None
+        null_phase = False
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page_query = f"SELECT {sort_key} AS _page_key, {row_id} AS _page_id, {columns} {from_where}"
+            page_params = list(params)
+            # Row-value comparison is never true for a NULL key, so keyed pages skip NULL rows
+            skips_nulls = not null_phase and last_key is not None
+            if null_phase:
+                page_query += f" AND {sort_key} IS NULL"
+                if last_key is not None:
+                    page_query += f" AND {row_id} < ?"
+                    page_params.append(last_key[1])
+                page_query += f" ORDER BY {row_id} DESC LIMIT ?"
+            else:
+                if skips_nulls:
+                    page_query += f" AND ({sort_key}, {row_id}) < (?, ?)"
+                    page_params.extend(last_key)
+                page_query += f" ORDER BY {sort_key} DESC, {row_id} DESC LIMIT ?"
+            page_params.append(size)
+
+            with self._reading() as conn:
+                conn.row_factory = sqlite3.Row
+                rows = conn.execute(page_query, page_params).fetchall()
+
+            for row in rows:
+                record = dict(row)
+                del record['_page_key'], record['_page_id']
+                yield transform(record)
+
+            if remaining is not None:
+                remaining -= len(rows)
+            if rows:
+                last_key = (rows[-1]['_page_key'], rows[-1]['_page_id'])
+            if skips_nulls:
+                if len(rows) < size:
+                    null_phase, last_key = True, None
+            elif len(rows) < size:
+                return
+            elif last_key[0] is None:
+                null_phase = True
+
+    def iter_unprocessed_trades(self, page_size=500):
+        """Lazily iterate trades that haven't been executed yet, newest disclosure first"""
+        return self._iter_keyset(
+            "*", "FROM congressional_trades WHERE processed = 0",
+            (), "disclosure_date", "id", page_size, transform=_trade_row)
+
     def get_unprocessed_trades(self):
         """Get trades that haven't been executed yet"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM congressional_trades
-                WHERE processed = 0
-                ORDER BY disclosure_date DESC
-            """)
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_unprocessed_trades())
+
+    def count_unprocessed_trades(self):
+        """Count trades that haven't been executed yet"""
+        with self._reading() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM congressional_trades WHERE processed = 0").fetchone()[0]
 
     def mark_trade_processed(self, trade_id):
         """Mark a congressional trade as processed"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writing() as conn:
             conn.execute(
                 "UPDATE congressional_trades SET processed = 1 WHERE id = ?",
                 (trade_id,)
             )
             conn.commit()
 
+    def iter_recent_trades(self, days=30, page_size=500):
+        """Lazily iterate congressional trades discovered in the last N days"""
+        return self._iter_keyset(
+            "*", "FROM congressional_trades WHERE discovered_at >= datetime('now', ?)",
+            (f'-{days} days',), "disclosure_date", "id", page_size, transform=_trade_row)
+
     def get_recent_trades(self, days=30):
         """Get congressional trades from the last N days"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM congressional_trades
-                WHERE discovered_at >= datetime('now', ?)
-                ORDER BY disclosure_date DESC
-            """, (f'-{days} days',))
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_recent_trades(days))
 
     def trade_exists(self, trade):
-        """Check if a trade already exists in the database"""
+        """Check if a trade already exists in the database (hot table or archive)"""
         trade_hash = self._generate_trade_hash(trade)
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM congressional_trades WHERE trade_hash = ?",
-                (trade_hash,)
-            )
+        with self._reading() as conn:
+            cursor = conn.execute("""
+                SELECT 1 FROM congressional_trades WHERE trade_hash = ?
+                UNION ALL
+                SELECT 1 FROM archived_trade_hashes WHERE trade_hash = ?
+            """, (trade_hash, trade_hash))
             return cursor.fetchone() is not None
 
+    # --- Archive ---
+
+    def compress_legacy_raw_data(self, batch_size=500):
+        """Compress raw_data rows written before compression was introduced"""
+        compressed = 0
+        with self._writing() as conn:
+            while True:
+                rows = conn.execute("""
+                    SELECT id, raw_data FROM congressional_trades
+                    WHERE typeof(raw_data) = 'text'
+                    LIMIT ?
+                """, (batch_size,)).fetchall()
+                if not rows:
+                    break
+                conn.executemany(
+                    "UPDATE congressional_trades SET raw_data = ? WHERE id = ?",
+                    [(compress_raw_data(raw), trade_id) for trade_id, raw in rows]
+                )
+                conn.commit()
+                compressed += len(rows)
+
+        if compressed:
+            logger.info(f"Compressed raw_data for {compressed} trades")
+        return compressed
+
+    def archive_old_trades(self, older_than_days=365):
+        """
+        Move processed trades discovered more than N days ago to the archive database
+
+        The archive is a separate SQLite file attached for the move, so the hot
+        congressional_trades table and its indexes stay small. Archived rows get
+        new ids in the archive, and only rows whose trade_hash is confirmed there
+        are deleted from the hot table.
+
+        Returns:
+            Number of trades archived
+        """
+        with self._writing() as conn:
+            conn.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
+            try:
+                conn.executescript(CONGRESSIONAL_TRADES_DDL.format(schema='archive.'))
+                where = "processed = 1 AND discovered_at < datetime('now', ?)"
+                archived_where = f"{where} AND trade_hash IN (SELECT trade_hash FROM archive.congressional_trades)"
+                cutoff = (f'-{int(older_than_days)} days',)
+                columns = ', '.join(row[1] for row in conn.execute("PRAGMA main.table_info(congressional_trades)")
+                                    if row[1] != 'id')
+
+                # A trade_hash already in the archive is ignored (same trade); ids are not
+                # copied, so a hot table recreated next to an old archive can't collide
+                conn.execute(f"""
+                    INSERT OR IGNORE INTO archive.congressional_trades ({columns})
+                    SELECT {columns} FROM main.congressional_trades WHERE {where}
+                """, cutoff)
+                conn.execute(f"""
+                    INSERT OR IGNORE INTO main.archived_trade_hashes (trade_hash)
+                    SELECT trade_hash FROM main.congressional_trades WHERE {archived_where}
+                """, cutoff)
+                archived = conn.execute(
+                    f"DELETE FROM main.congressional_trades WHERE {archived_where}", cutoff).rowcount
+                conn.commit()
+            except Exception:
+                # DETACH fails while a transaction is open, which would hide this error
+                conn.rollback()
+                raise
+            finally:
+                conn.execute("DETACH DATABASE archive")
+
+        if archived:
+            logger.info(f"Archived {archived} trades older than {older_than_days} days to {self.archive_path}")
+        return archived
+
+    def get_archived_trades(self, ticker=None):
+        """Get trades from the archive database (optionally for one ticker)"""
+        if not Path(self.archive_path).exists():
+            return []
+
+        with connect(self.archive_path) as conn:
+            conn.row_factory = sqlite3.Row
+            if ticker:
+                cursor = conn.execute(
+                    "SELECT * FROM congressional_trades WHERE ticker = ? ORDER BY id", (ticker,))
+            else:
+                cursor = conn.execute("SELECT * FROM congressional_trades ORDER BY id")
+            return [_trade_row(row) for row in cursor.fetchall()]
+
+    def search_trades(self, query, limit=50):
+        """
+        Find trades whose asset name, representative, ticker or amount range match
+
+        Each word in `query` is matched as a prefix ("alpha" finds "Alphabet"),
+        and all words must match. Results are ordered by disclosure_date, newest
+        first, with id descending as the tie-break, whether or not FTS5 is
+        available.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+
+        with self._reading() as conn:
+            conn.row_factory = sqlite3.Row
+            if self.has_fts:
+                match = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+                cursor = conn.execute("""
+                    SELECT t.* FROM congressional_trades_fts f
+                    JOIN congressional_trades t ON t.id = f.rowid
+                    WHERE congressional_trades_fts MATCH ?
+                    ORDER BY t.disclosure_date DESC, t.id DESC
+                    LIMIT ?
+                """, (match, limit))
+            else:
+                searchable = " || ' ' || ".join(
+                    f"IFNULL({column}, '')" for column in ('asset_name', 'representative', 'ticker', 'amount_range'))
+                conditions = ' AND '.join(f"{searchable} LIKE ?" for _ in terms)
+                cursor = conn.execute(f"""
+                    SELECT * FROM congressional_trades WHERE {conditions}
+                    ORDER BY disclosure_date DESC, id DESC LIMIT ?
+                """, [f'%{term}%' for term in terms] + [limit])
+            return [_trade_row(row) for row in cursor.fetchall()]
+
     # --- Executed Trades ---
 
     def add_executed_trade(self, congressional_trade_id, ticker, action, quantity,
                            price, total_value, order_id, status, error_message=None):
         """Record an executed trade"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writing() as conn:
             cursor = conn.execute("""
                 INSERT INTO executed_trades
                 (congressional_trade_id, ticker, action, quantity, price,
@@ -253,22 +935,24 @@ class TradingDatabase:
             conn.commit()
             return cursor.lastrowid
 
+    def iter_executed_trades(self, days=30, page_size=500):
+        """Lazily iterate executed trades from the last N days, most recent first"""
+        return self._iter_keyset(
+            "e.*, c.representative, c.disclosure_date as congress_date",
+            """
+            FROM executed_trades e
+            LEFT JOIN congressional_trades c ON e.congressional_trade_id = c.id
+            WHERE e.executed_at >= datetime('now', ?)
+            """, (f'-{days} days',), "e.executed_at", "e.id", page_size)
+
     def get_executed_trades(self, days=30):
         """Get executed trades from the last N days"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT e.*, c.representative, c.disclosure_date as congress_date
-                FROM executed_trades e
-                LEFT JOIN congressional_trades c ON e.congressional_trade_id = c.id
-                WHERE e.executed_at >= datetime('now', ?)
-                ORDER BY e.executed_at DESC
-            """, (f'-{days} days',))
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_executed_trades(days))
 
-    def get_trade_stats(self):
-        """Get trading statistics"""
-        with sqlite3.connect(self.db_path) as conn:
+    def get_trade_stats(self, from_snapshot=False):
+        """Get trading statistics (optionally from the reporting snapshot)"""
+        snapshot = self.refresh_snapshot() if from_snapshot else None
+        with self._reading(snapshot) as conn:
             conn.row_factory = sqlite3.Row
 
             stats = {}
@@ -310,7 +994,7 @@ class TradingDatabase:
 
     def update_position(self, ticker, quantity, avg_cost=None, current_price=None):
         """Update or insert a position"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writing() as conn:
             if quantity == 0:
                 conn.execute("DELETE FROM positions WHERE ticker = ?", (ticker,))
             else:
@@ -327,14 +1011,14 @@ class TradingDatabase:
 
     def get_positions(self):
         """Get all current positions"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._reading() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("SELECT * FROM positions ORDER BY ticker")
             return [dict(row) for row in cursor.fetchall()]
 
     def get_position(self, ticker):
         """Get a specific position"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._reading() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("SELECT * FROM positions WHERE ticker = ?", (ticker,))
             row = cursor.fetchone()
@@ -342,29 +1026,92 @@ class TradingDatabase:
 
     # --- Bot State ---
 
+    # Seconds between checks of bot_state_version for writes by other processes
+    STATE_CACHE_TTL = 1.0
+
+    # Versions are read under the write lock: our commits (and the on_commit that
+    # counts them) happen under it too, so the count always matches the version read.
+
+    def _reload_state_cache(self):
+        """Load the whole bot_state table into the in-memory cache"""
+        with self._write_lock, self._reading() as conn:
+            version = conn.execute("SELECT version FROM bot_state_version WHERE id = 1").fetchone()[0]
+            rows = conn.execute("SELECT key, value FROM bot_state").fetchall()
+
+            cache = {key: _decode_state(value) for key, value in rows}
+            with self._state_lock:
+                for key, serialized in self._pending_state.items():
+                    cache[key] = _decode_state(serialized)
+                self._state_cache = cache
+                self._state_version = version
+                self._own_state_commits = 0
+                self._state_checked_at = time.monotonic()
+
+    def _check_state_cache(self):
+        """Reload the cache if another process changed bot_state (checked at most once per TTL)"""
+        if time.monotonic() - self._state_checked_at < self.STATE_CACHE_TTL:
+            return
+        # Don't wait behind a write in progress; the next get_state() checks again
+        if not self._write_lock.acquire(blocking=False):
+            return
+        try:
+            with self._reading() as conn:
+                version = conn.execute("SELECT version FROM bot_state_version WHERE id = 1").fetchone()[0]
+            with self._state_lock:
+                unchanged = (self._state_version is not None
+                             and version == self._state_version + self._own_state_commits)
+                if unchanged:
+                    # Only our own commits since the last check, already in the cache
+                    self._state_version = version
+                    self._own_state_commits = 0
+                    self._state_checked_at = time.monotonic()
+            if not unchanged:
+                self._reload_state_cache()
+        finally:
+            self._write_lock.release()
+
     def set_state(self, key, value):
-        """Set a bot state value"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO bot_state (key, value, updated_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(key) DO UPDATE SET
-                    value = excluded.value,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (key, json.dumps(value) if not isinstance(value, str) else value))
-            conn.commit()
+        """Set a bot state value (written behind; visible to get_state immediately)"""
+        serialized = json.dumps(value) if not isinstance(value, str) else value
+        with self._state_lock:
+            self._pending_state[key] = serialized
+            self._state_cache[key] = _decode_state(serialized)
+        self._write("""
+            INSERT INTO bot_state (key, value, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(key) DO UPDATE SET
+                value = excluded.value,
+                updated_at = CURRENT_TIMESTAMP
+        """, (key, serialized), on_commit=partial(self._clear_pending_state, key, serialized),
+            on_drop=partial(self._drop_pending_state, key, serialized))
+
+    def _clear_pending_state(self, key, serialized):
+        """Drop a pending value once committed, unless it was overwritten meanwhile"""
+        with self._state_lock:
+            self._own_state_commits += 1
+            if self._pending_state.get(key) == serialized:
+                del self._pending_state[key]
+
+    def _drop_pending_state(self, key, serialized):
+        """Forget a value whose write was dropped, so the cache falls back to what is stored"""
+        with self._state_lock:
+            if self._pending_state.get(key) != serialized:
+                return
+            del self._pending_state[key]
+            # Force a reload on the next get_state()
+            self._state_version = None
+            self._state_checked_at = 0.0
+        logger.warning(f"bot_state '{key}' was not persisted; reverting to the stored value")
 
     def get_state(self, key, default=None):
-        """Get a bot state value"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT value FROM bot_state WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            if row:
-                try:
-                    return json.loads(row[0])
-                except (json.JSONDecodeError, TypeError):
-                    return row[0]
-            return default
+        """Get a bot state value from the in-memory cache"""
+        self._check_state_cache()
+        with self._state_lock:
+            if key not in self._state_cache:
+                return default
+            value = self._state_cache[key]
+        # Hand out copies of containers so callers can't mutate the cache
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     def get_last_fetch_time(self, source='house_clerk'):
         """Get the last time we fetched data from a source"""
@@ -377,24 +1124,22 @@ class TradingDatabase:
     # --- Notifications ---
 
     def add_notification(self, notification_type, message, trade_id=None):
-        """Record a sent notification"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO notifications (type, message, trade_id)
-                VALUES (?, ?, ?)
-            """, (notification_type, message, trade_id))
-            conn.commit()
+        """Record a sent notification (written behind)"""
+        self._write("""
+            INSERT INTO notifications (type, message, trade_id)
+            VALUES (?, ?, ?)
+        """, (notification_type, message, trade_id))
+
+    def iter_recent_notifications(self, limit=None, page_size=500):
+        """Lazily iterate notifications, most recent first (all of them unless limited)"""
+        self.flush()
+        return self._iter_keyset(
+            "*", "FROM notifications WHERE 1 = 1",
+            (), "sent_at", "id", page_size, limit=limit)
 
     def get_recent_notifications(self, limit=50):
         """Get recent notifications"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM notifications
-                ORDER BY sent_at DESC
-                LIMIT ?
-            """, (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_recent_notifications(limit))
 
     # --- Broker Tokens ---
 
@@ -402,7 +1147,7 @@ class TradingDatabase:
                            refresh_token: str = None, account_id: str = None,
                            expires_at: datetime = None):
         """Save or update broker authentication tokens"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writing() as conn:
             conn.execute("""
                 INSERT INTO broker_tokens
                     (broker, account_id, access_token, access_secret, refresh_token, expires_at, last_refreshed)
@@ -420,7 +1165,7 @@ class TradingDatabase:
 
     def get_broker_tokens(self, broker: str, account_id: str = None):
         """Retrieve broker tokens"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._reading() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("""
                 SELECT * FROM broker_tokens
@@ -440,7 +1185,7 @@ class TradingDatabase:
 
     def delete_broker_tokens(self, broker: str, account_id: str = None):
         """Delete broker tokens (for logout/revoke)"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writing() as conn:
             conn.execute("""
                 DELETE FROM broker_tokens
                 WHERE broker = ? AND account_id = ?
@@ -450,66 +1195,442 @@ class TradingDatabase:
 
     def get_all_broker_tokens(self):
         """Get all stored broker tokens (for refresh job)"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._reading() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("SELECT * FROM broker_tokens")
             return [dict(row) for row in cursor.fetchall()]
 
     def update_token_refresh_time(self, broker: str, account_id: str = None):
-        """Update the last_refreshed timestamp"""
-        with sqlite3.connect(self.db_path) as conn:
+        """Update the last_refreshed timestamp (written behind)"""
+        self._write("""
+            UPDATE broker_tokens
+            SET last_refreshed = CURRENT_TIMESTAMP
+            WHERE broker = ? AND account_id = ?
+        """, (broker, account_id or ''))
+
+    # --- Position State ---
+
+    def save_position_state(self, symbol, data):
+        """Insert or replace the stored state of one open position"""
+        with self._writing() as conn:
             conn.execute("""
-                UPDATE broker_tokens
-                SET last_refreshed = CURRENT_TIMESTAMP
-                WHERE broker = ? AND account_id = ?
-            """, (broker, account_id or ''))
+                INSERT INTO position_state (symbol, data, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(symbol) DO UPDATE SET
+                    data = excluded.data,
+                    updated_at = CURRENT_TIMESTAMP
+            """, (symbol, json.dumps(data, default=str)))
             conn.commit()
 
-    # --- Utility ---
+    def delete_position_state(self, symbol):
+        """Remove a closed position"""
+        with self._writing() as conn:
+            conn.execute("DELETE FROM position_state WHERE symbol = ?", (symbol,))
+            conn.commit()
 
-    def vacuum(self):
-        """Optimize the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("VACUUM")
+    def get_position_states(self):
+        """Get all stored position states as {symbol: data}"""
+        with self._reading() as conn:
+            cursor = conn.execute("SELECT symbol, data FROM position_state ORDER BY symbol")
+            return {symbol: json.loads(data) for symbol, data in cursor.fetchall()}
+
+    # --- Event Log ---
+
+    def append_event(self, stream, payload):
+        """Append one record to a history stream"""
+        self.append_events(stream, [payload])
+
+    def append_events(self, stream, payloads):
+        """Append several records to a history stream in one transaction"""
+        with self._writing() as conn:
+            conn.executemany(
+                "INSERT INTO event_log (stream, payload) VALUES (?, ?)",
+                ((stream, json.dumps(p, default=str)) for p in payloads)
+            )
+            conn.commit()
+
+    def get_events(self, stream, limit=None):
+        """Get records from a history stream, oldest first (the most recent `limit` if given)"""
+        with self._reading() as conn:
+            if limit is None:
+                cursor = conn.execute(
+                    "SELECT payload FROM event_log WHERE stream = ? ORDER BY id", (stream,))
+                return [json.loads(row[0]) for row in cursor.fetchall()]
+
+            cursor = conn.execute(
+                "SELECT payload FROM event_log WHERE stream = ? ORDER BY id DESC LIMIT ?",
+                (stream, limit))
+            return [json.loads(row[0]) for row in reversed(cursor.fetchall())]
+
+    def count_events(self, stream):
+        """Count records in a history stream"""
+        with self._reading() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM event_log WHERE stream = ?", (stream,)).fetchone()[0]
+
+    # --- Seen Items ---
+
+    def mark_seen(self, namespace, item_id):
+        """Record an id as handled; returns False if it was already recorded"""
+        with self._writing() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO seen_items (namespace, item_id) VALUES (?, ?)",
+                (namespace, item_id))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def mark_seen_many(self, namespace, item_ids):
+        """Record several ids as handled in one transaction"""
+        with self._writing() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO seen_items (namespace, item_id) VALUES (?, ?)",
+                ((namespace, item_id) for item_id in item_ids))
+            conn.commit()
+
+    def get_seen(self, namespace):
+        """Get all ids recorded in a namespace"""
+        with self._reading() as conn:
+            cursor = conn.execute(
+                "SELECT item_id FROM seen_items WHERE namespace = ?", (namespace,))
+            return {row[0] for row in cursor.fetchall()}
+
+    # --- Change Feed ---
+
+    def consume_changes(self, consumer, since_seq=None, limit=500, commit=True):
+        """
+        Get congressional_trades changes after a consumer's offset
 
-    def export_to_json(self, filepath):
-        """Export all data to JSON"""
-        with sqlite3.connect(self.db_path) as conn:
+        Each change is a dict with seq, op ('insert', 'update' or 'delete'),
+        trade_id, changed_at and trade (the current row, None once deleted).
+        since_seq overrides the stored offset; with commit the offset is moved
+        to the last returned seq, otherwise call commit_changes() after handling.
+        """
+        if since_seq is None:
+            since_seq = self.get_consumer_offset(consumer)
+
+        with self._reading() as conn:
             conn.row_factory = sqlite3.Row
+            rows = conn.execute("""
+                SELECT c.seq, c.op, c.trade_id, c.changed_at, t.*
+                FROM trade_changes c
+                LEFT JOIN congressional_trades t ON t.id = c.trade_id
+                WHERE c.seq > ?
+                ORDER BY c.seq
+                LIMIT ?
+            """, (since_seq, limit)).fetchall()
+
+        changes = []
+        for row in rows:
+            trade = _trade_row(row)
+            change = {key: trade.pop(key) for key in ('seq', 'op', 'trade_id', 'changed_at')}
+            change['trade'] = trade if trade['id'] is not None else None
+            changes.append(change)
+
+        if commit and changes:
+            self.commit_changes(consumer, changes[-1]['seq'])
+        elif not commit:
+            # Register the consumer so prune_changes() keeps what it hasn't committed yet
+            with self._writing() as conn:
+                conn.execute("INSERT OR IGNORE INTO change_consumers (consumer, last_seq) VALUES (?, ?)",
+                             (consumer, since_seq))
+        return changes
+
+    def commit_changes(self, consumer, seq):
+        """Record that a consumer has processed every change up to seq"""
+        with self._writing() as conn:
+            conn.execute("""
+                INSERT INTO change_consumers (consumer, last_seq, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(consumer) DO UPDATE SET
+                    last_seq = MAX(last_seq, excluded.last_seq),
+                    updated_at = CURRENT_TIMESTAMP
+            """, (consumer, seq))
+            conn.commit()
+
+    def get_consumer_offset(self, consumer):
+        """Last change seq a consumer has committed (0 if it has never consumed)"""
+        with self._reading() as conn:
+            row = conn.execute(
+                "SELECT last_seq FROM change_consumers WHERE consumer = ?", (consumer,)).fetchone()
+            return row[0] if row else 0
+
+    def prune_changes(self):
+        """Delete changes every registered consumer has already processed"""
+        with self._writing() as conn:
+            pruned = conn.execute("""
+                DELETE FROM trade_changes
+                WHERE seq <= (SELECT IFNULL(MIN(last_seq), 0) FROM change_consumers)
+            """).rowcount
+            conn.commit()
+        return pruned
+
+    # --- Legacy JSON Import ---
+
+    def import_json_file(self, filepath, importer):
+        """
+        Import a legacy JSON state file once, then rename it to *.migrated
 
-            data = {
-                'congressional_trades': [],
-                'executed_trades': [],
-                'positions': [],
-                'bot_state': {},
-                'exported_at': datetime.now().isoformat()
-            }
+        Args:
+            filepath: Path of the old JSON store
+            importer: Callable receiving the decoded JSON and writing it to the database
 
-            for row in conn.execute("SELECT * FROM congressional_trades"):
-                data['congressional_trades'].append(dict(row))
+        Returns:
+            True if the file was imported
+        """
+        path = Path(filepath)
+        if not path.exists():
+            return False
 
-            for row in conn.execute("SELECT * FROM executed_trades"):
-                data['executed_trades'].append(dict(row))
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            importer(data)
+            path.rename(path.with_name(path.name + '.migrated'))
+            logger.info(f"Migrated {path} into the database")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not import {path}: {e}")
+            return False
 
-            for row in conn.execute("SELECT * FROM positions"):
-                data['positions'].append(dict(row))
+    # --- Utility ---
 
-            for row in conn.execute("SELECT key, value FROM bot_state"):
-                data['bot_state'][row['key']] = row['value']
+    def vacuum(self):
+        """Optimize the database"""
+        self.flush()
+        with self._writing() as conn:
+            conn.execute("VACUUM")
 
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+    def export_to_json(self, filepath, from_snapshot=False):
+        """Export all data to JSON, streaming rows page by page instead of building them in memory"""
+        self.flush()
+        snapshot = self.refresh_snapshot() if from_snapshot else None
+        with open(filepath, 'w') as f:
+            f.write('{\n')
+            for table in ('congressional_trades', 'executed_trades', 'positions'):
+                columns = [name for name, _ in self._table_columns(table)]
+                f.write(f'  "{table}": [')
+                separator = '\n'
+                for rows in self.iter_table_batches(table, snapshot=snapshot):
+                    for row in rows:
+                        f.write(separator + '    ' + json.dumps(dict(zip(columns, row)), default=str))
+                        separator = ',\n'
+                f.write('\n  ],\n')
+
+            columns = [name for name, _ in self._table_columns('bot_state')]
+            f.write('  "bot_state": {')
+            separator = '\n'
+            for rows in self.iter_table_batches('bot_state', snapshot=snapshot):
+                for row in rows:
+                    state = dict(zip(columns, row))
+                    f.write(f"{separator}    {json.dumps(state['key'])}: {json.dumps(state['value'], default=str)}")
+                    separator = ',\n'
+            f.write('\n  },\n')
+
+            f.write(f'  "exported_at": {json.dumps(datetime.now().isoformat())}\n}}\n')
+
+        logger.info(f"Exported database to {filepath}")
+
+    # --- Snapshots ---
+
+    def create_snapshot(self, dest=None):
+        """Write a consistent read-only copy of the database for reporting"""
+        self.flush()
+        return create_snapshot(self.db_path, dest or self.snapshot_path)
+
+    def refresh_snapshot(self, max_age=None):
+        """Return the snapshot path, re-creating it if missing or stale"""
+        self.flush()
+        max_age = self.SNAPSHOT_MAX_AGE if max_age is None else max_age
+        return refresh_snapshot(self.db_path, max_age, self.snapshot_path)
+
+    # --- Export ---
+
+    def _table_columns(self, table):
+        """Get (name, declared type) for each column of an exportable table"""
+        if table not in EXPORT_TABLES:
+            raise ValueError(f"Cannot export unknown table: {table}")
+        with self._reading() as conn:
+            return [(name, declared_type or '')
+                    for _, name, declared_type, *_ in conn.execute(f"PRAGMA table_info({table})")]
+
+    def iter_table_batches(self, table, since=None, until=None, batch_size=1000,
+                           snapshot=None):
+        """
+        Yield lists of row tuples from an exportable table in rowid order
+
+        Each batch is read with its own short query keyed on the last rowid, so
+        long exports never hold a read transaction open against the trading loop.
+        Columns follow _table_columns(); raw_data is decompressed. Pass a
+        snapshot path (see create_snapshot) to read from it instead of the live file.
+        """
+        columns = [
+            'decompress_raw_data(raw_data)' if name == 'raw_data' else name
+            for name, _ in self._table_columns(table)
+        ]
+        date_column = EXPORT_TABLES[table]
+        conditions, params = ["rowid > ?"], []
+        if since:
+            conditions.append(f"{date_column} >= ?")
+            params.append(str(since))
+        if until:
+            conditions.append(f"{date_column} < ?")
+            params.append(str(until))
+        query = f"""
+            SELECT rowid, {', '.join(columns)} FROM {table}
+            WHERE {' AND '.join(conditions)}
+            ORDER BY rowid LIMIT ?
+        """
+
+        last_rowid = -1
+        while True:
+            with self._reading(snapshot) as conn:
+                conn.create_function('decompress_raw_data', 1, decompress_raw_data, deterministic=True)
+                rows = conn.execute(query, [last_rowid, *params, batch_size]).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            yield [row[1:] for row in rows]
+            if len(rows) < batch_size:
+                return
 
-            logger.info(f"Exported database to {filepath}")
+    def export_tables(self, output_dir, fmt='ndjson', tables=None, since=None, until=None,
+                      batch_size=1000, from_snapshot=False):
+        """
+        Stream tables to disk, one file per table, without loading them into memory
+
+        Args:
+            output_dir: Directory to write <table>.<fmt> files into
+            fmt: One of 'ndjson', 'csv', 'parquet' or 'arrow' (the last two need pyarrow)
+            tables: Table names to export (default: all of EXPORT_TABLES)
+            since: Only rows whose timestamp column is >= this date/datetime string
+            until: Only rows whose timestamp column is < this date/datetime string
+            batch_size: Rows read per batch
+            from_snapshot: Read from a fresh snapshot instead of the live database
+
+        Returns:
+            Dict mapping table name to the written file path
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{fmt}' (expected one of {', '.join(EXPORT_FORMATS)})")
+        if fmt in ('parquet', 'arrow') and not HAS_PYARROW:
+            raise RuntimeError(f"{fmt} export requires pyarrow - run: pip install pyarrow")
+
+        tables = list(tables) if tables else list(EXPORT_TABLES)
+        unknown = [t for t in tables if t not in EXPORT_TABLES]
+        if unknown:
+            raise ValueError(f"Cannot export unknown table(s): {', '.join(unknown)}")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.flush()
+        snapshot = self.refresh_snapshot() if from_snapshot else None
+
+        written = {}
+        for table in tables:
+            columns = self._table_columns(table)
+            batches = self.iter_table_batches(table, since=since, until=until, batch_size=batch_size,
+                                              snapshot=snapshot)
+            path = output_dir / f"{table}.{fmt}"
+            if fmt == 'ndjson':
+                count = _write_ndjson(path, columns, batches)
+            elif fmt == 'csv':
+                count = _write_csv(path, columns, batches)
+            else:
+                count = _write_columnar(path, columns, batches, fmt)
+
+            written[table] = path
+            logger.info(f"Exported {count} rows from {table} to {path}")
+
+        return written
+
+
+def _decode_state(value):
+    """Decode a stored bot_state value, falling back to the raw string"""
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return value
+
+
+def _write_ndjson(path, columns, batches):
+    """Write row batches as newline-delimited JSON objects"""
+    names = [name for name, _ in columns]
+    count = 0
+    with open(path, 'w') as f:
+        for rows in batches:
+            for row in rows:
+                f.write(json.dumps(dict(zip(names, row)), default=str) + '\n')
+            count += len(rows)
+    return count
+
+
+def _write_csv(path, columns, batches):
+    """Write row batches as CSV with a header line"""
+    count = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, _ in columns])
+        for rows in batches:
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+
+def _arrow_schema(columns):
+    """Build an Arrow schema from the declared SQLite column types"""
+    fields = []
+    for name, declared_type in columns:
+        declared_type = declared_type.upper()
+        if 'INT' in declared_type:
+            arrow_type = pa.int64()
+        elif 'REAL' in declared_type:
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _arrow_array(values, arrow_type):
+    """Convert one column of SQLite values, coercing text columns (SQLite typing is loose)"""
+    if arrow_type == pa.string():
+        values = [None if v is None else str(v) for v in values]
+    return pa.array(values, type=arrow_type)
+
+
+def _write_columnar(path, columns, batches, fmt):
+    """Write row batches as Parquet or Arrow IPC record batches"""
+    schema = _arrow_schema(columns)
+    if fmt == 'parquet':
+        writer = pq.ParquetWriter(str(path), schema)
+    else:
+        writer = pa_ipc.new_file(str(path), schema)
+
+    count = 0
+    try:
+        for rows in batches:
+            arrays = [_arrow_array(column, field.type) for column, field in zip(zip(*rows), schema)]
+            batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+            if fmt == 'parquet':
+                writer.write_batch(batch)
+            else:
+                writer.write(batch)
+            count += len(rows)
+    finally:
+        writer.close()
+    return count
 
 
 # Singleton instance
 _db_instance = None
+_db_instance_lock = threading.Lock()
 
 
-def get_database(db_path="data/trading.db"):
-    """Get or create database instance"""
+def get_database(db_path="data/trading.db", write_behind=True):
+    """Get or create database instance (safe to call from scheduler threads)"""
     global _db_instance
     if _db_instance is None:
-        _db_instance = TradingDatabase(db_path)
+        with _db_instance_lock:
+            if _db_instance is None:
+                _db_instance = TradingDatabase(db_path, write_behind=write_behind)
     return _db_instance
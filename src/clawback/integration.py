@@ -14,6 +14,8 @@ from congress_data.alert_manager import AlertManager
 from congress_data.config import CongressConfig
 from congress_data.data_collector import CongressDataCollector
 
+from clawback.database import get_database
+
 # Import trading bot components
 try:
     from broker_adapter import get_broker_adapter
@@ -36,20 +38,23 @@ class TradingIntegration:
 
         # Initialize congressional data system
         self.congress_config = CongressConfig(congress_config_path)
+        broker_config = self.load_broker_config(broker_config_path)
+
+        # One database for every component: the bot's database.path, else the congress config's
+        db_path = broker_config.get('database', {}).get('path') or self.congress_config.get_database_path()
+        self.db = get_database(db_path)
+
         self.data_collector = CongressDataCollector(self.congress_config)
-        self.alert_manager = AlertManager(self.congress_config)
+        self.alert_manager = AlertManager(self.congress_config, db=self.db)
 
         # Initialize trading bot if available
         self.broker = None
         self.trade_engine = None
 
-        if broker_config_path and get_broker_adapter:
+        if broker_config and get_broker_adapter:
             try:
-                with open(broker_config_path) as f:
-                    broker_config = json.load(f)
-
                 self.broker = get_broker_adapter(broker_config)
-                self.trade_engine = TradeEngine(self.broker, broker_config)
+                self.trade_engine = TradeEngine(self.broker, broker_config, db=self.db)
 
                 logger.info(f"Trading bot integration initialized with {self.broker.BROKER_NAME}")
             except Exception as e:
@@ -65,6 +70,17 @@ class TradingIntegration:
 
         logger.info("Trading integration system initialized")
 
+    def load_broker_config(self, broker_config_path):
+        """Load the trading bot config, or {} if not given or unreadable"""
+        if not broker_config_path:
+            return {}
+        try:
+            with open(broker_config_path) as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading broker config {broker_config_path}: {e}")
+            return {}
+
     def setup_logging(self):
         """Setup logging configuration"""
         log_dir = "logs"
@@ -82,19 +98,20 @@ class TradingIntegration:
         )
 
     def load_history(self):
-        """Load integration history from file"""
+        """Load integration history, importing a legacy integration_history.json first"""
         try:
-            with open(self.history_file) as f:
-                self.integration_history = json.load(f)
+            self.db.import_json_file(self.history_file,
+                                     lambda history: self.db.append_events("integration_history", history))
+            self.integration_history = self.db.get_events("integration_history")
             logger.info(f"Loaded {len(self.integration_history)} integration records")
-        except (FileNotFoundError, json.JSONDecodeError):
+        except Exception as e:
+            logger.error(f"Error loading integration history: {e}")
             self.integration_history = []
 
-    def save_history(self):
-        """Save integration history to file"""
+    def save_execution(self, execution_record):
+        """Append one integration record (single-row write)"""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.integration_history, f, indent=2)
+            self.db.append_event("integration_history", execution_record)
         except Exception as e:
             logger.error(f"Error saving integration history: {e}")
 
@@ -321,7 +338,7 @@ class TradingIntegration:
                 self.processed_trades.append(trade.get('trade_key', ''))
 
                 # Save history
-                self.save_history()
+                self.save_execution(execution_record)
 
                 logger.info(f"Trade executed: {order_details['action']} {order_details['quantity']} "
                           f"{order_details['symbol']} (confidence: {analysis['confidence']}%)")
@@ -9,6 +9,7 @@ import os
 import sys
 import time
 from datetime import datetime, timedelta
+from itertools import islice
 from zoneinfo import ZoneInfo
 
 import schedule
@@ -16,7 +17,7 @@ import schedule
 from .broker_adapter import get_broker_adapter
 from .config_loader import load_config
 from .congress_tracker import CongressTracker
-from .database import get_database
+from .database import get_database, install_signal_handlers
 from .telegram_notifier import TelegramNotifier
 from .trade_engine import TradeEngine
 
@@ -57,8 +58,9 @@ class TradingBot:
         self.logger = setup_logging(self.config)
 
         # Initialize database
-        db_path = self.config.get('database', {}).get('path', 'data/trading.db')
-        self.db = get_database(db_path)
+        db_config = self.config.get('database', {})
+        self.db = get_database(db_config.get('path', 'data/trading.db'),
+                               write_behind=db_config.get('writeBehind', True))
 
         # Initialize Telegram notifier
         self.notifier = TelegramNotifier(self.config.get('notifications', {}))
@@ -66,7 +68,7 @@ class TradingBot:
         # Initialize components using adapter pattern
         self.broker = get_broker_adapter(self.config)
         self.congress_tracker = CongressTracker(self.config)
-        self.trade_engine = TradeEngine(self.broker, self.config)
+        self.trade_engine = TradeEngine(self.broker, self.config, db=self.db)
 
         # Wire up broker error notifications to Telegram
         self.broker.set_error_callback(self._handle_broker_error)
@@ -329,9 +331,6 @@ class TradingBot:
                     order_id=exec_trade.get('order_id', ''),
                     status=exec_trade.get('status', 'unknown')
                 )
-
-            # Save trade history
-            self.trade_engine.save_trade_history()
         else:
             self.logger.info("No trades were executed")
 
@@ -388,6 +387,12 @@ class TradingBot:
         schedule.every(90).minutes.do(self.refresh_broker_tokens)
         self.logger.info("  Scheduled token refresh every 90 minutes")
 
+        # Refresh the read-only reporting snapshot so stats/exports/backtests stay off the live file
+        snapshot_minutes = self.config.get('database', {}).get('snapshotIntervalMinutes', 60)
+        if snapshot_minutes:
+            schedule.every(snapshot_minutes).minutes.do(self.db.create_snapshot)
+            self.logger.info(f"  Scheduled database snapshot every {snapshot_minutes} minutes")
+
         # Run initial check
         self.check_for_new_disclosures()
 
@@ -486,7 +491,7 @@ class TradingBot:
             print(" 10. Check portfolio risk")
             print("  ─────────── Automation ───────────")
             print(f" 11. Start scheduled trading (checks at {', '.join(self.disclosure_check_times)} ET)")
-            print(" 12. Export database to JSON")
+            print(" 12. Export database (JSON/NDJSON/CSV/Parquet)")
             print(" 13. Emergency stop")
             print("  0. Exit")
             print("="*60)
@@ -551,9 +556,8 @@ class TradingBot:
                 for ticker, count in stats.get('top_tickers', [])[:5]:
                     print(f"    {ticker}: {count} trades")
             elif choice == '7':
-                unprocessed = self.db.get_unprocessed_trades()
-                print(f"\nUnprocessed trades: {len(unprocessed)}")
-                for trade in unprocessed[:10]:
+                print(f"\nUnprocessed trades: {self.db.count_unprocessed_trades()}")
+                for trade in islice(self.db.iter_unprocessed_trades(page_size=10), 10):
                     print(f"  {trade['disclosure_date']}: {trade['transaction_type'].upper():8} "
                           f"{trade['ticker']:6} ${trade['amount']:>10,.0f}  ({trade['representative'][:20]})")
             elif choice == '8':
@@ -615,9 +619,20 @@ class TradingBot:
                     self.run_scheduled()
 
             elif choice == '12':
-                filepath = input("Export path (default: data/export.json): ").strip() or 'data/export.json'
-                self.db.export_to_json(filepath)
-                print(f"Exported to {filepath}")
+                fmt = input("Format (json/ndjson/csv/parquet/arrow) [json]: ").strip().lower() or 'json'
+                if fmt == 'json':
+                    filepath = input("Export path (default: data/export.json): ").strip() or 'data/export.json'
+                    self.db.export_to_json(filepath)
+                    print(f"Exported to {filepath}")
+                else:
+                    output_dir = input("Export directory (default: data/export): ").strip() or 'data/export'
+                    since = input("Since date (YYYY-MM-DD, blank for all): ").strip() or None
+                    try:
+                        written = self.db.export_tables(output_dir, fmt=fmt, since=since)
+                        for table, path in written.items():
+                            print(f"  {table}: {path}")
+                    except (ValueError, RuntimeError) as e:
+                        print(f"Export failed: {e}")
 
             elif choice == '13':
                 self.emergency_stop()
@@ -632,6 +647,7 @@ class TradingBot:
 
 def main():
     """Main entry point"""
+    install_signal_handlers()
     print("\n🦞 ClawBack - Congressional Trade Mirror")
     print("="*50)
 
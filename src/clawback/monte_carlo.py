@@ -0,0 +1,211 @@
+"""
+Monte Carlo significance testing for strategies
+Confidence intervals from a block bootstrap of a strategy's trade returns,
+and p-values against a random-entry baseline that trades the same tickers,
+directions and holding period at random dates. Resamples are vectorized in
+chunks and spread across a process pool; each chunk has its own seed from one
+SeedSequence, so results depend on the seed but not on the worker count.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .backtest_engine import simulate
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on resamples x trades evaluated at once, to cap memory per chunk
+CHUNK_CELLS = 2_000_000
+
+
+@dataclass
+class MonteCarloResult:
+    """Observed strategy statistics with bootstrap and random-entry distributions"""
+    strategy_name: str
+    observed_trades: int
+    observed_total_return: float
+    observed_sharpe: float
+    bootstrap_total_returns: np.ndarray
+    bootstrap_sharpes: np.ndarray
+    random_total_returns: np.ndarray
+    random_sharpes: np.ndarray
+
+    def confidence_interval(self, statistic: str = 'total_return', level: float = 0.95) -> Tuple[float, float]:
+        """Percentile bootstrap interval for 'total_return' or 'sharpe'"""
+        values = self.bootstrap_total_returns if statistic == 'total_return' else self.bootstrap_sharpes
+        tail = (1 - level) / 2 * 100
+        low, high = np.percentile(values, [tail, 100 - tail])
+        return float(low), float(high)
+
+    @property
+    def p_value_total_return(self) -> float:
+        """Share of random-entry runs doing at least as well as the strategy"""
+        return _p_value(self.random_total_returns, self.observed_total_return)
+
+    @property
+    def p_value_sharpe(self) -> float:
+        return _p_value(self.random_sharpes, self.observed_sharpe)
+
+    def print(self):
+        low, high = self.confidence_interval('total_return')
+        sharpe_low, sharpe_high = self.confidence_interval('sharpe')
+        print("\n" + "=" * 100)
+        print(f"MONTE CARLO - {self.strategy_name} ({self.observed_trades} trades, "
+              f"{len(self.bootstrap_total_returns)} bootstrap / {len(self.random_total_returns)} random-entry runs)")
+        print("=" * 100)
+        print(f"  Total Return: {self.observed_total_return*100:.1f}%  "
+              f"(95% CI {low*100:.1f}% to {high*100:.1f}%, p = {self.p_value_total_return:.4f})")
+        print(f"  Sharpe:       {self.observed_sharpe:.2f}  "
+              f"(95% CI {sharpe_low:.2f} to {sharpe_high:.2f}, p = {self.p_value_sharpe:.4f})")
+        if len(self.random_total_returns):
+            print(f"  Random-entry median return: {np.median(self.random_total_returns)*100:.1f}%")
+        print("=" * 100)
+
+
+def _p_value(null: np.ndarray, observed: float) -> float:
+    return float((1 + np.count_nonzero(null >= observed)) / (len(null) + 1)) if len(null) else 1.0
+
+
+def _stats(returns: np.ndarray, valid: np.ndarray, position_size_pct: float,
+           holding_period_days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-row (compounded total return, Sharpe) for a resamples x trades matrix"""
+    count = valid.sum(axis=1)
+    r = np.where(valid, returns, 0.0)
+    total = np.expm1(np.log1p(position_size_pct * r).sum(axis=1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = r.sum(axis=1) / count
+        variance = (np.where(valid, (r - mean[:, None]) ** 2, 0.0)).sum(axis=1) / (count - 1)
+        std = np.sqrt(variance)
+        sharpe = np.where((count > 1) & (std > 0), mean / std * np.sqrt(252 / holding_period_days), 0.0)
+    return total, sharpe
+
+
+# --- Worker side ---
+
+# Set by _init_worker: dict of the shared arrays and settings
+_shared = None
+
+
+def _init_worker(shared: dict):
+    global _shared
+    _shared = shared
+
+
+def _bootstrap_chunk(task: Tuple[int, np.random.SeedSequence]) -> Tuple[np.ndarray, np.ndarray]:
+    """Circular block bootstrap of the observed returns (keeps clustering within blocks)"""
+    size, seed = task
+    s = _shared
+    returns, block = s['returns'], s['block_size']
+    n = len(returns)
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, n, size=(size, -(-n // block)))
+    idx = ((starts[:, :, None] + np.arange(block)) % n).reshape(size, -1)[:, :n]
+    sample = returns[idx]
+    return _stats(sample, np.ones_like(sample, dtype=bool), s['position_size_pct'], s['holding_period_days'])
+
+
+def _random_entry_chunk(task: Tuple[int, np.random.SeedSequence]) -> Tuple[np.ndarray, np.ndarray]:
+    """Same tickers, directions and holding period, entered on uniformly random sessions"""
+    size, seed = task
+    s = _shared
+    slot, forward = s['ticker_slot'], s['session_returns']
+    rng = np.random.default_rng(seed)
+    returns = s['direction'] * forward[slot, rng.integers(0, forward.shape[1], size=(size, len(slot)))]
+    return _stats(returns, ~np.isnan(returns), s['position_size_pct'], s['holding_period_days'])
+
+
+# --- Parent side ---
+
+def monte_carlo(backtester, trades, strategy_name: str = 'Strategy',
+                entry_delay_days: int = 0, holding_period_days: int = 45, min_trade_size: float = 0,
+                leaders_only: bool = False, purchases_only: bool = True, position_size_pct: float = 0.05,
+                resamples: int = 10000, block_size: Optional[int] = None,
+                workers: Optional[int] = None, seed: int = 42) -> MonteCarloResult:
+    """
+    Bootstrap and random-entry distributions for one run_strategy configuration
+
+    Args:
+        backtester: CongressionalBacktester supplying prices
+        trades: Trade list or TradeTable
+        strategy_name .. position_size_pct: As for run_strategy
+        resamples: Runs for each of the bootstrap and the random-entry baseline
+        block_size: Bootstrap block length in trades (default: sqrt of trade count)
+        workers: Process count (default: CPU count; 1 runs in this process)
+        seed: Base seed; the same seed gives the same distributions
+    """
+    global _shared
+    backtester.load_price_history(trades, entry_delay_days, holding_period_days)
+    table = backtester.trade_table(trades)
+    prices = backtester.price_index(table)
+    sim = simulate(table, prices, backtester.initial_capital, entry_delay_days, holding_period_days,
+                   table.mask(purchases_only, min_trade_size, leaders_only),
+                   position_size_pct, backtester.MAX_PRICE_GAP_DAYS)
+    returns = sim['returns']
+
+    observed_total, observed_sharpe = _stats(returns[None, :], np.ones((1, len(returns)), dtype=bool),
+                                             position_size_pct, holding_period_days)
+    result = MonteCarloResult(
+        strategy_name=strategy_name,
+        observed_trades=len(returns),
+        observed_total_return=float(observed_total[0]),
+        observed_sharpe=float(observed_sharpe[0]),
+        bootstrap_total_returns=np.zeros(0), bootstrap_sharpes=np.zeros(0),
+        random_total_returns=np.zeros(0), random_sharpes=np.zeros(0),
+    )
+    if len(returns) < 2:
+        logger.warning(f"{strategy_name}: too few trades ({len(returns)}) for Monte Carlo")
+        return result
+
+    # Random entries are drawn from the sessions spanned by the strategy's own entries.
+    # Long returns for every (traded ticker, candidate session) are computed once, so
+    # each random-entry resample is a single gather.
+    rows = sim['rows']
+    calendar = prices.calendar
+    sessions = calendar.sessions[calendar.ordinal_on_or_after(int(sim['entry_day'].min())):
+                                 calendar.ordinal_on_or_after(int(sim['entry_day'].max()) + 1)]
+    codes, ticker_slot = np.unique(table.ticker_code[rows], return_inverse=True)
+    grid_codes, grid_days = np.repeat(codes, len(sessions)), np.tile(sessions, len(codes))
+    entry_price = prices.lookup(grid_codes, grid_days, backtester.MAX_PRICE_GAP_DAYS)
+    exit_price = prices.lookup(grid_codes, grid_days + holding_period_days, backtester.MAX_PRICE_GAP_DAYS)
+
+    shared = {
+        'returns': returns,
+        'block_size': block_size or max(1, round(len(returns) ** 0.5)),
+        'ticker_slot': ticker_slot,
+        'direction': np.where(table.is_purchase[rows], 1.0, -1.0),
+        'session_returns': ((exit_price - entry_price) / entry_price).reshape(len(codes), len(sessions)),
+        'position_size_pct': position_size_pct,
+        'holding_period_days': holding_period_days,
+    }
+
+    # Fixed chunking and per-chunk seeds keep results independent of the worker count
+    chunk = max(1, CHUNK_CELLS // len(returns))
+    sizes = [min(chunk, resamples - start) for start in range(0, resamples, chunk)]
+    bootstrap_seeds, random_seeds = np.random.SeedSequence(seed).spawn(2)
+    bootstrap_tasks = list(zip(sizes, bootstrap_seeds.spawn(len(sizes))))
+    random_tasks = list(zip(sizes, random_seeds.spawn(len(sizes))))
+
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"{strategy_name}: {resamples} bootstrap and random-entry resamples of "
+                f"{len(returns)} trades with {workers} worker(s)")
+    if workers == 1:
+        _init_worker(shared)
+        try:
+            bootstrap = [_bootstrap_chunk(task) for task in bootstrap_tasks]
+            random_entry = [_random_entry_chunk(task) for task in random_tasks]
+        finally:
+            _shared = None
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(shared,)) as pool:
+            bootstrap = list(pool.map(_bootstrap_chunk, bootstrap_tasks))
+            random_entry = list(pool.map(_random_entry_chunk, random_tasks))
+
+    result.bootstrap_total_returns = np.concatenate([total for total, _ in bootstrap])
+    result.bootstrap_sharpes = np.concatenate([sharpe for _, sharpe in bootstrap])
+    result.random_total_returns = np.concatenate([total for total, _ in random_entry])
+    result.random_sharpes = np.concatenate([sharpe for _, sharpe in random_entry])
+    return result
@@ -0,0 +1,223 @@
+"""
+Parallel strategy parameter sweep
+Grid or random search over run_strategy parameters, fanned out across a
+process pool. The trade table and forward-return tensor are written once as
+.npy files and memory-mapped read-only by every worker, so each configuration
+only ships its parameters and a row of summary statistics between processes.
+"""
+import csv
+import itertools
+import logging
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .backtest_engine import ForwardReturns, TradeTable, summarize, to_day
+
+logger = logging.getLogger(__name__)
+
+# Default search space (the parameters of CongressionalBacktester.run_strategy)
+DEFAULT_GRID: Dict[str, List[Any]] = {
+    'entry_delay_days': [0, 3, 5, 9, 14, 21],
+    'holding_period_days': [7, 14, 30, 45, 60, 90],
+    'min_trade_size': [0, 15000, 50000, 100000],
+    'leaders_only': [False, True],
+    'purchases_only': [True, False],
+}
+
+# Trade table columns shared with workers (the ticker/representative names stay in the parent)
+TABLE_COLUMNS = ('disclosure_day', 'ticker_code', 'rep_code', 'is_purchase', 'amount', 'is_leader')
+
+
+@dataclass
+class SweepRow:
+    """Parameters and summary statistics for one swept configuration"""
+    entry_delay_days: int
+    holding_period_days: int
+    min_trade_size: float
+    leaders_only: bool
+    purchases_only: bool
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    total_return: float
+    avg_return_per_trade: float
+    max_drawdown: float
+    sharpe_ratio: float
+    win_rate: float
+    avg_holding_days: float
+    best_trade: float
+    worst_trade: float
+
+    @property
+    def name(self) -> str:
+        flags = [f"${self.min_trade_size / 1000:g}K+"] if self.min_trade_size else []
+        if self.leaders_only:
+            flags.append("leaders")
+        if not self.purchases_only:
+            flags.append("+sales")
+        return " ".join([f"{self.entry_delay_days}d delay, {self.holding_period_days}d hold", *flags])
+
+
+class SweepTable:
+    """Sweep results collected as they arrive, sortable by any SweepRow field"""
+
+    def __init__(self):
+        self.rows: List[SweepRow] = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def add(self, row: SweepRow):
+        self.rows.append(row)
+
+    def sorted(self, by: str = 'total_return', descending: bool = True) -> List[SweepRow]:
+        if by not in SweepRow.__dataclass_fields__:
+            raise ValueError(f"Unknown sweep column: {by}")
+        return sorted(self.rows, key=lambda row: getattr(row, by), reverse=descending)
+
+    def top(self, n: int = 10, by: str = 'total_return', descending: bool = True) -> List[SweepRow]:
+        return self.sorted(by, descending)[:n]
+
+    def to_csv(self, path: str, by: str = 'total_return', descending: bool = True):
+        """Write all rows, sorted, to a CSV file"""
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(SweepRow.__dataclass_fields__))
+            writer.writeheader()
+            for row in self.sorted(by, descending):
+                writer.writerow(asdict(row))
+
+    def print(self, n: int = 20, by: str = 'total_return', descending: bool = True):
+        """Print the top rows in the same layout as CongressionalBacktester.print_results"""
+        print("\n" + "=" * 100)
+        print(f"PARAMETER SWEEP - top {min(n, len(self.rows))} of {len(self.rows)} by {by}")
+        print("=" * 100)
+        print(f"{'Strategy':<45} {'Trades':>7} {'Win%':>7} {'Avg Ret':>8} {'Total':>9} {'MaxDD':>7} {'Sharpe':>7}")
+        print("-" * 100)
+        for r in self.top(n, by, descending):
+            print(f"{r.name:<45} {r.total_trades:>7} {r.win_rate*100:>6.1f}% "
+                  f"{r.avg_return_per_trade*100:>7.2f}% {r.total_return*100:>8.1f}% "
+                  f"{r.max_drawdown*100:>6.1f}% {r.sharpe_ratio:>7.2f}")
+        print("=" * 100)
+
+
+def grid_configs(grid: Optional[Dict[str, List[Any]]] = None) -> List[Dict[str, Any]]:
+    """Every combination of the grid's values (missing keys use DEFAULT_GRID)"""
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def random_configs(samples: int, grid: Optional[Dict[str, List[Any]]] = None,
+                   seed: int = 42) -> List[Dict[str, Any]]:
+    """`samples` distinct configurations drawn uniformly from the grid"""
+    configs = grid_configs(grid)
+    return random.Random(seed).sample(configs, min(samples, len(configs)))
+
+
+# --- Worker side ---
+
+# Set in each worker by _init_worker: (table, forward, initial_capital, position_size_pct, today)
+_shared = None
+
+
+def _init_worker(data_dir: str, delays: List[int], horizons: List[int], initial_capital: float,
+                 position_size_pct: float, today: int):
+    """Memory-map the shared dataset read-only (pages are shared through the OS cache)"""
+    global _shared
+
+    def load(name):
+        return np.load(os.path.join(data_dir, f"{name}.npy"), mmap_mode='r')
+
+    table = TradeTable(*(load(column) for column in TABLE_COLUMNS), tickers=[], representatives=[])
+    forward = ForwardReturns(load('forward_returns'), delays, horizons, table.disclosure_day)
+    _shared = (table, forward, initial_capital, position_size_pct, today)
+
+
+def _evaluate(configs: List[Dict[str, Any]]) -> List[SweepRow]:
+    """Run a chunk of configurations against the shared dataset"""
+    table, forward, initial_capital, position_size_pct, today = _shared
+    rows = []
+    for config in configs:
+        sim = forward.evaluate(
+            config['entry_delay_days'], config['holding_period_days'],
+            table.mask(config['purchases_only'], config['min_trade_size'], config['leaders_only']),
+            initial_capital, position_size_pct, today=today
+        )
+        stats = summarize(sim['returns'], sim['capital'], initial_capital,
+                          sim['max_drawdown'], config['holding_period_days'])
+        rows.append(SweepRow(**config, **stats))
+    return rows
+
+
+# --- Parent side ---
+
+def run_sweep(backtester, trades, configs: Iterable[Dict[str, Any]], workers: Optional[int] = None,
+              position_size_pct: float = 0.05, chunk_size: int = 8,
+              on_result: Optional[Callable[[SweepRow], None]] = None) -> SweepTable:
+    """
+    Evaluate many strategy configurations in parallel
+
+    Args:
+        backtester: CongressionalBacktester whose price provider/store supplies prices
+        trades: List of congressional trades
+        configs: Parameter dicts (see grid_configs / random_configs)
+        workers: Process count (default: CPU count; 1 runs in this process)
+        position_size_pct: Position size as % of portfolio, as in run_strategy
+        chunk_size: Configurations per task, to amortize inter-process overhead
+        on_result: Called with each SweepRow as soon as its chunk finishes
+
+    Returns:
+        SweepTable with one row per configuration
+    """
+    global _shared
+    configs = list(configs)
+    table_out = SweepTable()
+    if not configs or not trades:
+        return table_out
+
+    # One forward-return tensor (one bulk price load) covers every configuration
+    forward = backtester.precompute_forward_returns(
+        trades,
+        delays=[c['entry_delay_days'] for c in configs],
+        horizons=[c['holding_period_days'] for c in configs]
+    )
+    table = backtester.trade_table(trades)
+    settings = (forward.delays, forward.horizons, backtester.initial_capital,
+                position_size_pct, to_day(datetime.now()))
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [configs[i:i + chunk_size] for i in range(0, len(configs), chunk_size)]
+    logger.info(f"Sweeping {len(configs)} configurations over {len(table)} trades with {workers} worker(s)")
+
+    def collect(rows):
+        for row in rows:
+            table_out.add(row)
+            if on_result:
+                on_result(row)
+
+    with tempfile.TemporaryDirectory(prefix='clawback-sweep-') as data_dir:
+        for column in TABLE_COLUMNS:
+            np.save(os.path.join(data_dir, f"{column}.npy"), getattr(table, column))
+        np.save(os.path.join(data_dir, 'forward_returns.npy'), forward.returns)
+
+        if workers == 1:
+            _init_worker(data_dir, *settings)
+            try:
+                for chunk in chunks:
+                    collect(_evaluate(chunk))
+            finally:
+                _shared = None
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(data_dir, *settings)) as pool:
+                for future in as_completed([pool.submit(_evaluate, chunk) for chunk in chunks]):
+                    collect(future.result())
+
+    return table_out
@@ -0,0 +1,175 @@
+"""
+Event-driven portfolio simulator
+Replays a strategy's entries, scheduled exits and stop triggers from a heap,
+session by session, so concurrent positions, the max_positions limit and the
+cash tied up in open holdings are modeled, and a daily equity curve falls out
+of the replay. Cost is O(events log events) for the heap plus one vectorized
+mark of the open book per session.
+"""
+import heapq
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .backtest_engine import PriceIndex, TradeTable, to_day
+
+logger = logging.getLogger(__name__)
+
+# Event kinds, in the order they are handled within a session: exits free
+# cash and slots before new entries compete for them
+EXIT, STOP, ENTRY = 0, 1, 2
+
+
+@dataclass
+class Position:
+    """An open holding; shorts (followed sales) gain when the price falls"""
+    row: int
+    ticker_code: int
+    direction: int
+    entry_day: int
+    entry_price: float
+    notional: float
+    last_price: float
+
+    def value(self, price: float) -> float:
+        return self.notional * (1 + self.direction * (price / self.entry_price - 1))
+
+
+@dataclass
+class PortfolioResult:
+    """Closed trades and the daily equity curve from simulate_portfolio()"""
+    trades: List[Dict] = field(default_factory=list)
+    equity_days: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    equity: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    capital: float = 0.0
+    max_drawdown: float = 0.0
+    skipped_max_positions: int = 0
+    skipped_cash: int = 0
+
+    @property
+    def returns(self) -> np.ndarray:
+        return np.array([t['return'] for t in self.trades], dtype=np.float64)
+
+    def equity_curve(self) -> List[tuple]:
+        """[('YYYY-MM-DD', equity), ...] for each session"""
+        dates = np.datetime_as_string(self.equity_days.astype('datetime64[D]')).tolist()
+        return list(zip(dates, self.equity.tolist()))
+
+
+def simulate_portfolio(table: TradeTable, prices: PriceIndex, initial_capital: float,
+                       entry_delay_days: int, holding_period_days: int, mask: np.ndarray,
+                       max_positions: int = 20, position_size_pct: float = 0.05,
+                       max_gap_days: int = 5, stop_loss_pct: Optional[float] = None,
+                       today: Optional[int] = None) -> PortfolioResult:
+    """
+    Replay the masked trades as a portfolio
+
+    Each entry is sized at position_size_pct of current equity (capped by free
+    cash) and skipped when max_positions are already open. Positions exit at
+    the first close on or after entry + holding_period_days. With
+    stop_loss_pct, a close at or beyond that loss triggers an exit at the
+    next session's close. Positions still open on the last session are marked
+    to market and reported with exit_reason 'open'.
+    """
+    today = to_day(datetime.now()) if today is None else today
+    result = PortfolioResult(capital=initial_capital)
+
+    events = []
+    for seq, row in enumerate(np.flatnonzero(mask).tolist()):
+        entry_day = int(table.disclosure_day[row]) + entry_delay_days
+        if entry_day <= today:
+            events.append((entry_day, ENTRY, seq, row))
+    if not events:
+        return result
+    heapq.heapify(events)
+    seq = len(events)
+
+    sessions = prices.session_days()
+    sessions = sessions[(sessions >= events[0][0]) & (sessions <= today)]
+
+    cash = initial_capital
+    equity = initial_capital
+    positions: Dict[int, Position] = {}
+    equity_values = np.empty(len(sessions))
+
+    def close(position: Position, day: int, price: float, reason: str):
+        nonlocal cash
+        value = position.value(price)
+        cash += value
+        del positions[position.row]
+        result.trades.append({
+            'ticker': table.tickers[position.ticker_code],
+            'representative': table.representatives[table.rep_code[position.row]],
+            'entry_date': _date(position.entry_day),
+            'exit_date': _date(day),
+            'exit_reason': reason,
+            'return': value / position.notional - 1,
+            'pnl': value - position.notional,
+        })
+
+    for i, day in enumerate(sessions.tolist()):
+        while events and events[0][0] <= day:
+            _, kind, _, row = heapq.heappop(events)
+            if kind in (EXIT, STOP):
+                position = positions.get(row)
+                if position is None:
+                    continue  # already closed by an earlier exit or stop
+                price = prices.lookup(np.array([position.ticker_code]), np.array([day]), max_gap_days)[0]
+                close(position, day, position.last_price if np.isnan(price) else float(price),
+                      'stop' if kind == STOP else 'holding_period')
+                continue
+
+            if len(positions) >= max_positions:
+                result.skipped_max_positions += 1
+                continue
+            code = int(table.ticker_code[row])
+            price = prices.lookup(np.array([code]), np.array([day]), max_gap_days)[0]
+            if np.isnan(price):
+                continue
+            notional = min(equity * position_size_pct, cash)
+            if notional <= 0:
+                result.skipped_cash += 1
+                continue
+            cash -= notional
+            positions[row] = Position(row, code, 1 if table.is_purchase[row] else -1, day,
+                                      float(price), notional, float(price))
+            heapq.heappush(events, (day + holding_period_days, EXIT, seq, row))
+            seq += 1
+
+        # Mark the open book at today's closes (tickers without a close keep their last price)
+        if positions:
+            book = list(positions.values())
+            marks = prices.lookup(np.array([p.ticker_code for p in book]), np.full(len(book), day), 0)
+            for position, mark in zip(book, marks.tolist()):
+                if not math.isnan(mark):
+                    position.last_price = mark
+                if stop_loss_pct is not None and position.value(position.last_price) <= \
+                        position.notional * (1 - stop_loss_pct):
+                    heapq.heappush(events, (day + 1, STOP, seq, position.row))
+                    seq += 1
+        equity = cash + sum(p.value(p.last_price) for p in positions.values())
+        equity_values[i] = equity
+
+        if not events and not positions:
+            sessions, equity_values = sessions[:i + 1], equity_values[:i + 1]
+            break
+
+    for position in list(positions.values()):
+        close(position, int(sessions[-1]) if len(sessions) else position.entry_day,
+              position.last_price, 'open')
+
+    result.equity_days = sessions
+    result.equity = equity_values
+    result.capital = float(equity_values[-1]) if len(equity_values) else initial_capital
+    if len(equity_values):
+        peaks = np.maximum.accumulate(np.concatenate(([initial_capital], equity_values)))[1:]
+        result.max_drawdown = float(np.max((peaks - equity_values) / peaks))
+    return result
+
+
+def _date(day: int) -> str:
+    return str(np.datetime64(int(day), 'D'))
@@ -0,0 +1,297 @@
+"""
+ClawBack - Price Provider Interface
+Sources of daily price history for backtesting: yfinance, a local directory of
+CSV/Parquet files, or a deterministic synthetic random walk for offline runs
+"""
+import csv
+import hashlib
+import logging
+import math
+import random
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .price_store import rows_from_frame
+from .trading_calendar import nyse_calendar
+
+logger = logging.getLogger(__name__)
+
+# Try to import yfinance for historical prices
+try:
+    import yfinance as yf
+    HAS_YFINANCE = True
+except ImportError:
+    HAS_YFINANCE = False
+
+
+class PriceProvider(ABC):
+    """
+    Abstract base class for daily price sources.
+
+    fetch_history() returns OHLCV rows in price_store.OHLCV_COLUMNS order
+    ('YYYY-MM-DD', open, high, low, close, adj_close, volume), sorted by date.
+    """
+
+    PROVIDER_NAME: str = "Unknown"
+
+    # Whether fetching needs the network (remote providers are worth caching in a PriceStore)
+    REMOTE: bool = False
+
+    @abstractmethod
+    def fetch_history(self, tickers: List[str], start: datetime, end: datetime) -> Dict[str, List[tuple]]:
+        """
+        Get daily rows for each ticker between start and end (inclusive).
+
+        Args:
+            tickers: Ticker symbols
+            start: First date
+            end: Last date
+
+        Returns:
+            Dict mapping ticker to its rows. A ticker with an empty list is known
+            to have no data in the range; a ticker that is missing could not be
+            fetched (e.g. network failure) and should be retried later.
+        """
+
+    def cache_key(self) -> str:
+        """Name for results derived from this provider's prices; differs whenever the prices would"""
+        return self.PROVIDER_NAME
+
+
+class YFinanceProvider(PriceProvider):
+    """Yahoo Finance daily history via batched yf.download()"""
+
+    PROVIDER_NAME = "yfinance"
+    REMOTE = True
+
+    def __init__(self, batch_size: int = 50):
+        if not HAS_YFINANCE:
+            raise RuntimeError("yfinance price provider requires yfinance - run: pip install yfinance")
+        self.batch_size = batch_size
+
+    def fetch_history(self, tickers: List[str], start: datetime, end: datetime) -> Dict[str, List[tuple]]:
+        history = {}
+        for i in range(0, len(tickers), self.batch_size):
+            batch = tickers[i:i + self.batch_size]
+            try:
+                data = yf.download(batch, start=start.strftime('%Y-%m-%d'),
+                                   end=(end + timedelta(days=1)).strftime('%Y-%m-%d'),
+                                   group_by='ticker', auto_adjust=False, progress=False, threads=True)
+            except Exception as e:
+                logger.warning(f"Bulk price download failed for {len(batch)} tickers: {e}")
+                continue
+
+            rows = {}
+            for ticker in batch:
+                try:
+                    # group_by='ticker' gives (ticker, field) columns; older single-ticker results are flat
+                    frame = data[ticker] if data.columns.nlevels > 1 else data
+                    rows[ticker] = rows_from_frame(frame)
+                except KeyError:
+                    rows[ticker] = []
+
+            # An all-empty batch is more likely a network failure than a batch of
+            # delisted tickers, so report those tickers as unfetched
+            if any(rows.values()):
+                history.update(rows)
+        return history
+
+
+class LocalFileProvider(PriceProvider):
+    """
+    Prices from a directory with one <TICKER>.csv or <TICKER>.parquet file per ticker.
+
+    Files need a Date column and Close (Open/High/Low/Adj Close/Volume optional),
+    matching the layout yfinance and most data vendors export. Parquet needs
+    pandas with pyarrow.
+    """
+
+    PROVIDER_NAME = "local"
+
+    def __init__(self, directory: str = "data/prices"):
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise ValueError(f"Price directory not found: {self.directory}")
+
+    def cache_key(self) -> str:
+        # Name, mtime and size of every data file, so edited or added files change the key
+        files = []
+        for path in sorted(self.directory.iterdir()):
+            if path.suffix in ('.csv', '.parquet') and path.is_file():
+                stat = path.stat()
+                files.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return f"{self.PROVIDER_NAME}-{config_digest(self.directory.resolve(), files)}"
+
+    def fetch_history(self, tickers: List[str], start: datetime, end: datetime) -> Dict[str, List[tuple]]:
+        start_str, end_str = start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+        history = {}
+        for ticker in tickers:
+            try:
+                rows = self._read(ticker)
+            except Exception as e:
+                logger.warning(f"Could not read prices for {ticker} from {self.directory}: {e}")
+                continue
+            history[ticker] = [row for row in rows if start_str <= row[0] <= end_str]
+        return history
+
+    def _read(self, ticker: str) -> List[tuple]:
+        """Read all rows for a ticker, or [] if it has no file"""
+        csv_path = self.directory / f"{ticker}.csv"
+        parquet_path = self.directory / f"{ticker}.parquet"
+
+        if csv_path.exists():
+            with open(csv_path, newline='') as f:
+                records = [{key.strip().lower(): value for key, value in record.items()}
+                           for record in csv.DictReader(f)]
+        elif parquet_path.exists():
+            import pandas as pd
+            frame = pd.read_parquet(parquet_path)
+            if 'date' not in {str(c).lower() for c in frame.columns}:
+                frame = frame.reset_index()
+            records = [{str(key).strip().lower(): value for key, value in record.items()}
+                       for record in frame.to_dict('records')]
+        else:
+            return []
+
+        rows = []
+        for record in records:
+            close = _number(record.get('close'))
+            if close is None:
+                continue
+            rows.append((
+                str(record['date'])[:10],
+                _number(record.get('open')),
+                _number(record.get('high')),
+                _number(record.get('low')),
+                close,
+                _number(record.get('adj close', record.get('adj_close'))),
+                _number(record.get('volume')),
+            ))
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+
+class SyntheticProvider(PriceProvider):
+    """
+    Deterministic geometric random walk per ticker, for offline research and CI.
+
+    Each ticker's walk starts at EPOCH from a seed derived from (seed, ticker),
+    so a given date always has the same price whatever range is requested.
+    The walk steps once per weekday; only NYSE sessions get rows.
+    """
+
+    PROVIDER_NAME = "synthetic"
+    EPOCH = datetime(2000, 1, 3)
+    CHUNK_DAYS = 256
+
+    def __init__(self, seed: int = 42, start_price: float = 100.0,
+                 annual_drift: float = 0.07, annual_volatility: float = 0.25):
+        self.seed = seed
+        self.start_price = start_price
+        self.daily_drift = annual_drift / 252
+        self.daily_volatility = annual_volatility / math.sqrt(252)
+        self._walks: Dict[str, List[float]] = {}
+
+    def cache_key(self) -> str:
+        return f"{self.PROVIDER_NAME}-{config_digest(self.seed, self.start_price, self.daily_drift, self.daily_volatility)}"
+
+    def fetch_history(self, tickers: List[str], start: datetime, end: datetime) -> Dict[str, List[tuple]]:
+        start = max(datetime(start.year, start.month, start.day), self.EPOCH)
+        days = []
+        day = start
+        while day <= end:
+            if day.weekday() < 5:
+                days.append(day)
+            day += timedelta(days=1)
+        if not days:
+            return {ticker: [] for ticker in tickers}
+
+        first = _weekdays_between(self.EPOCH, days[0])
+        calendar = nyse_calendar()
+        on_session = calendar.is_session(
+            np.array([day.date() for day in days], dtype='datetime64[D]').astype(np.int64)).tolist()
+        history = {}
+        for ticker in tickers:
+            walk = self._walk(ticker, first + len(days))
+            rows = []
+            for offset, day in enumerate(days):
+                if not on_session[offset]:
+                    continue
+                close = round(walk[first + offset], 4)
+                previous = round(walk[first + offset - 1], 4) if first + offset > 0 else close
+                rows.append((day.strftime('%Y-%m-%d'), previous, max(previous, close),
+                             min(previous, close), close, close, 1_000_000))
+            history[ticker] = rows
+        return history
+
+    def _walk(self, ticker: str, length: int) -> List[float]:
+        """Closes for the first `length` weekdays since EPOCH, extended and cached as needed"""
+        walk = self._walks.get(ticker)
+        if walk is None:
+            walk = self._walks[ticker] = [self.start_price]
+        price = walk[-1]
+        while len(walk) < length:
+            # Each fixed-size chunk has its own seed, so values don't depend on request order
+            rng = random.Random(f"{self.seed}:{ticker}:{(len(walk) - 1) // self.CHUNK_DAYS}")
+            for _ in range(self.CHUNK_DAYS):
+                price *= math.exp(self.daily_drift + self.daily_volatility * rng.gauss(0, 1))
+                walk.append(price)
+        return walk
+
+
+def config_digest(*values) -> str:
+    """Short stable digest of configuration values, for cache keys"""
+    return hashlib.sha1(repr(values).encode()).hexdigest()[:12]
+
+
+def _weekdays_between(start: datetime, end: datetime) -> int:
+    """Number of weekdays in [start, end)"""
+    days = (end - start).days
+    weeks, remainder = divmod(days, 7)
+    count = weeks * 5
+    for i in range(remainder):
+        if (start.weekday() + i) % 7 < 5:
+            count += 1
+    return count
+
+
+def _number(value):
+    """Parse a CSV/Parquet cell to float, treating blanks and NaN as missing"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def get_price_provider(config: Dict[str, Any]) -> PriceProvider:
+    """
+    Factory function to create the configured price provider.
+
+    Args:
+        config: Configuration dictionary with backtest.priceProvider set to
+            'yfinance' (default), 'local' (uses backtest.priceDirectory) or
+            'synthetic' (uses backtest.syntheticSeed)
+
+    Returns:
+        Initialized price provider instance
+
+    Raises:
+        ValueError: If the specified provider is not supported
+    """
+    backtest_config = config.get('backtest', {})
+    provider_name = backtest_config.get('priceProvider', 'yfinance').lower()
+
+    if provider_name == 'yfinance':
+        return YFinanceProvider()
+    elif provider_name == 'local':
+        return LocalFileProvider(backtest_config.get('priceDirectory', 'data/prices'))
+    elif provider_name == 'synthetic':
+        return SyntheticProvider(seed=backtest_config.get('syntheticSeed', 42))
+    else:
+        raise ValueError(f"Unsupported price provider: {provider_name}. "
+                         f"Supported providers: yfinance, local, synthetic")
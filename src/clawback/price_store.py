@@ -0,0 +1,190 @@
+"""
+Persistent local store of daily OHLCV prices for backtesting
+
+Prices live in a SQLite table clustered by (ticker, date), so each ticker's
+history is one contiguous range on disk. A coverage table records which date
+span has already been fetched per ticker, so a refresh only downloads the gap
+before or after it and repeated backtests run offline after the first warmup.
+"""
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .database import connect
+
+logger = logging.getLogger(__name__)
+
+# Column order of stored rows (date first, as 'YYYY-MM-DD')
+OHLCV_COLUMNS = ('date', 'open', 'high', 'low', 'close', 'adj_close', 'volume')
+
+
+def rows_from_frame(frame) -> List[tuple]:
+    """Convert a yfinance history/download frame for one ticker to OHLCV row tuples"""
+    frame = frame.dropna(subset=['Close'])
+    close = frame['Close']
+
+    def column(name):
+        return frame.get(name, close)
+
+    volume = frame['Volume'] if 'Volume' in frame else [None] * len(frame)
+    return [
+        (day.strftime('%Y-%m-%d'), _float(o), _float(h), _float(lo), float(c), _float(a), _int(v))
+        for day, o, h, lo, c, a, v in zip(frame.index, column('Open'), column('High'), column('Low'),
+                                          close, column('Adj Close'), volume)
+    ]
+
+
+def _day(value: datetime) -> datetime:
+    """Truncate a datetime to midnight so coverage compares by calendar day"""
+    return datetime(value.year, value.month, value.day)
+
+
+def _float(value):
+    return None if value is None or value != value else float(value)
+
+
+def _int(value):
+    return None if value is None or value != value else int(value)
+
+
+class PriceStore:
+    """SQLite-backed daily price history with per-ticker coverage tracking"""
+
+    def __init__(self, db_path: str = "data/prices.db"):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema"""
+        with connect(self.db_path) as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS prices (
+                    ticker TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL NOT NULL,
+                    adj_close REAL,
+                    volume INTEGER,
+                    PRIMARY KEY (ticker, date)
+                ) WITHOUT ROWID;
+
+                -- Date span already fetched per ticker (inclusive), including
+                -- days with no rows such as weekends and holidays
+                CREATE TABLE IF NOT EXISTS price_coverage (
+                    ticker TEXT PRIMARY KEY,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+            """)
+            conn.commit()
+
+    def get_coverage(self, ticker: str) -> Optional[Tuple[str, str]]:
+        """Get the (start, end) dates already fetched for a ticker"""
+        with connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT start_date, end_date FROM price_coverage WHERE ticker = ?", (ticker,)).fetchone()
+            return tuple(row) if row else None
+
+    def missing_ranges(self, ticker: str, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """
+        Date ranges (inclusive) that still need fetching to cover [start, end]
+
+        A gap before or after the stored coverage runs up to its edge, even past
+        the request, so coverage stays one contiguous span with nothing unfetched
+        inside it. Coverage never extends past yesterday, so recent days are
+        re-fetched until the session is complete.
+        """
+        start = _day(start)
+        end = min(_day(end), _day(datetime.now()) - timedelta(days=1))
+        if start > end:
+            return []
+
+        coverage = self.get_coverage(ticker)
+        if not coverage:
+            return [(start, end)]
+
+        covered_start = datetime.strptime(coverage[0], '%Y-%m-%d')
+        covered_end = datetime.strptime(coverage[1], '%Y-%m-%d')
+        gaps = []
+        if start < covered_start:
+            gaps.append((start, covered_start - timedelta(days=1)))
+        if end > covered_end:
+            gaps.append((covered_end + timedelta(days=1), end))
+        return gaps
+
+    def save(self, ticker: str, rows: List[tuple], start: datetime, end: datetime):
+        """
+        Store OHLCV rows for a fetched range and extend the ticker's coverage
+
+        Coverage is only extended by a range that touches or overlaps it (as
+        ranges from missing_ranges() do); rows from a disjoint range are stored
+        but their span isn't marked covered, so the days in between aren't skipped.
+        """
+        start_str = start.strftime('%Y-%m-%d')
+        end_str = min(_day(end), _day(datetime.now()) - timedelta(days=1)).strftime('%Y-%m-%d')
+
+        with connect(self.db_path) as conn:
+            conn.executemany(f"""
+                INSERT OR REPLACE INTO prices (ticker, {', '.join(OHLCV_COLUMNS)})
+                VALUES (?, {', '.join('?' for _ in OHLCV_COLUMNS)})
+            """, [(ticker, *row) for row in rows])
+            if start_str <= end_str:
+                conn.execute("""
+                    INSERT INTO price_coverage (ticker, start_date, end_date, updated_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(ticker) DO UPDATE SET
+                        start_date = MIN(start_date, excluded.start_date),
+                        end_date = MAX(end_date, excluded.end_date),
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE excluded.start_date <= date(end_date, '+1 day')
+                      AND excluded.end_date >= date(start_date, '-1 day')
+                """, (ticker, start_str, end_str))
+            conn.commit()
+
+    def get_closes(self, ticker: str, start: Optional[datetime] = None,
+                   end: Optional[datetime] = None) -> Tuple[List[str], List[float]]:
+        """Get (dates, closes) for a ticker in date order, optionally limited to [start, end]"""
+        query = "SELECT date, close FROM prices WHERE ticker = ?"
+        params = [ticker]
+        if start:
+            query += " AND date >= ?"
+            params.append(start.strftime('%Y-%m-%d'))
+        if end:
+            query += " AND date <= ?"
+            params.append(end.strftime('%Y-%m-%d'))
+
+        with connect(self.db_path) as conn:
+            rows = conn.execute(query + " ORDER BY date", params).fetchall()
+        return [row[0] for row in rows], [row[1] for row in rows]
+
+    def get_all_closes(self, tickers: List[str], start: Optional[datetime] = None,
+                       end: Optional[datetime] = None) -> Dict[str, Tuple[List[str], List[float]]]:
+        """Get (dates, closes) for several tickers, skipping those with no stored rows"""
+        history = {}
+        for ticker in tickers:
+            dates, closes = self.get_closes(ticker, start, end)
+            if dates:
+                history[ticker] = (dates, closes)
+        return history
+
+    def tickers(self) -> List[str]:
+        """List tickers with stored coverage"""
+        with connect(self.db_path) as conn:
+            return [row[0] for row in conn.execute("SELECT ticker FROM price_coverage ORDER BY ticker")]
+
+    def stats(self) -> Dict:
+        """Row and ticker counts for the store"""
+        with connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("""
+                SELECT COUNT(*) AS rows, COUNT(DISTINCT ticker) AS tickers,
+                       MIN(date) AS first_date, MAX(date) AS last_date
+                FROM prices
+            """).fetchone()
+            return dict(row)
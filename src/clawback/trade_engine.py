@@ -5,12 +5,18 @@ Includes trailing stop-loss and risk management features
 """
 import json
 import logging
-import os
 import time
 from datetime import datetime, time as dt_time, timedelta
 from decimal import ROUND_DOWN, Decimal
 from zoneinfo import ZoneInfo
 
+try:
+    from .database import get_database
+except ImportError:
+    # Loaded as a top-level module (integration.py adds this directory to sys.path); use
+    # the installed package so there is one database module, singleton and write lock
+    from clawback.database import get_database
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,9 +92,11 @@ class Position:
 class TradeEngine:
     """Calculates and executes scaled trades with risk management"""
 
-    def __init__(self, broker_client, config):
+    def __init__(self, broker_client, config, db=None):
         self.broker = broker_client
         self.config = config
+        self.db = db if db is not None else get_database(
+            config.get('database', {}).get('path', 'data/trading.db'))
 
         # Trading parameters
         trading_config = config.get('trading', {})
@@ -123,8 +131,9 @@ class TradeEngine:
         self.consecutive_losses = 0
         self.peak_portfolio_value = None
 
-        # Load saved positions
+        # Load saved positions and trade history
         self._load_positions()
+        self.load_trade_history()
 
         logger.info("Initialized trade engine with risk management")
 
@@ -354,6 +363,7 @@ class TradeEngine:
                 }
 
                 self.trade_history.append(trade_record)
+                self._record_trade(trade_record)
                 logger.info(f"Trade executed successfully: {trade_calculation['action']} "
                           f"{trade_calculation['quantity']} {trade_calculation['symbol']}")
 
@@ -420,34 +430,38 @@ class TradeEngine:
             logger.error(f"Error processing congressional trades: {e}")
             return []
 
+    def _record_trade(self, trade_record):
+        """Append an executed trade to the persistent trade history"""
+        try:
+            self.db.append_event('trade_history', trade_record)
+        except Exception as e:
+            logger.error(f"Error recording trade history: {e}")
+
     def save_trade_history(self, filename='trade_history.json'):
-        """Save trade history to file"""
+        """Export trade history to a JSON file (trades are persisted as they execute)"""
         try:
             with open(filename, 'w') as f:
                 json.dump(self.trade_history, f, indent=2, default=str)
 
-            logger.info(f"Saved {len(self.trade_history)} trades to {filename}")
+            logger.info(f"Exported {len(self.trade_history)} trades to {filename}")
             return True
 
         except Exception as e:
-            logger.error(f"Error saving trade history: {e}")
+            logger.error(f"Error exporting trade history: {e}")
             return False
 
     def load_trade_history(self, filename='trade_history.json'):
-        """Load trade history from file"""
+        """Load trade history from the database, importing a legacy JSON file first"""
         try:
-            with open(filename) as f:
-                self.trade_history = json.load(f)
+            self.db.import_json_file(filename, lambda data: self.db.append_events('trade_history', data))
+            self.trade_history = self.db.get_events('trade_history')
 
-            logger.info(f"Loaded {len(self.trade_history)} trades from {filename}")
+            logger.info(f"Loaded {len(self.trade_history)} trades from history")
             return True
 
-        except (FileNotFoundError, json.JSONDecodeError):
-            logger.warning(f"Could not load trade history from {filename}")
-            self.trade_history = []
-            return False
         except Exception as e:
             logger.error(f"Error loading trade history: {e}")
+            self.trade_history = []
             return False
 
     def get_trade_summary(self):
@@ -472,28 +486,29 @@ class TradeEngine:
     # ==================== POSITION MANAGEMENT ====================
 
     def _load_positions(self):
-        """Load saved positions from file"""
-        positions_file = 'data/positions.json'
+        """Load saved positions from the database, importing legacy data/positions.json first"""
+        def import_positions(data):
+            for symbol, pos_data in data.items():
+                self.db.save_position_state(symbol, pos_data)
+
         try:
-            if os.path.exists(positions_file):
-                with open(positions_file) as f:
-                    data = json.load(f)
-                for symbol, pos_data in data.items():
-                    self.positions[symbol] = Position.from_dict(pos_data)
-                logger.info(f"Loaded {len(self.positions)} positions from file")
+            self.db.import_json_file('data/positions.json', import_positions)
+            for symbol, pos_data in self.db.get_position_states().items():
+                self.positions[symbol] = Position.from_dict(pos_data)
+            logger.info(f"Loaded {len(self.positions)} positions from database")
         except Exception as e:
             logger.warning(f"Could not load positions: {e}")
 
-    def _save_positions(self):
-        """Save positions to file"""
-        positions_file = 'data/positions.json'
+    def _save_position(self, symbol):
+        """Persist a single position (or its removal)"""
         try:
-            os.makedirs('data', exist_ok=True)
-            data = {symbol: pos.to_dict() for symbol, pos in self.positions.items()}
-            with open(positions_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            pos = self.positions.get(symbol)
+            if pos is None:
+                self.db.delete_position_state(symbol)
+            else:
+                self.db.save_position_state(symbol, pos.to_dict())
         except Exception as e:
-            logger.error(f"Could not save positions: {e}")
+            logger.error(f"Could not save position {symbol}: {e}")
 
     def add_position(self, symbol: str, quantity: int, entry_price: float,
                     congressional_trade_id: int = None):
@@ -519,7 +534,7 @@ class TradeEngine:
             pos.stop_loss_price = entry_price * (1 - float(self.position_stop_loss))
             self.positions[symbol] = pos
 
-        self._save_positions()
+        self._save_position(symbol)
         logger.info(f"Added position: {quantity} {symbol} @ ${entry_price:.2f}")
 
     def remove_position(self, symbol: str, quantity: int = None):
@@ -533,7 +548,7 @@ class TradeEngine:
         else:
             pos.quantity -= quantity
 
-        self._save_positions()
+        self._save_position(symbol)
 
     # ==================== STOP-LOSS MANAGEMENT ====================
 
@@ -548,6 +563,7 @@ class TradeEngine:
                     continue
 
                 current_price = quote['last_price']
+                stop_state = (pos.highest_price, pos.stop_loss_price, pos.trailing_stop_active)
 
                 # Update position with current price (adjusts trailing stop)
                 pos.update_price(current_price)
@@ -560,6 +576,10 @@ class TradeEngine:
                     pos.stop_loss_price = pos.highest_price * (1 - pos.trailing_stop_percent)
                     logger.info(f"Trailing stop activated for {symbol} at ${pos.stop_loss_price:.2f}")
 
+                # Only rewrite positions whose stop-loss state actually moved
+                if stop_state != (pos.highest_price, pos.stop_loss_price, pos.trailing_stop_active):
+                    self._save_position(symbol)
+
                 # Check if stop-loss triggered
                 if pos.check_stop_loss(current_price):
                     triggered.append({
@@ -576,7 +596,6 @@ class TradeEngine:
             except Exception as e:
                 logger.error(f"Error checking stop-loss for {symbol}: {e}")
 
-        self._save_positions()
         return triggered
 
     def execute_stop_loss(self, stop_info: dict) -> bool:
@@ -0,0 +1,124 @@
+"""
+NYSE trading-session calendar
+Weekends, exchange holidays and unscheduled closures, as a sorted array of
+session days so "next session on or after" a date is one searchsorted and
+prices can be indexed by session ordinal.
+"""
+import logging
+from datetime import date, datetime, timedelta
+from functools import cache
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Full-day closures outside the regular holiday rules
+SPECIAL_CLOSURES = [
+    '1985-09-27',  # Hurricane Gloria
+    '1994-04-27',  # President Nixon's funeral
+    '2001-09-11', '2001-09-12', '2001-09-13', '2001-09-14',  # September 11
+    '2004-06-11',  # President Reagan's funeral
+    '2007-01-02',  # President Ford's funeral
+    '2012-10-29', '2012-10-30',  # Hurricane Sandy
+    '2018-12-05',  # President G.H.W. Bush's funeral
+    '2025-01-09',  # President Carter's funeral
+]
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    w = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * w) // 451
+    month, day = divmod(h + w - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th (1-based) weekday of a month, or the last one for n=-1"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year: int) -> List[date]:
+    """Regular NYSE full-day holidays for a year"""
+    holidays = [
+        _nth_weekday(year, 2, 0, 3),   # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),   # Independence Day
+        _nth_weekday(year, 9, 0, 1),   # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    ]
+    # New Year's Day falling on a Saturday is not observed on the prior Friday
+    if date(year, 1, 1).weekday() != 5:
+        holidays.append(_observed(date(year, 1, 1)))
+    if year >= 1998:
+        holidays.append(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    if year >= 2022:
+        holidays.append(_observed(date(year, 6, 19)))  # Juneteenth
+    return sorted(holidays)
+
+
+class TradingCalendar:
+    """Sorted session days (days since 1970-01-01) for a range of years"""
+
+    def __init__(self, start_year: int, end_year: int):
+        self.start_year = start_year
+        self.end_year = end_year
+        holidays = [d for year in range(start_year, end_year + 1) for d in nyse_holidays(year)]
+        holidays += [datetime.strptime(d, '%Y-%m-%d').date() for d in SPECIAL_CLOSURES]
+        days = np.arange(np.datetime64(f'{start_year}-01-01'), np.datetime64(f'{end_year + 1}-01-01'))
+        business = np.is_busday(days, holidays=np.array(holidays, dtype='datetime64[D]'))
+        self.sessions = days[business].astype(np.int64)
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def is_session(self, day) -> np.ndarray:
+        """Whether each day (days since epoch) is a trading session"""
+        ordinal = np.searchsorted(self.sessions, day)
+        return (ordinal < len(self.sessions)) & \
+            (self.sessions[np.minimum(ordinal, len(self.sessions) - 1)] == day)
+
+    def ordinal_on_or_after(self, day) -> np.ndarray:
+        """Ordinal of the first session on or after each day (len(self) past the end)"""
+        return np.searchsorted(self.sessions, day, side='left')
+
+    def session_ordinals(self, days) -> np.ndarray:
+        """Ordinal of each day that is a session, -1 for weekends, holidays and out-of-range days"""
+        ordinal = self.ordinal_on_or_after(days)
+        return np.where(self.is_session(days), ordinal, -1)
+
+    def next_session(self, value: datetime) -> datetime:
+        """First session on or after a datetime (unchanged past the calendar's range)"""
+        day = int(np.datetime64(value.date(), 'D').astype(np.int64))
+        ordinal = int(self.ordinal_on_or_after(day))
+        if ordinal >= len(self.sessions):
+            return value
+        return datetime(1970, 1, 1) + timedelta(days=int(self.sessions[ordinal]))
+
+
+@cache
+def nyse_calendar(start_year: int = 1980, end_year: Optional[int] = None) -> TradingCalendar:
+    """Shared NYSE calendar, by default through next year"""
+    return TradingCalendar(start_year, end_year or datetime.now().year + 1)
@@ -0,0 +1,188 @@
+"""
+Walk-forward strategy optimization
+Picks the best parameter set on a rolling in-sample window, scores it on the
+following out-of-sample window, and rolls forward, to check that strategy
+choices hold up on data they weren't chosen on.
+
+Window statistics are built incrementally: each configuration's trades are
+binned once into test-window-sized buckets (count, sum, sum of squares and
+log growth of returns), and every sliding in-sample window is a difference of
+prefix sums over those buckets, so the cost is one pass over the trades per
+configuration regardless of how many windows are rolled.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .backtest_engine import from_day, to_day
+
+logger = logging.getLogger(__name__)
+
+OBJECTIVES = ('sharpe_ratio', 'total_return', 'avg_return_per_trade')
+
+
+@dataclass
+class WalkForwardWindow:
+    """One optimize-then-test step"""
+    train_start: str
+    train_end: str
+    test_start: str
+    test_end: str
+    params: Optional[Dict[str, Any]]
+    in_sample_score: float
+    in_sample_trades: int
+    out_of_sample_trades: int
+    out_of_sample_return: float
+    out_of_sample_sharpe: float
+
+
+@dataclass
+class WalkForwardResult:
+    """Per-window picks and the stitched out-of-sample performance"""
+    objective: str
+    windows: List[WalkForwardWindow] = field(default_factory=list)
+    total_return: float = 0.0
+    total_trades: int = 0
+    # Best single configuration over the whole out-of-sample span, chosen in hindsight
+    hindsight_params: Optional[Dict[str, Any]] = None
+    hindsight_return: float = 0.0
+
+    def print(self):
+        print("\n" + "=" * 100)
+        print(f"WALK-FORWARD RESULTS - objective: {self.objective}")
+        print("=" * 100)
+        print(f"{'Test window':<25} {'Chosen parameters':<40} {'IS':>8} {'OOS Trades':>10} {'OOS Ret':>8}")
+        print("-" * 100)
+        for w in self.windows:
+            params = _describe(w.params) if w.params else "(no eligible configuration)"
+            print(f"{w.test_start + ' - ' + w.test_end:<25} {params:<40} {w.in_sample_score:>8.2f} "
+                  f"{w.out_of_sample_trades:>10} {w.out_of_sample_return*100:>7.1f}%")
+        print("=" * 100)
+        print(f"Out-of-sample: {self.total_trades} trades, {self.total_return*100:.1f}% compounded")
+        if self.hindsight_params:
+            print(f"Hindsight best ({_describe(self.hindsight_params)}): {self.hindsight_return*100:.1f}%")
+
+
+def _describe(params: Dict[str, Any]) -> str:
+    text = f"{params['entry_delay_days']}d delay, {params['holding_period_days']}d hold"
+    if params.get('min_trade_size'):
+        text += f" ${params['min_trade_size'] / 1000:g}K+"
+    if params.get('leaders_only'):
+        text += " leaders"
+    if not params.get('purchases_only', True):
+        text += " +sales"
+    return text
+
+
+def _window_stats(stats: np.ndarray, horizons: np.ndarray):
+    """(trades, total_return, avg_return, sharpe) per configuration from summed bucket stats"""
+    count, total, squares, log_growth = stats
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg = np.where(count > 0, total / count, 0.0)
+        variance = np.where(count > 1, (squares - count * avg ** 2) / (count - 1), 0.0)
+        std = np.sqrt(np.maximum(variance, 0.0))
+        sharpe = np.where(std > 0, avg / std * np.sqrt(252 / horizons), 0.0)
+    return count.astype(np.int64), np.expm1(log_growth), avg, sharpe
+
+
+def walk_forward(backtester, trades, configs: Iterable[Dict[str, Any]], train_days: int = 730,
+                 test_days: int = 180, objective: str = 'sharpe_ratio', min_trades: int = 20,
+                 position_size_pct: float = 0.05) -> WalkForwardResult:
+    """
+    Rolling walk-forward optimization over parameter configurations
+
+    Args:
+        backtester: CongressionalBacktester supplying prices
+        trades: Trade list or TradeTable
+        configs: Parameter dicts as for run_sweep (see param_sweep.grid_configs)
+        train_days: In-sample window length, rounded down to whole test windows
+        test_days: Out-of-sample window length (and the roll step)
+        objective: In-sample score to maximize (one of OBJECTIVES)
+        min_trades: Configurations with fewer in-sample trades are not eligible
+        position_size_pct: Position size as % of portfolio, for compounded returns
+
+    In-sample windows only count trades that have exited before the window
+    ends, and out-of-sample windows count trades entered during them, so no
+    pick uses a return that wasn't known at the time.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}. Supported: {', '.join(OBJECTIVES)}")
+    configs = list(configs)
+    result = WalkForwardResult(objective=objective)
+    train_buckets = train_days // test_days
+    if not configs or not len(trades) or train_buckets < 1:
+        return result
+
+    forward = backtester.precompute_forward_returns(
+        trades,
+        delays=[c['entry_delay_days'] for c in configs],
+        horizons=[c['holding_period_days'] for c in configs]
+    )
+    table = backtester.trade_table(trades)
+    origin = int(table.disclosure_day.min())
+    last_entry = min(to_day(datetime.now()), int(table.disclosure_day.max()) + max(forward.delays))
+    n_buckets = (last_entry - origin) // test_days + 1
+    if n_buckets <= train_buckets:
+        logger.warning(f"Walk-forward needs more than {train_days + test_days} days of trades")
+        return result
+
+    # Per configuration: [count, sum, sum of squares, log growth] of returns per bucket,
+    # by exit bucket for training and by entry bucket for testing
+    train = np.zeros((len(configs), 4, n_buckets))
+    test = np.zeros((len(configs), 4, n_buckets))
+    for c, config in enumerate(configs):
+        returns = forward.returns[:, forward.delays.index(config['entry_delay_days']),
+                                  forward.horizons.index(config['holding_period_days'])]
+        rows = table.mask(config['purchases_only'], config['min_trade_size'], config['leaders_only'])
+        rows &= ~np.isnan(returns)
+        entry_day = table.disclosure_day + config['entry_delay_days']
+        exit_day = entry_day + config['holding_period_days']
+        r = returns[rows]
+        columns = (np.ones_like(r), r, r * r, np.log1p(position_size_pct * r))
+        for stats, day in ((train, exit_day[rows]), (test, entry_day[rows])):
+            bucket = (day - origin) // test_days
+            inside = bucket < n_buckets
+            for k, values in enumerate(columns):
+                stats[c, k] = np.bincount(bucket[inside], weights=values[inside], minlength=n_buckets)
+
+    horizons = np.array([c['holding_period_days'] for c in configs], dtype=np.float64)
+    prefix = np.concatenate((np.zeros((len(configs), 4, 1)), np.cumsum(train, axis=2)), axis=2)
+    oos_log_growth = 0.0
+
+    for k in range(train_buckets, n_buckets):
+        # Sliding in-sample window = buckets [k - train_buckets, k)
+        window = prefix[:, :, k] - prefix[:, :, k - train_buckets]
+        count, total_return, avg, sharpe = _window_stats(np.moveaxis(window, 1, 0), horizons)
+        score = {'sharpe_ratio': sharpe, 'total_return': total_return, 'avg_return_per_trade': avg}[objective]
+        score = np.where(count >= min_trades, score, -np.inf)
+        best = int(np.argmax(score))
+
+        bounds = [from_day(origin + b * test_days).strftime('%Y-%m-%d')
+                  for b in (k - train_buckets, k, k + 1)]
+        if not np.isfinite(score[best]):
+            result.windows.append(WalkForwardWindow(bounds[0], bounds[1], bounds[1], bounds[2],
+                                                    None, 0.0, 0, 0, 0.0, 0.0))
+            continue
+
+        out = test[best, :, k]
+        oos_count, oos_return, _, oos_sharpe = _window_stats(out[:, None], horizons[best:best + 1])
+        oos_log_growth += out[3]
+        result.total_trades += int(oos_count[0])
+        result.windows.append(WalkForwardWindow(
+            train_start=bounds[0], train_end=bounds[1], test_start=bounds[1], test_end=bounds[2],
+            params=dict(configs[best]),
+            in_sample_score=float(score[best]),
+            in_sample_trades=int(count[best]),
+            out_of_sample_trades=int(oos_count[0]),
+            out_of_sample_return=float(oos_return[0]),
+            out_of_sample_sharpe=float(oos_sharpe[0]),
+        ))
+
+    result.total_return = float(np.expm1(oos_log_growth))
+    hindsight = test[:, 3, train_buckets:].sum(axis=1)
+    result.hindsight_params = dict(configs[int(np.argmax(hindsight))])
+    result.hindsight_return = float(np.expm1(hindsight.max()))
+    return result